@@ -4,7 +4,29 @@ Instantly.ai Python SDK
 
 __version__ = "0.1.0"
 
-from instantly.client import InstantlyClient
-from instantly.config import InstantlyConfig
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["InstantlyClient", "InstantlyConfig"] 
\ No newline at end of file
+if TYPE_CHECKING:
+    from instantly.async_client import AsyncInstantlyClient
+    from instantly.client import InstantlyClient
+    from instantly.config import InstantlyConfig
+
+_MODULES = {
+    "AsyncInstantlyClient": "instantly.async_client",
+    "InstantlyClient": "instantly.client",
+    "InstantlyConfig": "instantly.config",
+}
+
+__all__ = ["AsyncInstantlyClient", "InstantlyClient", "InstantlyConfig"]
+
+def __getattr__(name):
+    # Imported on first use, so `import instantly` stays cheap and loads neither client
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,38 @@
-from .account import AccountAPI
-from .campaign import CampaignAPI
-from .lead import LeadAPI
-from .email import EmailAPI
-from .email_verification import EmailVerificationAPI
-from .lead_list import LeadListAPI
-from .background_job import BackgroundJobAPI
-from .custom_tag import CustomTagAPI
-from .block_list_entry import BlockListEntryAPI
-from .lead_label import LeadLabelAPI
-from .api_key import APIKeyAPI
-from .account_campaign_mapping import AccountCampaignMappingAPI
+"""
+Instantly.ai API classes, imported lazily so that using one does not load the others
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .account import AccountAPI
+    from .campaign import CampaignAPI
+    from .lead import LeadAPI
+    from .email import EmailAPI
+    from .email_verification import EmailVerificationAPI
+    from .lead_list import LeadListAPI
+    from .background_job import BackgroundJobAPI
+    from .custom_tag import CustomTagAPI
+    from .block_list_entry import BlockListEntryAPI
+    from .lead_label import LeadLabelAPI
+    from .api_key import APIKeyAPI
+    from .account_campaign_mapping import AccountCampaignMappingAPI
+
+_MODULES = {
+    'AccountAPI': '.account',
+    'CampaignAPI': '.campaign',
+    'LeadAPI': '.lead',
+    'EmailAPI': '.email',
+    'EmailVerificationAPI': '.email_verification',
+    'LeadListAPI': '.lead_list',
+    'BackgroundJobAPI': '.background_job',
+    'CustomTagAPI': '.custom_tag',
+    'BlockListEntryAPI': '.block_list_entry',
+    'LeadLabelAPI': '.lead_label',
+    'APIKeyAPI': '.api_key',
+    'AccountCampaignMappingAPI': '.account_campaign_mapping',
+}
 
 __all__ = [
     'AccountAPI',
@@ -24,4 +47,14 @@ __all__ = [
     'LeadLabelAPI',
     'APIKeyAPI',
     'AccountCampaignMappingAPI'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
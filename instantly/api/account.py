@@ -2,11 +2,14 @@
 Account API client for the Instantly.ai API
 """
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from instantly.client import InstantlyClient
 from instantly.models.account import Account, AccountCreate, AccountUpdate
+from instantly.models.pagination import OffsetPage
+from instantly.pagination import fan_out_pages
+from instantly.parsing import ValidationMode
 
 class AccountAPI:
     """Client for the Account API endpoints."""
@@ -30,28 +33,65 @@ class AccountAPI:
         Returns:
             The account details
         """
-        response = self._client.get(f"/api/v2/accounts/{account_id}")
-        return Account.model_validate(response)
+        return self._client.get_model(f"/api/v2/accounts/{account_id}", Account)
         
-    def list_accounts(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Account]:
+    def list_accounts(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> List[Account]:
         """
         List all accounts.
         
         Args:
             limit: Maximum number of accounts to return
             offset: Number of accounts to skip
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
             
         Returns:
             List of accounts
         """
+        return self._list_accounts_page(limit, offset, validate).items
+        
+    def fetch_all_accounts(
+        self,
+        limit: int = 100,
+        concurrency: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> Iterator[Account]:
+        """
+        Fetch all accounts, requesting the pages after the first one concurrently.
+        
+        Args:
+            limit: Number of accounts to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            
+        Yields:
+            Each account, in order
+        """
+        return fan_out_pages(
+            lambda index: self._list_accounts_page(limit, index * limit, validate),
+            limit,
+            concurrency or self._client.config.concurrency,
+        )
+        
+    def _list_accounts_page(
+        self,
+        limit: Optional[int],
+        offset: Optional[int],
+        validate: Optional[ValidationMode],
+    ) -> OffsetPage[Account]:
         params = {}
         if limit is not None:
             params["limit"] = limit
         if offset is not None:
             params["offset"] = offset
             
-        response = self._client.get("/api/v2/accounts", params=params)
-        return [Account.model_validate(account) for account in response["items"]]
+        return self._client.get_model(
+            "/api/v2/accounts", OffsetPage[Account], params=params, validate=validate
+        )
         
     def create_account(self, account: AccountCreate) -> Account:
         """
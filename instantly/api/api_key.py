@@ -2,10 +2,12 @@
 API key API endpoints for Instantly.ai
 """
 
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from uuid import UUID
 
 from ..models.api_key import APIKey
+from ..models.pagination import CursorPage
+from ..pagination import iter_cursor
 from .base import BaseAPI
 
 class APIKeyAPI(BaseAPI):
@@ -55,6 +57,25 @@ class APIKeyAPI(BaseAPI):
         Returns:
             List of API keys
         """
+        return self.list_api_keys_page(workspace_id, limit, starting_after).items
+    
+    def list_api_keys_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[APIKey]:
+        """
+        List one page of API keys together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Maximum number of keys to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of API keys and its next_starting_after cursor
+        """
         params = {
             "limit": limit,
             "starting_after": starting_after,
@@ -63,7 +84,32 @@ class APIKeyAPI(BaseAPI):
         params = {k: v for k, v in params.items() if v is not None}
         
         response = self._get("/api-keys", params=params)
-        return [APIKey(**key) for key in response["items"]]
+        return CursorPage[APIKey].model_validate(response)
+    
+    def iter_api_keys(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> Iterator[APIKey]:
+        """
+        Iterate over all API keys, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Number of keys to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the API keys
+        """
+        return iter_cursor(
+            lambda cursor: self.list_api_keys_page(workspace_id, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
     
     def delete_api_key(self, key_id: str) -> None:
         """
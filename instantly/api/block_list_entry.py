@@ -2,10 +2,14 @@
 Block list entry API endpoints for Instantly.ai
 """
 
-from typing import Optional, List
+import time
+from typing import Optional, List, Iterator
 from uuid import UUID
 
+from ..block_list import BlockListIndex
 from ..models.block_list_entry import BlockListEntry
+from ..models.pagination import CursorPage
+from ..pagination import iter_cursor
 from .base import BaseAPI
 
 class BlockListEntryAPI(BaseAPI):
@@ -60,6 +64,27 @@ class BlockListEntryAPI(BaseAPI):
         Returns:
             List of block list entries
         """
+        return self.list_block_list_entries_page(workspace_id, type, limit, starting_after).items
+    
+    def list_block_list_entries_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[BlockListEntry]:
+        """
+        List one page of block list entries together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional entry type to filter by
+            limit: Maximum number of entries to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of block list entries and its next_starting_after cursor
+        """
         params = {
             "limit": limit,
             "starting_after": starting_after,
@@ -69,7 +94,34 @@ class BlockListEntryAPI(BaseAPI):
         params = {k: v for k, v in params.items() if v is not None}
         
         response = self._get("/block-lists-entries", params=params)
-        return [BlockListEntry(**entry) for entry in response["items"]]
+        return CursorPage[BlockListEntry].model_validate(response)
+    
+    def iter_block_list_entries(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> Iterator[BlockListEntry]:
+        """
+        Iterate over all block list entries, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional entry type to filter by
+            limit: Number of entries to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the block list entries
+        """
+        return iter_cursor(
+            lambda cursor: self.list_block_list_entries_page(workspace_id, type, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
     
     def get_block_list_entry(self, entry_id: str) -> BlockListEntry:
         """
@@ -117,4 +169,40 @@ class BlockListEntryAPI(BaseAPI):
         Args:
             entry_id: The ID of the block list entry to delete
         """
-        self._delete(f"/block-lists-entries/{entry_id}") 
\ No newline at end of file
+        self._delete(f"/block-lists-entries/{entry_id}")
+
+    def sync_block_list_index(
+        self,
+        index: Optional[BlockListIndex] = None,
+        full: bool = False,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100
+    ) -> BlockListIndex:
+        """
+        Build a local index of the block list, or bring an existing one up to date.
+        
+        An incremental sync lists only the entries after the last one indexed, relying on the
+        API listing entries in creation order. Changed or deleted entries are picked up by a
+        full sync, which builds a new index and swaps it in at once while lookups carry on.
+        
+        Args:
+            index: The index to update; a new one is built when omitted
+            full: Whether to list every entry again instead of only the new ones
+            workspace_id: Optional workspace ID to filter by
+            limit: Number of entries to fetch per page
+            
+        Returns:
+            The up to date index
+        """
+        if index is None:
+            index, full = BlockListIndex(), True
+        started = time.time()
+        target = BlockListIndex() if full else index
+        for entry in self.iter_block_list_entries(
+            workspace_id, limit=limit, starting_after=None if full else index.cursor
+        ):
+            target.add(entry)
+        target.synced_at = started
+        if target is not index:
+            index.replace(target)
+        return index
@@ -2,11 +2,14 @@
 Campaign API client for the Instantly.ai API
 """
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from instantly.client import InstantlyClient
 from instantly.models.campaign import Campaign, CampaignCreate, CampaignUpdate
+from instantly.models.pagination import OffsetPage
+from instantly.pagination import fan_out_pages
+from instantly.parsing import ValidationMode
 
 class CampaignAPI:
     """Client for the Campaign API endpoints."""
@@ -30,28 +33,65 @@ class CampaignAPI:
         Returns:
             The campaign details
         """
-        response = self._client.get(f"/campaigns/{campaign_id}")
-        return Campaign.model_validate(response)
+        return self._client.get_model(f"/campaigns/{campaign_id}", Campaign)
         
-    def list_campaigns(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Campaign]:
+    def list_campaigns(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> List[Campaign]:
         """
         List all campaigns.
         
         Args:
             limit: Maximum number of campaigns to return
             offset: Number of campaigns to skip
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
             
         Returns:
             List of campaigns
         """
+        return self._list_campaigns_page(limit, offset, validate).items
+        
+    def fetch_all_campaigns(
+        self,
+        limit: int = 100,
+        concurrency: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> Iterator[Campaign]:
+        """
+        Fetch all campaigns, requesting the pages after the first one concurrently.
+        
+        Args:
+            limit: Number of campaigns to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            
+        Yields:
+            Each campaign, in order
+        """
+        return fan_out_pages(
+            lambda index: self._list_campaigns_page(limit, index * limit, validate),
+            limit,
+            concurrency or self._client.config.concurrency,
+        )
+        
+    def _list_campaigns_page(
+        self,
+        limit: Optional[int],
+        offset: Optional[int],
+        validate: Optional[ValidationMode],
+    ) -> OffsetPage[Campaign]:
         params = {}
         if limit is not None:
             params["limit"] = limit
         if offset is not None:
             params["offset"] = offset
             
-        response = self._client.get("/campaigns", params=params)
-        return [Campaign.model_validate(campaign) for campaign in response["items"]]
+        return self._client.get_model(
+            "/campaigns", OffsetPage[Campaign], params=params, validate=validate
+        )
         
     def create_campaign(self, campaign: CampaignCreate) -> Campaign:
         """
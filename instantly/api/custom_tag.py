@@ -2,10 +2,12 @@
 Custom tag API endpoints for Instantly.ai
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from uuid import UUID
 
 from ..models.custom_tag import CustomTag
+from ..models.pagination import CursorPage
+from ..pagination import iter_cursor
 from .base import BaseAPI
 
 class CustomTagAPI(BaseAPI):
@@ -58,6 +60,25 @@ class CustomTagAPI(BaseAPI):
         Returns:
             List of custom tags
         """
+        return self.list_custom_tags_page(workspace_id, limit, starting_after).items
+    
+    def list_custom_tags_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[CustomTag]:
+        """
+        List one page of custom tags together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Maximum number of tags to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of custom tags and its next_starting_after cursor
+        """
         params = {
             "limit": limit,
             "starting_after": starting_after,
@@ -66,7 +87,32 @@ class CustomTagAPI(BaseAPI):
         params = {k: v for k, v in params.items() if v is not None}
         
         response = self._get("/custom-tags", params=params)
-        return [CustomTag(**tag) for tag in response["items"]]
+        return CursorPage[CustomTag].model_validate(response)
+    
+    def iter_custom_tags(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> Iterator[CustomTag]:
+        """
+        Iterate over all custom tags, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Number of tags to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the custom tags
+        """
+        return iter_cursor(
+            lambda cursor: self.list_custom_tags_page(workspace_id, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
     
     def get_custom_tag(self, tag_id: str) -> CustomTag:
         """
@@ -2,7 +2,7 @@
 Email API endpoints for Instantly.ai
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
 
 from ..client import InstantlyClient
@@ -11,6 +11,9 @@ from ..models.email import (
     EmailListResponse, UnreadCountResponse, 
     MarkAsReadResponse
 )
+from ..models.pagination import OffsetPage
+from ..parsing import ValidationMode
+from ..pagination import fan_out_pages
 
 class EmailAPI:
     """Email API endpoints."""
@@ -67,6 +70,40 @@ class EmailAPI:
         response = self._client.get("/emails", params=params)
         return EmailListResponse(**response)
 
+    def fetch_all_emails(
+        self,
+        per_page: int = 50,
+        concurrency: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> Iterator[Email]:
+        """
+        Fetch all emails, requesting the pages after the first one concurrently.
+
+        Args:
+            per_page: Number of emails to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+
+        Yields:
+            Each email, in order
+        """
+        return fan_out_pages(
+            lambda index: self._list_emails_page(index + 1, per_page, validate),
+            per_page,
+            concurrency or self._client.config.concurrency,
+        )
+
+    def _list_emails_page(
+        self,
+        page: int,
+        per_page: int,
+        validate: Optional[ValidationMode],
+    ) -> OffsetPage[Email]:
+        params = {"page": page, "per_page": per_page}
+        return self._client.get_model(
+            "/emails", OffsetPage[Email], params=params, validate=validate
+        )
+
     def get_email(self, email_id: str) -> Email:
         """
         Get a specific email by ID.
@@ -2,20 +2,35 @@
 Email Verification API endpoints for Instantly.ai
 """
 
-from typing import Dict, Any
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, Optional, Set, Union
 
+import httpx
+
+from ..cache.memory import MemoryCache
 from ..client import InstantlyClient
+from ..models.email_verification import EmailVerification, EmailVerificationFailure
+from ..verification import VerificationCache, is_pending, normalize_email, verification_failure
+
+RESULT_TTL = 7 * 24 * 3600
+"""Default seconds a verification result is reused by verify_emails()."""
 
 class EmailVerificationAPI:
     """Email Verification API endpoints."""
 
     def __init__(self, client: InstantlyClient):
         self._client = client
+        backend = client.config.cache_backend
+        self._results = backend if backend is not None else MemoryCache(100_000, 64 * 1024 * 1024)
 
     def verify_email(self, email: str) -> Dict[str, Any]:
         """
         Verify an email address.
 
+        Verifying an address again has no further effect, so the request is retried on failure.
+
         Args:
             email: The email address to verify
 
@@ -23,7 +38,7 @@ class EmailVerificationAPI:
             Dict containing verification results
         """
         data = {"email": email}
-        return self._client.post("/email-verification", json=data)
+        return self._client.post("/email-verification", json=data, retry_safe=True)
 
     def get_verification_status(self, email: str) -> Dict[str, Any]:
         """
@@ -35,4 +50,109 @@ class EmailVerificationAPI:
         Returns:
             Dict containing verification status
         """
-        return self._client.get(f"/email-verification/{email}") 
\ No newline at end of file
+        return self._client.get(f"/email-verification/{email}")
+
+    def verify_emails(
+        self,
+        emails: Iterable[str],
+        concurrency: Optional[int] = None,
+        cache_ttl: float = RESULT_TTL,
+        poll_interval: float = 5.0,
+        pending_timeout: float = 600.0,
+    ) -> Iterator[Union[EmailVerification, EmailVerificationFailure]]:
+        """
+        Verify many email addresses, yielding each result as soon as it is known.
+
+        Addresses are trimmed, lowercased and deduplicated. Those verified within cache_ttl are
+        answered from a local cache: the client's cache_backend if one is configured, so that
+        results carry over between runs, otherwise memory. The rest are verified with at most
+        concurrency requests in flight under the rate limiter, and pending verifications are
+        polled in concurrent rounds every poll_interval seconds. An address whose request fails
+        after the client's retries is yielded as a failure and the others carry on.
+
+        Args:
+            emails: The addresses to verify, read lazily
+            concurrency: Maximum number of requests in flight (defaults to the client config)
+            cache_ttl: Seconds a result is reused before the address is verified again (0 disables)
+            poll_interval: Seconds between two rounds of polling pending verifications
+            pending_timeout: Seconds after which a verification still pending is yielded as is
+
+        Yields:
+            The result or failure of each distinct address, in completion order; addresses that
+            are not of the form local@domain are skipped
+        """
+        concurrency = concurrency or self._client.config.concurrency
+        cache = VerificationCache(self._results, cache_ttl)
+        seen: Set[str] = set()
+        pending: Dict[str, float] = {}
+        in_flight: Dict[Future, str] = {}
+        last_poll = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="instantly-verify") as executor:
+            try:
+                for email in map(normalize_email, emails):
+                    if email is None or email in seen:
+                        continue
+                    seen.add(email)
+                    cached = cache.get(email)
+                    if cached is not None:
+                        yield cached
+                        continue
+                    if len(in_flight) >= concurrency:
+                        yield from self._collect(in_flight, cache, pending)
+                    in_flight[executor.submit(self.verify_email, email)] = email
+                    if pending and time.monotonic() - last_poll >= poll_interval:
+                        yield from self._poll(executor, concurrency, cache, pending, pending_timeout)
+                        last_poll = time.monotonic()
+                while in_flight:
+                    yield from self._collect(in_flight, cache, pending)
+                while pending:
+                    time.sleep(max(0.0, poll_interval - (time.monotonic() - last_poll)))
+                    yield from self._poll(executor, concurrency, cache, pending, pending_timeout)
+                    last_poll = time.monotonic()
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _collect(
+        self, in_flight: Dict[Future, str], cache: VerificationCache, pending: Dict[str, float]
+    ) -> Iterator[Union[EmailVerification, EmailVerificationFailure]]:
+        for future in wait(in_flight, return_when=FIRST_COMPLETED).done:
+            email = in_flight.pop(future)
+            try:
+                result = future.result()
+            except httpx.HTTPError as error:
+                yield verification_failure(email, error)
+                continue
+            cache.set(email, result)
+            if is_pending(result):
+                pending[email] = time.monotonic()
+            else:
+                yield EmailVerification.model_validate(result)
+
+    def _poll(
+        self,
+        executor: ThreadPoolExecutor,
+        concurrency: int,
+        cache: VerificationCache,
+        pending: Dict[str, float],
+        pending_timeout: float,
+    ) -> Iterator[Union[EmailVerification, EmailVerificationFailure]]:
+        batch = list(islice(pending, concurrency * 10))
+        now = time.monotonic()
+        futures = [executor.submit(self.get_verification_status, email) for email in batch]
+        try:
+            for email, future in zip(batch, futures):
+                submitted = pending.pop(email)
+                try:
+                    result = future.result()
+                except httpx.HTTPError as error:
+                    yield verification_failure(email, error)
+                    continue
+                cache.set(email, result)
+                if not is_pending(result) or now - submitted >= pending_timeout:
+                    yield EmailVerification.model_validate(result)
+                else:
+                    pending[email] = submitted
+        finally:
+            for future in futures:
+                future.cancel()
@@ -2,10 +2,12 @@
 Lead label API endpoints for Instantly.ai
 """
 
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from uuid import UUID
 
 from ..models.lead_label import LeadLabel
+from ..models.pagination import CursorPage
+from ..pagination import iter_cursor
 from .base import BaseAPI
 
 class LeadLabelAPI(BaseAPI):
@@ -55,6 +57,25 @@ class LeadLabelAPI(BaseAPI):
         Returns:
             List of lead labels
         """
+        return self.list_lead_labels_page(workspace_id, limit, starting_after).items
+    
+    def list_lead_labels_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[LeadLabel]:
+        """
+        List one page of lead labels together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Maximum number of labels to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of lead labels and its next_starting_after cursor
+        """
         params = {
             "limit": limit,
             "starting_after": starting_after,
@@ -63,7 +84,32 @@ class LeadLabelAPI(BaseAPI):
         params = {k: v for k, v in params.items() if v is not None}
         
         response = self._get("/lead-labels", params=params)
-        return [LeadLabel(**label) for label in response["items"]]
+        return CursorPage[LeadLabel].model_validate(response)
+    
+    def iter_lead_labels(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> Iterator[LeadLabel]:
+        """
+        Iterate over all lead labels, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Number of labels to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the lead labels
+        """
+        return iter_cursor(
+            lambda cursor: self.list_lead_labels_page(workspace_id, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
     
     def get_lead_label(self, label_id: str) -> LeadLabel:
         """
@@ -2,9 +2,11 @@
 Lead List API endpoints for Instantly.ai
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 
 from ..client import InstantlyClient
+from ..models.pagination import OffsetPage
+from ..pagination import fan_out_pages
 
 class LeadListAPI:
     """Lead List API endpoints."""
@@ -42,6 +44,31 @@ class LeadListAPI:
         params = {"page": page, "per_page": per_page}
         return self._client.get("/lead-lists", params=params)
 
+    def fetch_all_lists(
+        self,
+        per_page: int = 50,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch all lead lists, requesting the pages after the first one concurrently.
+
+        Args:
+            per_page: Number of lists to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+
+        Yields:
+            Dict containing the details of each list, in order
+        """
+        return fan_out_pages(
+            lambda index: self._list_lists_page(index + 1, per_page),
+            per_page,
+            concurrency or self._client.config.concurrency,
+        )
+
+    def _list_lists_page(self, page: int, per_page: int) -> OffsetPage[Dict[str, Any]]:
+        response = self.list_lists(page, per_page)
+        return OffsetPage[Dict[str, Any]].model_validate(response)
+
     def get_list(self, list_id: str) -> Dict[str, Any]:
         """
         Get a specific lead list by ID.
@@ -0,0 +1,60 @@
+"""
+Instantly.ai asynchronous API classes, imported lazily so that using one does not load the others
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .account import AsyncAccountAPI
+    from .campaign import AsyncCampaignAPI
+    from .lead import AsyncLeadAPI
+    from .email import AsyncEmailAPI
+    from .email_verification import AsyncEmailVerificationAPI
+    from .lead_list import AsyncLeadListAPI
+    from .background_job import AsyncBackgroundJobAPI
+    from .custom_tag import AsyncCustomTagAPI
+    from .block_list_entry import AsyncBlockListEntryAPI
+    from .lead_label import AsyncLeadLabelAPI
+    from .api_key import AsyncAPIKeyAPI
+    from .account_campaign_mapping import AsyncAccountCampaignMappingAPI
+
+_MODULES = {
+    'AsyncAccountAPI': '.account',
+    'AsyncCampaignAPI': '.campaign',
+    'AsyncLeadAPI': '.lead',
+    'AsyncEmailAPI': '.email',
+    'AsyncEmailVerificationAPI': '.email_verification',
+    'AsyncLeadListAPI': '.lead_list',
+    'AsyncBackgroundJobAPI': '.background_job',
+    'AsyncCustomTagAPI': '.custom_tag',
+    'AsyncBlockListEntryAPI': '.block_list_entry',
+    'AsyncLeadLabelAPI': '.lead_label',
+    'AsyncAPIKeyAPI': '.api_key',
+    'AsyncAccountCampaignMappingAPI': '.account_campaign_mapping',
+}
+
+__all__ = [
+    'AsyncAccountAPI',
+    'AsyncCampaignAPI',
+    'AsyncLeadAPI',
+    'AsyncEmailAPI',
+    'AsyncEmailVerificationAPI',
+    'AsyncLeadListAPI',
+    'AsyncBackgroundJobAPI',
+    'AsyncCustomTagAPI',
+    'AsyncBlockListEntryAPI',
+    'AsyncLeadLabelAPI',
+    'AsyncAPIKeyAPI',
+    'AsyncAccountCampaignMappingAPI'
+]
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,134 @@
+"""
+Asynchronous Account API client for the Instantly.ai API
+"""
+
+from typing import List, Optional, AsyncIterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from instantly.async_client import AsyncInstantlyClient
+from instantly.models.account import Account, AccountCreate, AccountUpdate
+from instantly.models.pagination import OffsetPage
+from instantly.pagination import afan_out_pages
+from instantly.parsing import ValidationMode
+
+class AsyncAccountAPI:
+    """Asynchronous client for the Account API endpoints."""
+    
+    def __init__(self, client: 'AsyncInstantlyClient'):
+        """
+        Initialize the asynchronous Account API client.
+        
+        Args:
+            client: The asynchronous Instantly.ai client
+        """
+        self._client = client
+        
+    async def get_account(self, account_id: str) -> Account:
+        """
+        Get an account by ID.
+        
+        Args:
+            account_id: The ID of the account to retrieve
+            
+        Returns:
+            The account details
+        """
+        return await self._client.get_model(f"/api/v2/accounts/{account_id}", Account)
+        
+    async def list_accounts(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> List[Account]:
+        """
+        List all accounts.
+        
+        Args:
+            limit: Maximum number of accounts to return
+            offset: Number of accounts to skip
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            
+        Returns:
+            List of accounts
+        """
+        page = await self._list_accounts_page(limit, offset, validate)
+        return page.items
+        
+    def fetch_all_accounts(
+        self,
+        limit: int = 100,
+        concurrency: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> AsyncIterator[Account]:
+        """
+        Fetch all accounts, requesting the pages after the first one concurrently.
+        
+        Args:
+            limit: Number of accounts to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            
+        Yields:
+            Each account, in order
+        """
+        return afan_out_pages(
+            lambda index: self._list_accounts_page(limit, index * limit, validate),
+            limit,
+            concurrency or self._client.config.concurrency,
+        )
+        
+    async def _list_accounts_page(
+        self,
+        limit: Optional[int],
+        offset: Optional[int],
+        validate: Optional[ValidationMode],
+    ) -> OffsetPage[Account]:
+        params = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+            
+        return await self._client.get_model(
+            "/api/v2/accounts", OffsetPage[Account], params=params, validate=validate
+        )
+        
+    async def create_account(self, account: AccountCreate) -> Account:
+        """
+        Create a new account.
+        
+        Args:
+            account: The account details to create
+            
+        Returns:
+            The created account
+        """
+        response = await self._client.post("/api/v2/accounts", json=account.model_dump(exclude_none=True, by_alias=True))
+        return Account.model_validate(response)
+        
+    async def update_account(self, account_id: str, account: AccountUpdate) -> Account:
+        """
+        Update an existing account.
+        
+        Args:
+            account_id: The ID of the account to update
+            account: The updated account details
+            
+        Returns:
+            The updated account
+        """
+        response = await self._client.put(
+            f"/api/v2/accounts/{account_id}",
+            json=account.model_dump(exclude_none=True, by_alias=True, exclude_unset=True),
+        )
+        return Account.model_validate(response)
+        
+    async def delete_account(self, account_id: str) -> None:
+        """
+        Delete an account.
+        
+        Args:
+            account_id: The ID of the account to delete
+        """
+        await self._client.delete(f"/api/v2/accounts/{account_id}") 
\ No newline at end of file
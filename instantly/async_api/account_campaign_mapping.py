@@ -0,0 +1,25 @@
+"""
+Asynchronous account campaign mapping API endpoints for Instantly.ai
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from ..models.account_campaign_mapping import AccountCampaignMapping
+from .base import AsyncBaseAPI
+
+class AsyncAccountCampaignMappingAPI(AsyncBaseAPI):
+    """Asynchronous API endpoints for account campaign mappings."""
+    
+    async def get_account_campaign_mapping(self, email: str) -> AccountCampaignMapping:
+        """
+        Get the campaign mapping for an account.
+        
+        Args:
+            email: The email address of the account
+            
+        Returns:
+            The account campaign mapping
+        """
+        response = await self._get(f"/account-campaign-mappings/{email}")
+        return AccountCampaignMapping(**response) 
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Asynchronous API key API endpoints for Instantly.ai
+"""
+
+from typing import Optional, List, AsyncIterator
+from uuid import UUID
+
+from ..models.api_key import APIKey
+from ..models.pagination import CursorPage
+from ..pagination import aiter_cursor
+from .base import AsyncBaseAPI
+
+class AsyncAPIKeyAPI(AsyncBaseAPI):
+    """Asynchronous API endpoints for API keys."""
+    
+    async def create_api_key(
+        self,
+        name: str,
+        scopes: List[str],
+        expires_at: Optional[str] = None
+    ) -> APIKey:
+        """
+        Create a new API key.
+        
+        Args:
+            name: The name of the API key
+            scopes: List of scopes this API key has access to
+            expires_at: Optional expiration date for the API key
+            
+        Returns:
+            The created API key
+        """
+        data = {
+            "name": name,
+            "scopes": scopes,
+            "expires_at": expires_at
+        }
+        data = {k: v for k, v in data.items() if v is not None}
+        
+        response = await self._post("/api-keys", json=data)
+        return APIKey(**response)
+    
+    async def list_api_keys(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> List[APIKey]:
+        """
+        List API keys.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Maximum number of keys to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            List of API keys
+        """
+        page = await self.list_api_keys_page(workspace_id, limit, starting_after)
+        return page.items
+    
+    async def list_api_keys_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[APIKey]:
+        """
+        List one page of API keys together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Maximum number of keys to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of API keys and its next_starting_after cursor
+        """
+        params = {
+            "limit": limit,
+            "starting_after": starting_after,
+            "workspace_id": str(workspace_id) if workspace_id else None
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        response = await self._get("/api-keys", params=params)
+        return CursorPage[APIKey].model_validate(response)
+    
+    def iter_api_keys(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[APIKey]:
+        """
+        Iterate over all API keys, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Number of keys to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the API keys
+        """
+        return aiter_cursor(
+            lambda cursor: self.list_api_keys_page(workspace_id, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
+    
+    async def delete_api_key(self, key_id: str) -> None:
+        """
+        Delete an API key.
+        
+        Args:
+            key_id: The ID of the API key to delete
+        """
+        await self._delete(f"/api-keys/{key_id}") 
\ No newline at end of file
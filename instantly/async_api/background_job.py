@@ -0,0 +1,303 @@
+"""
+Asynchronous background job API endpoints for Instantly.ai
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional, List, Union, AsyncIterator
+from uuid import UUID
+
+import httpx
+
+from ..jobs import TERMINAL_STATUSES, AsyncJobPoller, JobHandle, JobPolling, JobTracker
+from ..models.background_job import BackgroundJob
+from ..models.pagination import CursorPage
+from ..pagination import aiter_cursor
+from .base import AsyncBaseAPI
+
+class AsyncBackgroundJobAPI(AsyncBaseAPI):
+    """Asynchronous API endpoints for background jobs."""
+    
+    def __init__(self, client):
+        """
+        Initialize the API with a client.
+        
+        Args:
+            client: The AsyncInstantlyClient instance
+        """
+        super().__init__(client)
+        # Creation times of the unfinished jobs polled so far, telling how far to follow the job list
+        self._created: Dict[str, datetime] = {}
+        self._poller = AsyncJobPoller(self._poll_outstanding, on_start=self._keep_task)
+    
+    async def list_background_jobs(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> List[BackgroundJob]:
+        """
+        List background jobs.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional job type to filter by
+            status: Optional job status to filter by
+            limit: Maximum number of jobs to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            List of background jobs
+        """
+        page = await self.list_background_jobs_page(workspace_id, type, status, limit, starting_after)
+        return page.items
+    
+    async def list_background_jobs_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[BackgroundJob]:
+        """
+        List one page of background jobs together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional job type to filter by
+            status: Optional job status to filter by
+            limit: Maximum number of jobs to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of background jobs and its next_starting_after cursor
+        """
+        params = {
+            "limit": limit,
+            "starting_after": starting_after,
+            "workspace_id": str(workspace_id) if workspace_id else None,
+            "type": type,
+            "status": status
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        response = await self._get("/background-jobs", params=params)
+        return CursorPage[BackgroundJob].model_validate(response)
+    
+    def iter_background_jobs(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[BackgroundJob]:
+        """
+        Iterate over all background jobs, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional job type to filter by
+            status: Optional job status to filter by
+            limit: Number of jobs to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the background jobs
+        """
+        return aiter_cursor(
+            lambda cursor: self.list_background_jobs_page(workspace_id, type, status, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
+    
+    async def get_background_job(self, job_id: str) -> BackgroundJob:
+        """
+        Get a specific background job.
+        
+        Args:
+            job_id: The ID of the background job
+            
+        Returns:
+            The background job
+        """
+        response = await self._get(f"/background-jobs/{job_id}")
+        return BackgroundJob(**response)
+    
+    async def wait(
+        self,
+        job_id: str,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[BackgroundJob], None]] = None,
+        polling: Optional[JobPolling] = None
+    ) -> BackgroundJob:
+        """
+        Wait for a background job to succeed or fail, polling it at an adaptive interval.
+        
+        Args:
+            job_id: The ID of the background job
+            timeout: Seconds to wait before giving up (None waits indefinitely)
+            on_progress: Called with the job whenever its progress or status changes
+            polling: Polling intervals (defaults to JobPolling())
+            
+        Returns:
+            The job in its final state; check its status for "failed"
+            
+        Raises:
+            TimeoutError: If the job is still running after timeout seconds
+        """
+        jobs = await self.wait_all([job_id], timeout, on_progress, polling)
+        return jobs[0]
+    
+    async def wait_all(
+        self,
+        job_ids: Iterable[str],
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[BackgroundJob], None]] = None,
+        polling: Optional[JobPolling] = None
+    ) -> List[BackgroundJob]:
+        """
+        Wait for several background jobs to succeed or fail.
+        
+        Each round polls every unfinished job with as few requests as possible: pages of the job
+        list, followed down to the oldest unfinished job once every job has been seen, then
+        individual requests for jobs not found there. Rounds are spaced by the shortest delay any
+        unfinished job asks for, based on its observed progress rate.
+        
+        Args:
+            job_ids: The IDs of the background jobs
+            timeout: Seconds to wait before giving up (None waits indefinitely)
+            on_progress: Called with a job whenever its progress or status changes
+            polling: Polling intervals (defaults to JobPolling())
+            
+        Returns:
+            The jobs in their final state, in the order of job_ids
+            
+        Raises:
+            TimeoutError: If any job is still running after timeout seconds
+        """
+        policy = polling or JobPolling()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        job_ids = list(job_ids)
+        trackers = {job_id: JobTracker(policy) for job_id in job_ids}
+        while True:
+            pending = [job_id for job_id, tracker in trackers.items() if not tracker.done]
+            if not pending:
+                return [trackers[job_id].job for job_id in job_ids]
+            jobs = await self.poll(pending, policy)
+            now = time.monotonic()
+            for job_id, job in jobs.items():
+                if trackers[job_id].observe(job, now) and on_progress is not None:
+                    on_progress(job)
+            pending = [job_id for job_id in pending if not trackers[job_id].done]
+            if not pending:
+                continue
+            delay = min(trackers[job_id].delay for job_id in pending)
+            if deadline is not None:
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise TimeoutError(f"Background jobs still running: {', '.join(pending)}")
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+    
+    def track(self, job_id: str, submission: Optional[object] = None) -> JobHandle:
+        """
+        Get a handle that resolves to a background job once it succeeds or fails.
+        
+        All handles of a client are polled together by one background task.
+        
+        Args:
+            job_id: The ID of the background job
+            submission: The response of the request that started the job, kept on the handle
+            
+        Returns:
+            An awaitable resolving to the job in its final state
+        """
+        return self._poller.track(job_id, submission)
+    
+    def _keep_task(self, task: asyncio.Task) -> None:
+        tasks = self._client._background_tasks
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    
+    async def poll(
+        self, job_ids: List[str], polling: Optional[JobPolling] = None
+    ) -> Dict[str, BackgroundJob]:
+        """
+        Get the current state of several background jobs with as few requests as possible.
+        
+        The job list is scanned first. Once every job has been polled before, its pages are
+        followed as long as they hold jobs created no earlier than the oldest of them; until then
+        JobPolling.batch_pages pages are scanned. Jobs not found there are fetched one by one.
+        
+        Args:
+            job_ids: The IDs of the background jobs
+            polling: How many pages of the job list to scan for jobs not seen yet (defaults to JobPolling())
+            
+        Returns:
+            The jobs keyed by ID
+        """
+        return await self._poll_jobs(job_ids, polling or JobPolling())
+    
+    async def _poll_outstanding(self, job_ids: List[str]) -> Dict[str, Union[BackgroundJob, Exception]]:
+        return await self._poll_jobs(job_ids, self._poller.policy, keep_job_errors=True)
+    
+    async def _poll_jobs(
+        self, job_ids: List[str], policy: JobPolling, keep_job_errors: bool = False
+    ) -> Dict[str, Union[BackgroundJob, Exception]]:
+        found: Dict[str, Union[BackgroundJob, Exception]] = {}
+        if len(job_ids) == 1:
+            found[job_ids[0]] = await self._get_job(job_ids[0], keep_job_errors)
+            return self._remember(found)
+        wanted = set(job_ids)
+        created = [self._created.get(job_id) for job_id in wanted]
+        oldest = None if None in created else min(created)
+        cursor = None
+        pages = 0
+        scanning = policy.batch_pages > 0
+        while scanning:
+            page = await self.list_background_jobs_page(starting_after=cursor)
+            pages += 1
+            for job in page.items:
+                if job.id in wanted:
+                    found[job.id] = job
+                    wanted.discard(job.id)
+            if not wanted or not page.items or not page.next_starting_after:
+                break
+            if oldest is None:
+                scanning = pages < policy.batch_pages
+            else:
+                scanning = page.items[-1].timestamp_created >= oldest
+            cursor = page.next_starting_after
+        for job_id in wanted:
+            found[job_id] = await self._get_job(job_id, keep_job_errors)
+        return self._remember(found)
+    
+    def _remember(
+        self, jobs: Dict[str, Union[BackgroundJob, Exception]]
+    ) -> Dict[str, Union[BackgroundJob, Exception]]:
+        for job_id, job in jobs.items():
+            if isinstance(job, BackgroundJob) and job.status not in TERMINAL_STATUSES:
+                self._created[job_id] = job.timestamp_created
+            else:
+                self._created.pop(job_id, None)
+        return jobs
+    
+    async def _get_job(self, job_id: str, keep_error: bool) -> Union[BackgroundJob, Exception]:
+        try:
+            return await self.get_background_job(job_id)
+        except httpx.HTTPStatusError as error:
+            if not keep_error or not _concerns_job(error):
+                raise
+            return error
+
+def _concerns_job(error: httpx.HTTPStatusError) -> bool:
+    # Client errors other than rate limiting are about the job asked for, e.g. one that no longer exists
+    status = error.response.status_code
+    return 400 <= status < 500 and status != 429
@@ -0,0 +1,65 @@
+"""
+Base asynchronous API class for Instantly.ai
+"""
+
+from typing import Any, Dict, Optional
+
+class AsyncBaseAPI:
+    """Base class for all asynchronous API endpoints."""
+    
+    def __init__(self, client):
+        """
+        Initialize the API with a client.
+        
+        Args:
+            client: The AsyncInstantlyClient instance
+        """
+        self._client = client
+    
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a GET request.
+        
+        Args:
+            path: The API path
+            params: Optional query parameters
+            
+        Returns:
+            The response data
+        """
+        return await self._client.get(path, params=params)
+    
+    async def _post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a POST request.
+        
+        Args:
+            path: The API path
+            json: Optional JSON data
+            
+        Returns:
+            The response data
+        """
+        return await self._client.post(path, json=json)
+    
+    async def _patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a PATCH request.
+        
+        Args:
+            path: The API path
+            json: Optional JSON data
+            
+        Returns:
+            The response data
+        """
+        return await self._client.patch(path, json=json)
+    
+    async def _delete(self, path: str) -> None:
+        """
+        Make a DELETE request.
+        
+        Args:
+            path: The API path
+        """
+        await self._client.delete(path)
@@ -0,0 +1,209 @@
+"""
+Asynchronous block list entry API endpoints for Instantly.ai
+"""
+
+import time
+from typing import Optional, List, AsyncIterator
+from uuid import UUID
+
+from ..block_list import BlockListIndex
+from ..models.block_list_entry import BlockListEntry
+from ..models.pagination import CursorPage
+from ..pagination import aiter_cursor
+from .base import AsyncBaseAPI
+
+class AsyncBlockListEntryAPI(AsyncBaseAPI):
+    """Asynchronous API endpoints for block list entries."""
+    
+    async def create_block_list_entry(
+        self,
+        type: str,
+        value: str,
+        reason: Optional[str] = None,
+        expires_at: Optional[str] = None
+    ) -> BlockListEntry:
+        """
+        Create a new block list entry.
+        
+        Args:
+            type: The type of block list entry (email or domain)
+            value: The email or domain to block
+            reason: Optional reason for blocking
+            expires_at: Optional expiration date for the block
+            
+        Returns:
+            The created block list entry
+        """
+        data = {
+            "type": type,
+            "value": value,
+            "reason": reason,
+            "expires_at": expires_at
+        }
+        data = {k: v for k, v in data.items() if v is not None}
+        
+        response = await self._post("/block-lists-entries", json=data)
+        return BlockListEntry(**response)
+    
+    async def list_block_list_entries(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> List[BlockListEntry]:
+        """
+        List block list entries.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional entry type to filter by
+            limit: Maximum number of entries to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            List of block list entries
+        """
+        page = await self.list_block_list_entries_page(workspace_id, type, limit, starting_after)
+        return page.items
+    
+    async def list_block_list_entries_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[BlockListEntry]:
+        """
+        List one page of block list entries together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional entry type to filter by
+            limit: Maximum number of entries to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of block list entries and its next_starting_after cursor
+        """
+        params = {
+            "limit": limit,
+            "starting_after": starting_after,
+            "workspace_id": str(workspace_id) if workspace_id else None,
+            "type": type
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        response = await self._get("/block-lists-entries", params=params)
+        return CursorPage[BlockListEntry].model_validate(response)
+    
+    def iter_block_list_entries(
+        self,
+        workspace_id: Optional[UUID] = None,
+        type: Optional[str] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[BlockListEntry]:
+        """
+        Iterate over all block list entries, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            type: Optional entry type to filter by
+            limit: Number of entries to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the block list entries
+        """
+        return aiter_cursor(
+            lambda cursor: self.list_block_list_entries_page(workspace_id, type, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
+    
+    async def get_block_list_entry(self, entry_id: str) -> BlockListEntry:
+        """
+        Get a specific block list entry.
+        
+        Args:
+            entry_id: The ID of the block list entry
+            
+        Returns:
+            The block list entry
+        """
+        response = await self._get(f"/block-lists-entries/{entry_id}")
+        return BlockListEntry(**response)
+    
+    async def update_block_list_entry(
+        self,
+        entry_id: str,
+        reason: Optional[str] = None,
+        expires_at: Optional[str] = None
+    ) -> BlockListEntry:
+        """
+        Update a block list entry.
+        
+        Args:
+            entry_id: The ID of the block list entry
+            reason: Optional new reason for blocking
+            expires_at: Optional new expiration date
+            
+        Returns:
+            The updated block list entry
+        """
+        data = {
+            "reason": reason,
+            "expires_at": expires_at
+        }
+        data = {k: v for k, v in data.items() if v is not None}
+        
+        response = await self._patch(f"/block-lists-entries/{entry_id}", json=data)
+        return BlockListEntry(**response)
+    
+    async def delete_block_list_entry(self, entry_id: str) -> None:
+        """
+        Delete a block list entry.
+        
+        Args:
+            entry_id: The ID of the block list entry to delete
+        """
+        await self._delete(f"/block-lists-entries/{entry_id}")
+
+    async def sync_block_list_index(
+        self,
+        index: Optional[BlockListIndex] = None,
+        full: bool = False,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100
+    ) -> BlockListIndex:
+        """
+        Build a local index of the block list, or bring an existing one up to date.
+        
+        An incremental sync lists only the entries after the last one indexed, relying on the
+        API listing entries in creation order. Changed or deleted entries are picked up by a
+        full sync, which builds a new index and swaps it in at once while lookups carry on.
+        
+        Args:
+            index: The index to update; a new one is built when omitted
+            full: Whether to list every entry again instead of only the new ones
+            workspace_id: Optional workspace ID to filter by
+            limit: Number of entries to fetch per page
+            
+        Returns:
+            The up to date index
+        """
+        if index is None:
+            index, full = BlockListIndex(), True
+        started = time.time()
+        target = BlockListIndex() if full else index
+        async for entry in self.iter_block_list_entries(
+            workspace_id, limit=limit, starting_after=None if full else index.cursor
+        ):
+            target.add(entry)
+        target.synced_at = started
+        if target is not index:
+            index.replace(target)
+        return index
@@ -0,0 +1,205 @@
+"""
+Asynchronous Campaign API client for the Instantly.ai API
+"""
+
+from typing import List, Optional, AsyncIterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from instantly.async_client import AsyncInstantlyClient
+from instantly.models.campaign import Campaign, CampaignCreate, CampaignUpdate
+from instantly.models.pagination import OffsetPage
+from instantly.pagination import afan_out_pages
+from instantly.parsing import ValidationMode
+
+class AsyncCampaignAPI:
+    """Asynchronous client for the Campaign API endpoints."""
+    
+    def __init__(self, client: 'AsyncInstantlyClient'):
+        """
+        Initialize the asynchronous Campaign API client.
+        
+        Args:
+            client: The asynchronous Instantly.ai client
+        """
+        self._client = client
+        
+    async def get_campaign(self, campaign_id: str) -> Campaign:
+        """
+        Get a campaign by ID.
+        
+        Args:
+            campaign_id: The ID of the campaign to retrieve
+            
+        Returns:
+            The campaign details
+        """
+        return await self._client.get_model(f"/campaigns/{campaign_id}", Campaign)
+        
+    async def list_campaigns(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> List[Campaign]:
+        """
+        List all campaigns.
+        
+        Args:
+            limit: Maximum number of campaigns to return
+            offset: Number of campaigns to skip
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            
+        Returns:
+            List of campaigns
+        """
+        page = await self._list_campaigns_page(limit, offset, validate)
+        return page.items
+        
+    def fetch_all_campaigns(
+        self,
+        limit: int = 100,
+        concurrency: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> AsyncIterator[Campaign]:
+        """
+        Fetch all campaigns, requesting the pages after the first one concurrently.
+        
+        Args:
+            limit: Number of campaigns to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            
+        Yields:
+            Each campaign, in order
+        """
+        return afan_out_pages(
+            lambda index: self._list_campaigns_page(limit, index * limit, validate),
+            limit,
+            concurrency or self._client.config.concurrency,
+        )
+        
+    async def _list_campaigns_page(
+        self,
+        limit: Optional[int],
+        offset: Optional[int],
+        validate: Optional[ValidationMode],
+    ) -> OffsetPage[Campaign]:
+        params = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+            
+        return await self._client.get_model(
+            "/campaigns", OffsetPage[Campaign], params=params, validate=validate
+        )
+        
+    async def create_campaign(self, campaign: CampaignCreate) -> Campaign:
+        """
+        Create a new campaign.
+        
+        Args:
+            campaign: The campaign details to create
+            
+        Returns:
+            The created campaign
+        """
+        response = await self._client.post("/campaigns", json=campaign.model_dump(exclude_none=True, by_alias=True))
+        return Campaign.model_validate(response)
+        
+    async def update_campaign(self, campaign_id: str, campaign: CampaignUpdate) -> Campaign:
+        """
+        Update an existing campaign.
+        
+        Args:
+            campaign_id: The ID of the campaign to update
+            campaign: The updated campaign details
+            
+        Returns:
+            The updated campaign
+        """
+        response = await self._client.put(
+            f"/campaigns/{campaign_id}",
+            json=campaign.model_dump(exclude_none=True, by_alias=True, exclude_unset=True),
+        )
+        return Campaign.model_validate(response)
+        
+    async def delete_campaign(self, campaign_id: str) -> None:
+        """
+        Delete a campaign.
+        
+        Args:
+            campaign_id: The ID of the campaign to delete
+        """
+        await self._client.delete(f"/campaigns/{campaign_id}")
+        
+    async def activate_campaign(self, campaign_id: str) -> Campaign:
+        """
+        Activate a campaign.
+        
+        Args:
+            campaign_id: The ID of the campaign to activate
+            
+        Returns:
+            The activated campaign
+        """
+        response = await self._client.post(f"/campaigns/{campaign_id}/activate")
+        return Campaign.model_validate(response)
+        
+    async def pause_campaign(self, campaign_id: str) -> Campaign:
+        """
+        Pause a campaign.
+        
+        Args:
+            campaign_id: The ID of the campaign to pause
+            
+        Returns:
+            The paused campaign
+        """
+        response = await self._client.post(f"/campaigns/{campaign_id}/pause")
+        return Campaign.model_validate(response)
+        
+    async def get_campaign_analytics(self, campaign_id: str) -> dict:
+        """
+        Get analytics for a campaign.
+        
+        Args:
+            campaign_id: The ID of the campaign to get analytics for
+            
+        Returns:
+            Campaign analytics data
+        """
+        return await self._client.get(f"/campaigns/{campaign_id}/analytics")
+        
+    async def get_campaign_analytics_overview(self) -> dict:
+        """
+        Get analytics overview for all campaigns.
+        
+        Returns:
+            Campaign analytics overview data
+        """
+        return await self._client.get("/campaigns/analytics/overview")
+        
+    async def get_daily_campaign_analytics(self, campaign_id: str) -> dict:
+        """
+        Get daily analytics for a campaign.
+        
+        Args:
+            campaign_id: The ID of the campaign to get daily analytics for
+            
+        Returns:
+            Daily campaign analytics data
+        """
+        return await self._client.get(f"/campaigns/{campaign_id}/analytics/daily")
+        
+    async def get_campaign_steps_analytics(self, campaign_id: str) -> dict:
+        """
+        Get step-by-step analytics for a campaign.
+        
+        Args:
+            campaign_id: The ID of the campaign to get step analytics for
+            
+        Returns:
+            Campaign step analytics data
+        """
+        return await self._client.get(f"/campaigns/{campaign_id}/analytics/steps") 
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Asynchronous email API endpoints for Instantly.ai
+"""
+
+from typing import List, Optional, Dict, Any, AsyncIterator
+from datetime import datetime
+
+from ..async_client import AsyncInstantlyClient
+from ..models.email import (
+    EmailUpdate, Email, EmailReplyResponse, 
+    EmailListResponse, UnreadCountResponse, 
+    MarkAsReadResponse
+)
+from ..models.pagination import OffsetPage
+from ..parsing import ValidationMode
+from ..pagination import afan_out_pages
+
+class AsyncEmailAPI:
+    """Asynchronous email API endpoints."""
+
+    def __init__(self, client: AsyncInstantlyClient):
+        self._client = client
+
+    async def reply(self, thread_id: str, subject: str, body: str, to_address: str, 
+              cc_address: Optional[str] = None, bcc_address: Optional[str] = None,
+              reply_to: Optional[str] = None) -> EmailReplyResponse:
+        """
+        Reply to an email thread.
+
+        Args:
+            thread_id: The ID of the thread to reply to
+            subject: Subject line of the email
+            body: Body of the email
+            to_address: Recipient email address
+            cc_address: Optional CC email addresses (comma-separated)
+            bcc_address: Optional BCC email addresses (comma-separated)
+            reply_to: Optional reply-to email address
+
+        Returns:
+            EmailReplyResponse containing the created email details
+        """
+        data = {
+            "thread_id": thread_id,
+            "subject": subject,
+            "body": body,
+            "to_address": to_address,
+        }
+        if cc_address:
+            data["cc_address"] = cc_address
+        if bcc_address:
+            data["bcc_address"] = bcc_address
+        if reply_to:
+            data["reply_to"] = reply_to
+
+        response = await self._client.post("/emails/reply", json=data)
+        return EmailReplyResponse(**response)
+
+    async def list_emails(self, page: int = 1, per_page: int = 50) -> EmailListResponse:
+        """
+        List emails.
+
+        Args:
+            page: Page number for pagination
+            per_page: Number of items per page
+
+        Returns:
+            EmailListResponse containing list of emails and pagination info
+        """
+        params = {"page": page, "per_page": per_page}
+        response = await self._client.get("/emails", params=params)
+        return EmailListResponse(**response)
+
+    def fetch_all_emails(
+        self,
+        per_page: int = 50,
+        concurrency: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> AsyncIterator[Email]:
+        """
+        Fetch all emails, requesting the pages after the first one concurrently.
+
+        Args:
+            per_page: Number of emails to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+
+        Yields:
+            Each email, in order
+        """
+        return afan_out_pages(
+            lambda index: self._list_emails_page(index + 1, per_page, validate),
+            per_page,
+            concurrency or self._client.config.concurrency,
+        )
+
+    async def _list_emails_page(
+        self,
+        page: int,
+        per_page: int,
+        validate: Optional[ValidationMode],
+    ) -> OffsetPage[Email]:
+        params = {"page": page, "per_page": per_page}
+        return await self._client.get_model(
+            "/emails", OffsetPage[Email], params=params, validate=validate
+        )
+
+    async def get_email(self, email_id: str) -> Email:
+        """
+        Get a specific email by ID.
+
+        Args:
+            email_id: The ID of the email to retrieve
+
+        Returns:
+            Email object containing email details
+        """
+        response = await self._client.get(f"/emails/{email_id}")
+        return Email(**response)
+
+    async def update_email(self, email_id: str, data: EmailUpdate) -> Email:
+        """
+        Update an email's properties.
+
+        Args:
+            email_id: The ID of the email to update
+            data: EmailUpdate model containing the fields to update
+
+        Returns:
+            Email object containing updated email details
+        """
+        response = await self._client.patch(f"/emails/{email_id}", json=data.model_dump(exclude_none=True))
+        return Email(**response)
+
+    async def delete_email(self, email_id: str) -> None:
+        """
+        Delete an email.
+
+        Args:
+            email_id: The ID of the email to delete
+        """
+        await self._client.delete(f"/emails/{email_id}")
+
+    async def get_unread_count(self) -> UnreadCountResponse:
+        """
+        Get count of unread emails.
+
+        Returns:
+            UnreadCountResponse containing count of unread emails
+        """
+        response = await self._client.get("/emails/unread/count")
+        return UnreadCountResponse(**response)
+
+    async def mark_thread_as_read(self, thread_id: str) -> MarkAsReadResponse:
+        """
+        Mark all emails in a thread as read.
+
+        Args:
+            thread_id: The ID of the thread to mark as read
+
+        Returns:
+            MarkAsReadResponse containing success status
+        """
+        response = await self._client.post(f"/emails/threads/{thread_id}/mark-as-read")
+        return MarkAsReadResponse(**response) 
\ No newline at end of file
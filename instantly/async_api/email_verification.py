@@ -0,0 +1,168 @@
+"""
+Asynchronous email verification API endpoints for Instantly.ai
+"""
+
+import asyncio
+import time
+from itertools import islice
+from typing import Dict, Any, AsyncIterator, Iterable, List, Optional, Set, Union
+
+import httpx
+
+from ..async_client import AsyncInstantlyClient
+from ..cache.backend import acall_backend
+from ..cache.memory import MemoryCache
+from ..models.email_verification import EmailVerification, EmailVerificationFailure
+from ..verification import VerificationCache, is_pending, normalize_email, verification_failure
+
+RESULT_TTL = 7 * 24 * 3600
+"""Default seconds a verification result is reused by verify_emails()."""
+
+class AsyncEmailVerificationAPI:
+    """Asynchronous email verification API endpoints."""
+
+    def __init__(self, client: AsyncInstantlyClient):
+        self._client = client
+        backend = client.config.cache_backend
+        self._results = backend if backend is not None else MemoryCache(100_000, 64 * 1024 * 1024)
+
+    async def verify_email(self, email: str) -> Dict[str, Any]:
+        """
+        Verify an email address.
+
+        Verifying an address again has no further effect, so the request is retried on failure.
+
+        Args:
+            email: The email address to verify
+
+        Returns:
+            Dict containing verification results
+        """
+        data = {"email": email}
+        return await self._client.post("/email-verification", json=data, retry_safe=True)
+
+    async def get_verification_status(self, email: str) -> Dict[str, Any]:
+        """
+        Get the verification status of an email address.
+
+        Args:
+            email: The email address to check
+
+        Returns:
+            Dict containing verification status
+        """
+        return await self._client.get(f"/email-verification/{email}")
+
+    async def verify_emails(
+        self,
+        emails: Iterable[str],
+        concurrency: Optional[int] = None,
+        cache_ttl: float = RESULT_TTL,
+        poll_interval: float = 5.0,
+        pending_timeout: float = 600.0,
+    ) -> AsyncIterator[Union[EmailVerification, EmailVerificationFailure]]:
+        """
+        Verify many email addresses, yielding each result as soon as it is known.
+
+        Addresses are trimmed, lowercased and deduplicated. Those verified within cache_ttl are
+        answered from a local cache: the client's cache_backend if one is configured, so that
+        results carry over between runs, otherwise memory. The rest are verified with at most
+        concurrency requests in flight under the rate limiter, and pending verifications are
+        polled in concurrent rounds every poll_interval seconds. An address whose request fails
+        after the client's retries is yielded as a failure and the others carry on.
+
+        Args:
+            emails: The addresses to verify, read lazily
+            concurrency: Maximum number of requests in flight (defaults to the client config)
+            cache_ttl: Seconds a result is reused before the address is verified again (0 disables)
+            poll_interval: Seconds between two rounds of polling pending verifications
+            pending_timeout: Seconds after which a verification still pending is yielded as is
+
+        Yields:
+            The result or failure of each distinct address, in completion order; addresses that
+            are not of the form local@domain are skipped
+        """
+        concurrency = concurrency or self._client.config.concurrency
+        cache = VerificationCache(self._results, cache_ttl)
+        seen: Set[str] = set()
+        pending: Dict[str, float] = {}
+        in_flight: Dict[asyncio.Future, str] = {}
+        last_poll = time.monotonic()
+        try:
+            for email in map(normalize_email, emails):
+                if email is None or email in seen:
+                    continue
+                seen.add(email)
+                cached = await acall_backend(cache.backend, cache.get, email)
+                if cached is not None:
+                    yield cached
+                    continue
+                if len(in_flight) >= concurrency:
+                    for result in await self._collect(in_flight, cache, pending):
+                        yield result
+                in_flight[asyncio.ensure_future(self.verify_email(email))] = email
+                if pending and time.monotonic() - last_poll >= poll_interval:
+                    for result in await self._poll(concurrency, cache, pending, pending_timeout):
+                        yield result
+                    last_poll = time.monotonic()
+            while in_flight:
+                for result in await self._collect(in_flight, cache, pending):
+                    yield result
+            while pending:
+                await asyncio.sleep(max(0.0, poll_interval - (time.monotonic() - last_poll)))
+                for result in await self._poll(concurrency, cache, pending, pending_timeout):
+                    yield result
+                last_poll = time.monotonic()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def _collect(
+        self, in_flight: Dict[asyncio.Future, str], cache: VerificationCache, pending: Dict[str, float]
+    ) -> List[Union[EmailVerification, EmailVerificationFailure]]:
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        results = []
+        for task in done:
+            email = in_flight.pop(task)
+            try:
+                result = task.result()
+            except httpx.HTTPError as error:
+                results.append(verification_failure(email, error))
+                continue
+            await acall_backend(cache.backend, cache.set, email, result)
+            if is_pending(result):
+                pending[email] = time.monotonic()
+            else:
+                results.append(EmailVerification.model_validate(result))
+        return results
+
+    async def _poll(
+        self,
+        concurrency: int,
+        cache: VerificationCache,
+        pending: Dict[str, float],
+        pending_timeout: float,
+    ) -> List[Union[EmailVerification, EmailVerificationFailure]]:
+        batch = list(islice(pending, concurrency * 10))
+        now = time.monotonic()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def status(email: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_verification_status(email)
+
+        statuses = await asyncio.gather(*map(status, batch), return_exceptions=True)
+        results = []
+        for email, result in zip(batch, statuses):
+            submitted = pending.pop(email)
+            if isinstance(result, httpx.HTTPError):
+                results.append(verification_failure(email, result))
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            await acall_backend(cache.backend, cache.set, email, result)
+            if not is_pending(result) or now - submitted >= pending_timeout:
+                results.append(EmailVerification.model_validate(result))
+            else:
+                pending[email] = submitted
+        return results
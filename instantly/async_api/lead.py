@@ -0,0 +1,593 @@
+import asyncio
+import time
+from typing import Optional, List, Dict, Any, Union, AsyncIterator, Iterable, Callable, Tuple, TYPE_CHECKING
+from datetime import datetime
+from uuid import UUID
+
+import httpx
+
+if TYPE_CHECKING:
+    from ..async_client import AsyncInstantlyClient
+    from ..jobs import JobHandle
+    from ..lead_filter import LeadFilter
+    from ..lead_replica import LeadReplica
+from ..models.lead import (
+    Lead, LeadStatusSummary, LeadStatusSummarySubseq,
+    LeadCreateRequest, LeadUpdateRequest, LeadMergeRequest,
+    LeadInterestStatusRequest, LeadSubsequenceRemoveRequest,
+    LeadBulkAssignRequest, LeadMoveRequest, LeadExportRequest,
+    LeadSubsequenceMoveRequest, ListLeadsRequest,
+    BulkAssignLeadsResult, MoveLeadsResult, ExportLeadsResult,
+    CreateLeadsResult, LeadCreateFailure, LeadSyncResult
+)
+from ..models.lead_batch import LeadBatch
+from ..models.pagination import CursorPage
+from ..parsing import ValidationMode
+
+
+class AsyncLeadAPI:
+    """Asynchronous lead API endpoints for Instantly.ai"""
+
+    def __init__(self, client: "AsyncInstantlyClient"):
+        self.client = client
+
+    async def create_lead(self, data: LeadCreateRequest) -> Lead:
+        """
+        Create a new lead.
+
+        Args:
+            data: Lead creation data including required fields like email
+
+        Returns:
+            Lead object containing the created lead data
+        """
+        response = await self.client.post("/api/v2/leads", json=data.model_dump(exclude_none=True))
+        return Lead.parse_obj(response)
+
+    async def create_leads(
+        self,
+        rows: Iterable[Union[LeadCreateRequest, Dict[str, Any]]],
+        concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[CreateLeadsResult], None]] = None,
+        existing: Optional["LeadFilter"] = None,
+    ) -> CreateLeadsResult:
+        """
+        Create many leads, streaming the rows with a bounded number of requests in flight.
+
+        Rows are read from the iterable only as request slots free up, so memory stays flat for
+        inputs of any size. A row that fails validation, is rejected by the API or gets a
+        response without a lead ID is recorded as a failure and the upload carries on.
+
+        With an existing filter, rows whose email the filter reports are skipped without a
+        request, and the email of each created lead is added to it. Since the filter has false
+        positives at its error rate, a few new leads may be skipped. Every row must then target
+        the campaign and list the filter covers.
+
+        Args:
+            rows: Lead creation data, as requests or as dicts validated into LeadCreateRequest
+            concurrency: Maximum number of requests in flight (defaults to the client config)
+            on_progress: Called with the result so far after each row completes
+            existing: Filter of the leads already in the target campaign or list, from
+                build_lead_filter()
+
+        Returns:
+            The IDs of the created leads, the rows that failed and the skipped rows, with
+            throughput stats
+
+        Raises:
+            LeadScopeError: If a row targets another campaign or list than the existing filter
+                covers; no further rows are read, and its result holds the leads created before
+        """
+        from ..lead_filter import LeadScopeError
+
+        concurrency = concurrency or self.client.config.concurrency
+        result = CreateLeadsResult()
+        started = time.monotonic()
+        in_flight: Dict[asyncio.Future, Tuple[int, Any]] = {}
+
+        async def collect() -> None:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, row = in_flight.pop(task)
+                try:
+                    result.created_ids.append(task.result())
+                    if existing is not None:
+                        _add_row_email(existing, row)
+                except (httpx.HTTPError, ValueError) as error:
+                    result.failures.append(_create_failure(index, row, error))
+                result.elapsed_seconds = time.monotonic() - started
+                if on_progress is not None:
+                    on_progress(result)
+
+        try:
+            for index, row in enumerate(rows):
+                if existing is not None:
+                    _check_scope(existing, index, row, result)
+                    if _likely_exists(existing, row):
+                        result.skipped.append(index)
+                        continue
+                if len(in_flight) >= concurrency:
+                    await collect()
+                in_flight[asyncio.ensure_future(self._create_lead_id(row))] = (index, row)
+            while in_flight:
+                await collect()
+        except LeadScopeError:
+            while in_flight:
+                await collect()
+            result.elapsed_seconds = time.monotonic() - started
+            raise
+        finally:
+            for task in in_flight:
+                task.cancel()
+        result.elapsed_seconds = time.monotonic() - started
+        return result
+
+    async def _fresh_replica(
+        self, max_staleness: Optional[float], campaign: Optional[UUID], list_id: Optional[UUID]
+    ) -> Optional["LeadReplica"]:
+        replica = self.client.config.lead_replica
+        if max_staleness is None or replica is None:
+            return None
+        fresh = await asyncio.to_thread(
+            replica.synced_within, max_staleness, campaign and str(campaign), list_id and str(list_id)
+        )
+        return replica if fresh else None
+
+    async def _create_lead_id(self, row: Union[LeadCreateRequest, Dict[str, Any]]) -> str:
+        if not isinstance(row, LeadCreateRequest):
+            row = LeadCreateRequest.model_validate(row)
+        response = await self.client.post("/api/v2/leads", json=row.model_dump(exclude_none=True))
+        lead_id = response.get("id") if isinstance(response, dict) else None
+        if lead_id is None:
+            raise ValueError(f"response to creating {row.email} has no lead id")
+        return str(lead_id)
+
+    async def list_leads(
+        self,
+        params: Optional[ListLeadsRequest] = None,
+        validate: Optional[ValidationMode] = None,
+        max_staleness: Optional[float] = None,
+    ) -> List[Lead]:
+        """
+        List leads with optional filtering.
+
+        Args:
+            params: Optional filtering parameters for the leads list
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            max_staleness: Read from the client's lead_replica instead of the API when a full
+                sync covering the campaign or list started at most this many seconds ago
+
+        Returns:
+            List of Lead objects, whose source tells where they were read from
+        """
+        if params is None:
+            params = ListLeadsRequest()
+        replica = await self._fresh_replica(max_staleness, params.campaign, params.list_id)
+        if replica is not None:
+            validate = validate or self.client.config.validation
+            return await asyncio.to_thread(replica.list_leads, params, validate)
+        page = await self.list_leads_page(params, validate)
+        return page.items
+
+    async def list_leads_page(
+        self,
+        params: Optional[ListLeadsRequest] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> CursorPage[Lead]:
+        """
+        List one page of leads together with the cursor of the next page.
+
+        Args:
+            params: Optional filtering parameters for the leads list
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+
+        Returns:
+            The page of Lead objects and its next_starting_after cursor
+        """
+        if params is None:
+            params = ListLeadsRequest()
+        return await self.client.post_model(
+            "/leads/list",
+            CursorPage[Lead],
+            json=params.model_dump(exclude_none=True),
+            retry_safe=True,
+            validate=validate,
+        )
+
+    def iter_leads(
+        self,
+        params: Optional[ListLeadsRequest] = None,
+        prefetch: Optional[int] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> AsyncIterator[Lead]:
+        """
+        Iterate over all leads matching the filters, fetching further pages lazily.
+
+        Args:
+            params: Optional filtering parameters; starting_after sets where to start
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+
+        Yields:
+            Each matching Lead object
+        """
+        from ..pagination import aiter_cursor
+
+        if params is None:
+            params = ListLeadsRequest()
+        return aiter_cursor(
+            lambda cursor: self.list_leads_page(
+                params.model_copy(update={"starting_after": cursor}), validate
+            ),
+            params.starting_after,
+            prefetch=self.client.config.prefetch_pages if prefetch is None else prefetch,
+        )
+
+    def iter_lead_pages(
+        self,
+        params: Optional[ListLeadsRequest] = None,
+        prefetch: Optional[int] = None,
+    ) -> AsyncIterator[CursorPage[Dict[str, Any]]]:
+        """
+        Iterate over the raw pages of leads matching the filters, without building Lead models.
+
+        Args:
+            params: Optional filtering parameters; starting_after sets where to start
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+
+        Yields:
+            Each page, with its leads as objects decoded from the API's JSON
+        """
+        from ..pagination import aiter_cursor_pages, aprefetched
+
+        if params is None:
+            params = ListLeadsRequest()
+        if prefetch is None:
+            prefetch = self.client.config.prefetch_pages
+        pages = aiter_cursor_pages(
+            lambda cursor: self.client.post_model(
+                "/leads/list",
+                CursorPage[Dict[str, Any]],
+                json=params.model_copy(update={"starting_after": cursor}).model_dump(exclude_none=True),
+                retry_safe=True,
+            ),
+            params.starting_after,
+        )
+        return aprefetched(pages, prefetch) if prefetch > 0 else pages
+
+    async def fetch_lead_batch(
+        self,
+        params: Optional[ListLeadsRequest] = None,
+        prefetch: Optional[int] = None,
+    ) -> LeadBatch:
+        """
+        Fetch all leads matching the filters into a memory-compact LeadBatch.
+
+        Args:
+            params: Optional filtering parameters; starting_after sets where to start
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+
+        Returns:
+            The leads, stored column by column
+        """
+        batch = LeadBatch()
+        async for page in self.iter_lead_pages(params, prefetch):
+            batch.extend(page.items)
+        return batch
+
+    async def build_lead_filter(
+        self,
+        campaign: Optional[str] = None,
+        list_id: Optional[str] = None,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        prefetch: Optional[int] = None,
+    ) -> "LeadFilter":
+        """
+        Build a filter of the emails of the leads in a campaign or list, for create_leads().
+
+        The leads are scanned as raw pages, without building Lead models. Save the filter with
+        LeadFilter.save() to reuse it across imports; create_leads() keeps it up to date.
+
+        Args:
+            campaign: ID of the campaign to scan
+            list_id: ID of the lead list to scan
+            capacity: Number of leads the filter is sized for
+            error_rate: False positive rate at capacity
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+
+        Returns:
+            The filter of the scanned leads
+        """
+        from ..lead_filter import LeadFilter
+
+        lead_filter = LeadFilter(capacity, error_rate, campaign=campaign, list_id=list_id)
+        params = ListLeadsRequest(campaign=campaign, list_id=list_id)
+        async for page in self.iter_lead_pages(params, prefetch):
+            for lead in page.items:
+                email = lead.get("email")
+                if email:
+                    lead_filter.add(email)
+        return lead_filter
+
+    async def sync_leads(
+        self,
+        replica: "LeadReplica",
+        campaign: Optional[str] = None,
+        list_id: Optional[str] = None,
+        full: bool = False,
+        prefetch: Optional[int] = None,
+    ) -> LeadSyncResult:
+        """
+        Bring a local replica of the leads of a campaign, list or workspace up to date.
+
+        The list endpoint cannot filter on timestamp_updated, so every lead in scope is still
+        listed, as raw pages. Only the leads updated since the scope's high-water mark are
+        compared with the replica and upserted, one transaction per page. The first sync of a
+        scope is always full.
+
+        Args:
+            replica: The replica to update
+            campaign: ID of the campaign to sync
+            list_id: ID of the lead list to sync
+            full: Whether to compare every lead and delete those no longer listed
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+
+        Returns:
+            The IDs of the inserted, updated and deleted leads
+        """
+        run = await asyncio.to_thread(replica.start_sync, campaign, list_id, full)
+        async for page in self.iter_lead_pages(ListLeadsRequest(campaign=campaign, list_id=list_id), prefetch):
+            await asyncio.to_thread(run.apply, page.items)
+        return await asyncio.to_thread(run.finish)
+
+    async def get_lead(self, lead_id: str, max_staleness: Optional[float] = None) -> Lead:
+        """
+        Get a specific lead by ID.
+
+        Args:
+            lead_id: The unique identifier of the lead
+            max_staleness: Read from the client's lead_replica instead of the API when it holds
+                the lead and a full sync covering its campaign or list started at most this
+                many seconds ago
+
+        Returns:
+            Lead object containing the lead data, whose source tells where it was read from
+        """
+        replica = self.client.config.lead_replica
+        if max_staleness is not None and replica is not None:
+            lead = await asyncio.to_thread(replica.get_lead, lead_id)
+            if lead is not None and await asyncio.to_thread(
+                replica.synced_within,
+                max_staleness,
+                lead.campaign and str(lead.campaign),
+                lead.list_id and str(lead.list_id),
+            ):
+                return lead
+        response = await self.client.get(f"/api/v2/leads/{lead_id}")
+        return Lead.parse_obj(response)
+
+    async def update_lead(self, lead_id: str, data: LeadUpdateRequest) -> Lead:
+        """
+        Update a lead's information.
+
+        Args:
+            lead_id: The unique identifier of the lead
+            data: The updated lead data
+
+        Returns:
+            Lead object containing the updated lead data
+        """
+        response = await self.client.patch(f"/api/v2/leads/{lead_id}", json=data.model_dump(exclude_none=True))
+        return Lead.parse_obj(response)
+
+    async def delete_lead(self, lead_id: str) -> None:
+        """
+        Delete a lead.
+
+        Args:
+            lead_id: The unique identifier of the lead to delete
+        """
+        await self.client.delete(f"/api/v2/leads/{lead_id}")
+
+    async def merge_leads(self, data: LeadMergeRequest) -> Lead:
+        """
+        Merge two leads, keeping the primary lead's data.
+
+        Args:
+            data: The merge request data containing primary and secondary lead IDs
+
+        Returns:
+            Lead object containing the merged lead data
+        """
+        response = await self.client.post("/api/v2/leads/merge", json=data.model_dump(exclude_none=True))
+        return Lead.parse_obj(response)
+
+    async def update_interest_status(self, data: LeadInterestStatusRequest) -> Lead:
+        """
+        Update the interest status of a lead.
+
+        Args:
+            data: The interest status update request data
+
+        Returns:
+            Lead object containing the updated lead data
+        """
+        response = await self.client.post("/api/v2/leads/update-interest-status", json=data.model_dump(exclude_none=True))
+        return Lead.parse_obj(response)
+
+    async def remove_from_subsequence(self, data: LeadSubsequenceRemoveRequest) -> Lead:
+        """
+        Remove a lead from a subsequence.
+
+        Args:
+            data: The subsequence removal request data
+
+        Returns:
+            Lead object containing the updated lead data
+        """
+        response = await self.client.post("/api/v2/leads/subsequence/remove", json=data.model_dump(exclude_none=True))
+        return Lead.parse_obj(response)
+
+    async def bulk_assign_leads(
+        self, data: LeadBulkAssignRequest, chunk_size: Optional[int] = None
+    ) -> BulkAssignLeadsResult:
+        """
+        Bulk assign leads to organization users.
+
+        Lead ID lists longer than chunk_size are split into requests sent concurrently under the
+        rate limiter, and their results merged.
+
+        Args:
+            data: The bulk assignment request data
+            chunk_size: Maximum number of lead IDs per request (defaults to the client config)
+
+        Returns:
+            Dict containing the assignment results
+        """
+        from ..bulk import chunked, adispatch_chunks
+
+        results = await adispatch_chunks(
+            lambda lead_ids: self._bulk_assign_leads(data.model_copy(update={"lead_ids": lead_ids})),
+            chunked(data.lead_ids, chunk_size or self.client.config.bulk_chunk_size),
+            self.client.config.concurrency,
+        )
+        return BulkAssignLeadsResult.merge(results)
+
+    async def _bulk_assign_leads(self, data: LeadBulkAssignRequest) -> BulkAssignLeadsResult:
+        response = await self.client.post("/api/v2/leads/bulk-assign", json=data.model_dump(exclude_none=True))
+        return BulkAssignLeadsResult.model_validate(response)
+
+    async def move_leads(
+        self, data: LeadMoveRequest, chunk_size: Optional[int] = None, as_handle: bool = False
+    ) -> Union[MoveLeadsResult, List["JobHandle"]]:
+        """
+        Move leads to a campaign or list.
+
+        When data.ids is longer than chunk_size (and no limit is set), the IDs minus
+        excluded_ids are split into requests sent concurrently under the rate limiter, each
+        starting its own background job, and the jobs are merged into one result.
+
+        Args:
+            data: The move request data
+            chunk_size: Maximum number of lead IDs per request (defaults to the client config)
+            as_handle: Return awaitable JobHandles resolving to the finished background jobs instead,
+                one per request
+
+        Returns:
+            The background job of the move, whose job_ids list the job of every request
+        """
+        results = await self._submit_move(data, chunk_size)
+        if as_handle:
+            jobs = self.client.background_jobs
+            return [jobs.track(result.id, result) for result in results]
+        return MoveLeadsResult.merge(results)
+
+    async def _submit_move(self, data: LeadMoveRequest, chunk_size: Optional[int]) -> List[MoveLeadsResult]:
+        from ..bulk import chunked, adispatch_chunks
+
+        size = chunk_size or self.client.config.bulk_chunk_size
+        if not data.ids or len(data.ids) <= size or data.limit is not None:
+            return [await self._move_leads(data)]
+        excluded = set(data.excluded_ids or ())
+        ids = [lead_id for lead_id in data.ids if lead_id not in excluded]
+        if len(ids) <= size:
+            return [await self._move_leads(data)]
+        return await adispatch_chunks(
+            lambda chunk: self._move_leads(data.model_copy(update={"ids": chunk, "excluded_ids": None})),
+            chunked(ids, size),
+            self.client.config.concurrency,
+        )
+
+    async def _move_leads(self, data: LeadMoveRequest) -> MoveLeadsResult:
+        response = await self.client.post("/api/v2/leads/move", json=data.model_dump(exclude_none=True))
+        return MoveLeadsResult.model_validate(response)
+
+    async def export_leads(
+        self, data: LeadExportRequest, chunk_size: Optional[int] = None, as_handle: bool = False
+    ) -> Union[ExportLeadsResult, List["JobHandle"]]:
+        """
+        Export leads to an external app.
+
+        Lead ID lists longer than chunk_size are split into requests sent concurrently under the
+        rate limiter, and their results merged.
+
+        Args:
+            data: The export request data
+            chunk_size: Maximum number of lead IDs per request (defaults to the client config)
+            as_handle: Return awaitable JobHandles resolving to the finished background jobs instead,
+                one per request that started a job (none if the export completed immediately)
+
+        Returns:
+            Dict containing the export results
+        """
+        from ..bulk import chunked, adispatch_chunks
+
+        results = await adispatch_chunks(
+            lambda lead_ids: self._export_leads(data.model_copy(update={"lead_ids": lead_ids})),
+            chunked(data.lead_ids, chunk_size or self.client.config.bulk_chunk_size),
+            self.client.config.concurrency,
+        )
+        if as_handle:
+            jobs = self.client.background_jobs
+            return [jobs.track(result.job_id, result) for result in results if result.job_id]
+        return ExportLeadsResult.merge(results)
+
+    async def _export_leads(self, data: LeadExportRequest) -> ExportLeadsResult:
+        response = await self.client.post("/api/v2/leads/export", json=data.model_dump(exclude_none=True))
+        return ExportLeadsResult.model_validate(response)
+
+    async def move_to_subsequence(self, data: LeadSubsequenceMoveRequest) -> Lead:
+        """
+        Move a lead to a subsequence.
+
+        Args:
+            data: The subsequence move request data
+
+        Returns:
+            Lead object containing the updated lead data
+        """
+        response = await self.client.post("/api/v2/leads/subsequence/move", json=data.model_dump(exclude_none=True))
+        return Lead.parse_obj(response) 
+
+
+def _create_failure(index: int, row: Any, error: Exception) -> LeadCreateFailure:
+    status_code = error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None
+    return LeadCreateFailure.model_construct(
+        index=index, row=row, error=str(error), status_code=status_code
+    )
+
+def _row_email(row: Any) -> Optional[str]:
+    if isinstance(row, LeadCreateRequest):
+        return row.email
+    email = row.get("email") if isinstance(row, dict) else None
+    return email if isinstance(email, str) else None
+
+def _check_scope(existing: "LeadFilter", index: int, row: Any, result: CreateLeadsResult) -> None:
+    if isinstance(row, LeadCreateRequest):
+        campaign, list_id = row.campaign, row.list_id
+    elif isinstance(row, dict):
+        campaign, list_id = row.get("campaign"), row.get("list_id")
+    else:
+        return
+    if (_scope_id(campaign), _scope_id(list_id)) != (_scope_id(existing.campaign), _scope_id(existing.list_id)):
+        from ..lead_filter import LeadScopeError
+
+        raise LeadScopeError(
+            f"row {index} targets campaign {campaign} and list {list_id}, but the existing filter "
+            f"covers campaign {existing.campaign} and list {existing.list_id}",
+            index,
+            result,
+        )
+
+def _scope_id(value: Any) -> Optional[str]:
+    return str(value).lower() if value is not None else None
+
+def _likely_exists(existing: "LeadFilter", row: Any) -> bool:
+    email = _row_email(row)
+    return email is not None and email in existing
+
+def _add_row_email(existing: "LeadFilter", row: Any) -> None:
+    email = _row_email(row)
+    if email is not None:
+        existing.add(email)
@@ -0,0 +1,164 @@
+"""
+Asynchronous lead label API endpoints for Instantly.ai
+"""
+
+from typing import Optional, List, AsyncIterator
+from uuid import UUID
+
+from ..models.lead_label import LeadLabel
+from ..models.pagination import CursorPage
+from ..pagination import aiter_cursor
+from .base import AsyncBaseAPI
+
+class AsyncLeadLabelAPI(AsyncBaseAPI):
+    """Asynchronous API endpoints for lead labels."""
+    
+    async def create_lead_label(
+        self,
+        name: str,
+        color: str,
+        description: Optional[str] = None
+    ) -> LeadLabel:
+        """
+        Create a new lead label.
+        
+        Args:
+            name: The name of the label
+            color: The color of the label in hex format
+            description: Optional description of the label
+            
+        Returns:
+            The created lead label
+        """
+        data = {
+            "name": name,
+            "color": color,
+            "description": description
+        }
+        data = {k: v for k, v in data.items() if v is not None}
+        
+        response = await self._post("/lead-labels", json=data)
+        return LeadLabel(**response)
+    
+    async def list_lead_labels(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> List[LeadLabel]:
+        """
+        List lead labels.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Maximum number of labels to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            List of lead labels
+        """
+        page = await self.list_lead_labels_page(workspace_id, limit, starting_after)
+        return page.items
+    
+    async def list_lead_labels_page(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CursorPage[LeadLabel]:
+        """
+        List one page of lead labels together with the cursor of the next page.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Maximum number of labels to return
+            starting_after: Cursor for pagination
+            
+        Returns:
+            The page of lead labels and its next_starting_after cursor
+        """
+        params = {
+            "limit": limit,
+            "starting_after": starting_after,
+            "workspace_id": str(workspace_id) if workspace_id else None
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        response = await self._get("/lead-labels", params=params)
+        return CursorPage[LeadLabel].model_validate(response)
+    
+    def iter_lead_labels(
+        self,
+        workspace_id: Optional[UUID] = None,
+        limit: int = 100,
+        starting_after: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[LeadLabel]:
+        """
+        Iterate over all lead labels, fetching further pages lazily.
+        
+        Args:
+            workspace_id: Optional workspace ID to filter by
+            limit: Number of labels to fetch per page
+            starting_after: Cursor to start after
+            prefetch: Pages to fetch ahead in the background (defaults to the client config)
+            
+        Yields:
+            Each of the lead labels
+        """
+        return aiter_cursor(
+            lambda cursor: self.list_lead_labels_page(workspace_id, limit, cursor),
+            starting_after,
+            prefetch=self._client.config.prefetch_pages if prefetch is None else prefetch,
+        )
+    
+    async def get_lead_label(self, label_id: str) -> LeadLabel:
+        """
+        Get a specific lead label.
+        
+        Args:
+            label_id: The ID of the lead label
+            
+        Returns:
+            The lead label
+        """
+        response = await self._get(f"/lead-labels/{label_id}")
+        return LeadLabel(**response)
+    
+    async def update_lead_label(
+        self,
+        label_id: str,
+        name: Optional[str] = None,
+        color: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> LeadLabel:
+        """
+        Update a lead label.
+        
+        Args:
+            label_id: The ID of the lead label
+            name: Optional new name for the label
+            color: Optional new color for the label
+            description: Optional new description for the label
+            
+        Returns:
+            The updated lead label
+        """
+        data = {
+            "name": name,
+            "color": color,
+            "description": description
+        }
+        data = {k: v for k, v in data.items() if v is not None}
+        
+        response = await self._patch(f"/lead-labels/{label_id}", json=data)
+        return LeadLabel(**response)
+    
+    async def delete_lead_label(self, label_id: str) -> None:
+        """
+        Delete a lead label.
+        
+        Args:
+            label_id: The ID of the lead label to delete
+        """
+        await self._delete(f"/lead-labels/{label_id}") 
\ No newline at end of file
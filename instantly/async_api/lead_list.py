@@ -0,0 +1,114 @@
+"""
+Asynchronous lead list API endpoints for Instantly.ai
+"""
+
+from typing import Dict, Any, List, Optional, AsyncIterator
+
+from ..async_client import AsyncInstantlyClient
+from ..models.pagination import OffsetPage
+from ..pagination import afan_out_pages
+
+class AsyncLeadListAPI:
+    """Asynchronous lead list API endpoints."""
+
+    def __init__(self, client: AsyncInstantlyClient):
+        self._client = client
+
+    async def create_list(self, name: str, description: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create a new lead list.
+
+        Args:
+            name: Name of the list
+            description: Optional description of the list
+
+        Returns:
+            Dict containing the created list details
+        """
+        data = {"name": name}
+        if description:
+            data["description"] = description
+        return await self._client.post("/lead-lists", json=data)
+
+    async def list_lists(self, page: int = 1, per_page: int = 50) -> Dict[str, Any]:
+        """
+        List all lead lists.
+
+        Args:
+            page: Page number for pagination
+            per_page: Number of items per page
+
+        Returns:
+            Dict containing list of lead lists and pagination info
+        """
+        params = {"page": page, "per_page": per_page}
+        return await self._client.get("/lead-lists", params=params)
+
+    def fetch_all_lists(
+        self,
+        per_page: int = 50,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch all lead lists, requesting the pages after the first one concurrently.
+
+        Args:
+            per_page: Number of lists to fetch per page
+            concurrency: Maximum number of pages in flight (defaults to the client config)
+
+        Yields:
+            Dict containing the details of each list, in order
+        """
+        return afan_out_pages(
+            lambda index: self._list_lists_page(index + 1, per_page),
+            per_page,
+            concurrency or self._client.config.concurrency,
+        )
+
+    async def _list_lists_page(self, page: int, per_page: int) -> OffsetPage[Dict[str, Any]]:
+        response = await self.list_lists(page, per_page)
+        return OffsetPage[Dict[str, Any]].model_validate(response)
+
+    async def get_list(self, list_id: str) -> Dict[str, Any]:
+        """
+        Get a specific lead list by ID.
+
+        Args:
+            list_id: The ID of the list to retrieve
+
+        Returns:
+            Dict containing list details
+        """
+        return await self._client.get(f"/lead-lists/{list_id}")
+
+    async def update_list(self, list_id: str, name: Optional[str] = None, 
+                   description: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Update a lead list's properties.
+
+        Args:
+            list_id: The ID of the list to update
+            name: Optional new name for the list
+            description: Optional new description for the list
+
+        Returns:
+            Dict containing updated list details
+        """
+        data = {}
+        if name is not None:
+            data["name"] = name
+        if description is not None:
+            data["description"] = description
+        return await self._client.patch(f"/lead-lists/{list_id}", json=data)
+
+    async def delete_list(self, list_id: str) -> Dict[str, Any]:
+        """
+        Delete a lead list.
+
+        Args:
+            list_id: The ID of the list to delete
+
+        Returns:
+            Dict containing success status
+        """
+        return await self._client.delete(f"/lead-lists/{list_id}") 
\ No newline at end of file
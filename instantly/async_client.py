@@ -0,0 +1,351 @@
+"""
+Asynchronous client for interacting with the Instantly.ai API
+"""
+
+import asyncio
+import threading
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Type, TypeVar
+
+import httpx
+from pydantic_core import from_json
+
+from instantly.cache.backend import acall_backend
+from instantly.cache.response import ResponseCache, cache_namespace, shallow_copy
+from instantly.config import InstantlyConfig
+from instantly.parsing import ValidationMode, validate_json
+from instantly.rate_limit import RateLimiter
+from instantly.singleflight import AsyncSingleFlight
+
+if TYPE_CHECKING:
+    from instantly.async_api.account import AsyncAccountAPI
+    from instantly.async_api.campaign import AsyncCampaignAPI
+    from instantly.async_api.lead import AsyncLeadAPI
+    from instantly.async_api.email import AsyncEmailAPI
+    from instantly.async_api.email_verification import AsyncEmailVerificationAPI
+    from instantly.async_api.lead_list import AsyncLeadListAPI
+    from instantly.async_api.background_job import AsyncBackgroundJobAPI
+    from instantly.async_api.custom_tag import AsyncCustomTagAPI
+    from instantly.async_api.block_list_entry import AsyncBlockListEntryAPI
+    from instantly.async_api.lead_label import AsyncLeadLabelAPI
+    from instantly.async_api.api_key import AsyncAPIKeyAPI
+    from instantly.async_api.account_campaign_mapping import AsyncAccountCampaignMappingAPI
+
+T = TypeVar("T")
+
+API_NAMESPACES: Dict[str, Tuple[str, str]] = {
+    "accounts": ("instantly.async_api.account", "AsyncAccountAPI"),
+    "campaigns": ("instantly.async_api.campaign", "AsyncCampaignAPI"),
+    "leads": ("instantly.async_api.lead", "AsyncLeadAPI"),
+    "emails": ("instantly.async_api.email", "AsyncEmailAPI"),
+    "email_verification": ("instantly.async_api.email_verification", "AsyncEmailVerificationAPI"),
+    "lead_lists": ("instantly.async_api.lead_list", "AsyncLeadListAPI"),
+    "background_jobs": ("instantly.async_api.background_job", "AsyncBackgroundJobAPI"),
+    "custom_tags": ("instantly.async_api.custom_tag", "AsyncCustomTagAPI"),
+    "block_list_entries": ("instantly.async_api.block_list_entry", "AsyncBlockListEntryAPI"),
+    "lead_labels": ("instantly.async_api.lead_label", "AsyncLeadLabelAPI"),
+    "api_keys": ("instantly.async_api.api_key", "AsyncAPIKeyAPI"),
+    "account_campaign_mappings": ("instantly.async_api.account_campaign_mapping", "AsyncAccountCampaignMappingAPI"),
+}
+"""API namespaces of the client, created on first access: attribute -> (module, class)."""
+
+class AsyncInstantlyClient:
+    """Asynchronous client for interacting with the Instantly.ai API."""
+
+    if TYPE_CHECKING:
+        accounts: "AsyncAccountAPI"
+        campaigns: "AsyncCampaignAPI"
+        leads: "AsyncLeadAPI"
+        emails: "AsyncEmailAPI"
+        email_verification: "AsyncEmailVerificationAPI"
+        lead_lists: "AsyncLeadListAPI"
+        background_jobs: "AsyncBackgroundJobAPI"
+        custom_tags: "AsyncCustomTagAPI"
+        block_list_entries: "AsyncBlockListEntryAPI"
+        lead_labels: "AsyncLeadLabelAPI"
+        api_keys: "AsyncAPIKeyAPI"
+        account_campaign_mappings: "AsyncAccountCampaignMappingAPI"
+
+    def __init__(self, config: InstantlyConfig):
+        """
+        Initialize the asynchronous Instantly.ai client.
+
+        Args:
+            config: The configuration for the client
+        """
+        self.config = config
+        self._client = httpx.AsyncClient(
+            base_url=config.base_url,
+            headers=config.headers,
+            timeout=config.timeout,
+        )
+        self._rate_limiter = RateLimiter(config.rate_limit, config.rate_limit_groups)
+        self._response_cache = (
+            ResponseCache(
+                config.cache,
+                config.cache_backend,
+                cache_namespace(config.base_url, config.api_key.get_secret_value()),
+            )
+            if config.cache
+            else None
+        )
+        self._flights = AsyncSingleFlight()
+        self._api_lock = threading.Lock()
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        """Create API namespaces such as `leads` on first access, importing only their modules."""
+        try:
+            module, class_name = API_NAMESPACES[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        with self._api_lock:
+            api = self.__dict__.get(name)
+            if api is None:
+                api = getattr(import_module(module), class_name)(self)
+                setattr(self, name, api)
+        return api
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(API_NAMESPACES))
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the Instantly.ai API.
+
+        Args:
+            method: The HTTP method to use
+            endpoint: The API endpoint to call
+            params: Query parameters
+            json: JSON body for POST/PUT requests
+            retry_safe: Whether a non-idempotent request may be repeated on failure
+
+        Returns:
+            The JSON response from the API
+
+        Raises:
+            httpx.HTTPError: If the request fails after all retries
+        """
+        if method == "GET":
+            return from_json(await self._get_content(endpoint, params))
+        response = await self._send(method, endpoint, params=params, json=json, retry_safe=retry_safe)
+        return response.json()
+
+    async def _request_model(
+        self,
+        method: str,
+        endpoint: str,
+        model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+        validate: Optional[ValidationMode] = None,
+    ) -> T:
+        """
+        Make a request and validate the raw response body straight into a model.
+
+        Args:
+            method: The HTTP method to use
+            endpoint: The API endpoint to call
+            model: The model or type the response body is validated into
+            params: Query parameters
+            json: JSON body for POST/PUT requests
+            retry_safe: Whether a non-idempotent request may be repeated on failure
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+
+        Returns:
+            The validated response
+        """
+        mode = validate or self.config.validation
+        sample_every = self.config.validation_sample_every
+        if method == "GET":
+            return await self._flights.do(
+                ("GET", ResponseCache.key(endpoint, params), model, mode, sample_every),
+                lambda: self._get_model(endpoint, params, model, mode, sample_every),
+                share=shallow_copy,
+            )
+        response = await self._send(method, endpoint, params=params, json=json, retry_safe=retry_safe)
+        return validate_json(model, response.content, mode, sample_every)
+
+    async def _get_model(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        model: Type[T],
+        mode: ValidationMode,
+        sample_every: int,
+    ) -> T:
+        """Get and validate the body of a GET request, reusing the model parsed from a cached body."""
+        content = await self._get_content(endpoint, params)
+        cache = self._response_cache
+        if cache is None or not cache.caches(endpoint):
+            return validate_json(model, content, mode, sample_every)
+        return cache.parsed(
+            endpoint,
+            params,
+            content,
+            (model, mode, sample_every),
+            lambda: validate_json(model, content, mode, sample_every),
+        )
+
+    async def _get_content(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """Get the body of a GET request, sharing it with identical requests already in flight."""
+        return await self._flights.do(
+            ("GET", ResponseCache.key(endpoint, params)), lambda: self._read(endpoint, params)
+        )
+
+    async def _read(self, endpoint: str, params: Optional[Dict[str, Any]]) -> bytes:
+        """Get the body of a GET request, from the response cache when it holds a fresh copy."""
+        cache = self._response_cache
+        if cache is None:
+            response = await self._send("GET", endpoint, params=params)
+            return response.content
+        cached = await acall_backend(cache.store, cache.lookup, endpoint, params)
+        if cached is None:
+            return await self._fetch(endpoint, params)
+        content, stale = cached
+        if not stale:
+            return content
+        if not cache.serves_stale(endpoint):
+            return await self._fetch(endpoint, params, content)
+        if cache.claim_refresh(endpoint, params):
+            task = asyncio.ensure_future(self._revalidate(endpoint, params, content))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        return content
+
+    async def _fetch(
+        self, endpoint: str, params: Optional[Dict[str, Any]], cached: Optional[bytes] = None
+    ) -> bytes:
+        """Fetch and cache the body of a GET request, revalidating the cached body if given."""
+        cache = self._response_cache
+        generation = cache.generation(endpoint)
+        headers = (
+            await acall_backend(cache.store, cache.conditional_headers, endpoint, params)
+            if cached is not None
+            else None
+        )
+        response = await self._send("GET", endpoint, params=params, headers=headers)
+        return await acall_backend(
+            cache.store, cache.store_response, endpoint, params, response, generation, cached, headers
+        )
+
+    async def _revalidate(self, endpoint: str, params: Optional[Dict[str, Any]], cached: bytes) -> None:
+        """Refresh a stale cached response; on failure the stale copy is kept until it expires."""
+        try:
+            await self._fetch(endpoint, params, cached)
+        except httpx.HTTPError:
+            pass
+        finally:
+            self._response_cache.release_refresh(endpoint, params)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Send a request, pacing it with the rate limiter and retrying it per the retry policy.
+
+        A 304 is returned rather than raised when conditional headers are sent.
+        """
+        policy = self.config.retry
+        deadline = policy.deadline()
+        attempt = 1
+        while True:
+            wait = self._rate_limiter.reserve(endpoint)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=endpoint,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+                if not (headers and response.status_code == httpx.codes.NOT_MODIFIED):
+                    response.raise_for_status()
+                cache = self._response_cache
+                if method != "GET" and cache is not None:
+                    await acall_backend(cache.store, cache.invalidate, endpoint)
+                return response
+            except httpx.HTTPError as error:
+                delay = policy.next_delay(error, method, attempt, deadline, retry_safe)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make a GET request to the API."""
+        return await self._request("GET", endpoint, params=params)
+
+    async def post(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+    ) -> Dict[str, Any]:
+        """Make a POST request to the API, retried on failure only when marked retry_safe."""
+        return await self._request("POST", endpoint, json=json, retry_safe=retry_safe)
+
+    async def get_model(
+        self,
+        endpoint: str,
+        model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> T:
+        """Make a GET request to the API and validate the response body into a model."""
+        return await self._request_model("GET", endpoint, model, params=params, validate=validate)
+
+    async def post_model(
+        self,
+        endpoint: str,
+        model: Type[T],
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+        validate: Optional[ValidationMode] = None,
+    ) -> T:
+        """Make a POST request to the API and validate the response body into a model."""
+        return await self._request_model(
+            "POST", endpoint, model, json=json, retry_safe=retry_safe, validate=validate
+        )
+
+    async def put(self, endpoint: str, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a PUT request to the API."""
+        return await self._request("PUT", endpoint, json=json)
+
+    async def patch(self, endpoint: str, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a PATCH request to the API."""
+        return await self._request("PATCH", endpoint, json=json)
+
+    async def delete(self, endpoint: str) -> Dict[str, Any]:
+        """Make a DELETE request to the API."""
+        return await self._request("DELETE", endpoint)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, cancelling background cache refreshes."""
+        for task in list(self._background_tasks):
+            task.cancel()
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncInstantlyClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.aclose()
@@ -0,0 +1,158 @@
+"""
+Local index of the block list of an Instantly.ai workspace
+"""
+
+import math
+import threading
+import time
+from datetime import timezone
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from instantly.models.block_list_entry import BlockListEntry
+
+_BLOCKED = ""
+"""Key marking a trie node whose domain is blocked; labels are never empty."""
+
+_Entry = Tuple[str, str, Optional[float]]
+
+def normalize_domain(domain: str) -> str:
+    """
+    Normalize a blocked domain so that spellings such as "@Example.com." or "*.example.com" match.
+
+    Args:
+        domain: The domain as stored in the block list
+
+    Returns:
+        The lowercased domain without wildcard, "@" or trailing dot
+    """
+    domain = domain.strip().lower().lstrip("@").rstrip(".")
+    return domain[2:] if domain.startswith("*.") else domain
+
+class BlockListIndex:
+    """
+    Blocked emails and domains held in memory for fast local lookups.
+
+    Emails are kept in a hash set and domains in a trie keyed by reversed labels, so an entry for
+    "example.com" also blocks "mail.example.com". Entries are dropped once their expires_at has
+    passed. Build and refresh an index with BlockListEntryAPI.sync_block_list_index().
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.cursor: Optional[str] = None
+        self.synced_at: Optional[float] = None
+        self._entries: Dict[str, _Entry] = {}
+        self._emails: Set[str] = set()
+        self._domains: Dict[str, dict] = {}
+        self._next_expiry = math.inf
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: "BlockListEntry") -> None:
+        """
+        Add an entry, or update it if it is already indexed.
+
+        Args:
+            entry: The block list entry
+        """
+        value = entry.value.strip().lower() if entry.type == "email" else normalize_domain(entry.value)
+        expires = None
+        if entry.expires_at is not None:
+            expires_at = entry.expires_at
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            expires = expires_at.timestamp()
+        indexed = (entry.type, value, expires)
+        with self._lock:
+            self.cursor = str(entry.id)
+            previous = self._entries.get(self.cursor)
+            self._entries[self.cursor] = indexed
+            if previous is not None and previous != indexed:
+                self._rebuild(time.time())
+            else:
+                expires = _insert(indexed, time.time(), self._emails, self._domains)
+                self._next_expiry = min(self._next_expiry, expires)
+
+    def replace(self, other: "BlockListIndex") -> None:
+        """
+        Take over the entries and cursor of another index at once, e.g. after a full resync.
+
+        Args:
+            other: The index to copy from; it must not be changed afterwards
+        """
+        with self._lock:
+            self._entries = other._entries
+            self._emails = other._emails
+            self._domains = other._domains
+            self._next_expiry = other._next_expiry
+            self.cursor = other.cursor
+            self.synced_at = other.synced_at
+
+    def is_blocked(self, emails: Iterable[str]) -> List[bool]:
+        """
+        Check which of many email addresses are blocked.
+
+        Each distinct domain is looked up in the trie once per call, so batches of addresses
+        from a few domains are checked at the speed of a set lookup.
+
+        Args:
+            emails: The addresses to check
+
+        Returns:
+            For each address, whether it or one of the parent domains of its domain is blocked
+        """
+        if time.time() >= self._next_expiry:
+            with self._lock:
+                self._rebuild(time.time())
+        blocked_emails = self._emails
+        trie = self._domains
+        domains: Dict[str, bool] = {}
+        results = []
+        for email in emails:
+            email = email.strip().lower()
+            if email in blocked_emails:
+                results.append(True)
+                continue
+            domain = email.rpartition("@")[2]
+            blocked = domains.get(domain)
+            if blocked is None:
+                blocked = domains[domain] = _domain_blocked(trie, domain)
+            results.append(blocked)
+        return results
+
+    def __contains__(self, email: str) -> bool:
+        return self.is_blocked((email,))[0]
+
+    def _rebuild(self, now: float) -> None:
+        emails: Set[str] = set()
+        domains: Dict[str, dict] = {}
+        next_expiry = math.inf
+        for entry in self._entries.values():
+            next_expiry = min(next_expiry, _insert(entry, now, emails, domains))
+        self._emails, self._domains, self._next_expiry = emails, domains, next_expiry
+
+def _insert(entry: _Entry, now: float, emails: Set[str], domains: Dict[str, dict]) -> float:
+    kind, value, expires = entry
+    if expires is not None and expires <= now:
+        return math.inf
+    if kind == "email":
+        emails.add(value)
+    else:
+        node = domains
+        for label in reversed(value.split(".")):
+            node = node.setdefault(label, {})
+        node[_BLOCKED] = {}
+    return math.inf if expires is None else expires
+
+def _domain_blocked(trie: Dict[str, dict], domain: str) -> bool:
+    node = trie
+    for label in reversed(domain.split(".")):
+        node = node.get(label)
+        if node is None:
+            return False
+        if _BLOCKED in node:
+            return True
+    return False
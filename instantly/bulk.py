@@ -0,0 +1,145 @@
+"""
+Chunked dispatch of bulk requests to the Instantly.ai API
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+class ChunkDispatchError(Exception):
+    """
+    A chunk of a bulk request failed.
+
+    Attributes:
+        error: The first error raised by a chunk
+        results: The result of each chunk that completed, by chunk index
+    """
+
+    def __init__(self, error: BaseException, results: Dict[int, Any], total: int):
+        """
+        Initialize the error.
+
+        Args:
+            error: The first error raised by a chunk
+            results: The result of each chunk that completed, by chunk index
+            total: Number of chunks of the request
+        """
+        super().__init__(f"a chunk failed and {len(results)} of {total} completed: {error}")
+        self.error = error
+        self.results = results
+
+def chunked(items: Sequence[T], size: int) -> List[Sequence[T]]:
+    """
+    Split a sequence into consecutive chunks.
+
+    Args:
+        items: The items to split
+        size: Maximum number of items per chunk
+
+    Returns:
+        The chunks, in order; a single chunk if the items fit in one
+    """
+    return [items[start:start + size] for start in range(0, len(items), size)] or [items]
+
+def dispatch_chunks(send: Callable[[T], R], chunks: Sequence[T], concurrency: int) -> List[R]:
+    """
+    Send chunks of a bulk request concurrently.
+
+    After the first failure no further chunks are sent, and those in flight are left to finish.
+    Chunks already sent are not rolled back.
+
+    Args:
+        send: Sends one chunk and returns its result
+        chunks: The chunks to send
+        concurrency: Maximum number of chunks in flight
+
+    Returns:
+        The result of each chunk, in chunk order
+
+    Raises:
+        ChunkDispatchError: If a chunk failed, with the results of the chunks that completed;
+            a single chunk raises its error directly
+    """
+    if len(chunks) == 1:
+        return [send(chunks[0])]
+    workers = min(concurrency, len(chunks))
+    in_flight: Dict[Future, int] = {}
+    results: Dict[int, R] = {}
+    error: Optional[BaseException] = None
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="instantly-bulk") as executor:
+        for index, chunk in enumerate(chunks):
+            if len(in_flight) >= workers:
+                error = _collect(wait(in_flight, return_when=FIRST_COMPLETED).done, in_flight, results)
+                if error is not None:
+                    break
+            in_flight[executor.submit(send, chunk)] = index
+        while in_flight:
+            failed = _collect(wait(in_flight).done, in_flight, results)
+            error = error or failed
+    if error is not None:
+        raise ChunkDispatchError(error, results, len(chunks)) from error
+    return [results[index] for index in range(len(chunks))]
+
+async def adispatch_chunks(
+    send: Callable[[T], Awaitable[R]], chunks: Sequence[T], concurrency: int
+) -> List[R]:
+    """
+    Send chunks of a bulk request concurrently.
+
+    After the first failure no further chunks are sent, and those in flight are left to finish.
+    Chunks already sent are not rolled back.
+
+    Args:
+        send: Coroutine function sending one chunk and returning its result
+        chunks: The chunks to send
+        concurrency: Maximum number of chunks in flight
+
+    Returns:
+        The result of each chunk, in chunk order
+
+    Raises:
+        ChunkDispatchError: If a chunk failed, with the results of the chunks that completed;
+            a single chunk raises its error directly
+    """
+    import asyncio
+
+    if len(chunks) == 1:
+        return [await send(chunks[0])]
+    in_flight: Dict[asyncio.Future, int] = {}
+    results: Dict[int, R] = {}
+    error: Optional[BaseException] = None
+    try:
+        for index, chunk in enumerate(chunks):
+            if len(in_flight) >= concurrency:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                error = _collect(done, in_flight, results)
+                if error is not None:
+                    break
+            in_flight[asyncio.ensure_future(send(chunk))] = index
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight)
+            failed = _collect(done, in_flight, results)
+            error = error or failed
+    finally:
+        for task in in_flight:
+            task.cancel()
+    if error is not None:
+        raise ChunkDispatchError(error, results, len(chunks)) from error
+    return [results[index] for index in range(len(chunks))]
+
+def _collect(
+    done: Iterable[Any], in_flight: Dict[Any, int], results: Dict[int, Any]
+) -> Optional[BaseException]:
+    error = None
+    for future in done:
+        index = in_flight.pop(future)
+        if future.exception() is None:
+            results[index] = future.result()
+        elif error is None:
+            error = future.exception()
+    return error
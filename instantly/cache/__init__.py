@@ -0,0 +1,9 @@
+"""
+Caching for the Instantly.ai SDK
+"""
+
+from instantly.cache.backend import CacheBackend
+from instantly.cache.memory import MemoryCache
+from instantly.cache.response import CachePolicy, ResponseCache, StaleWhileRevalidate
+
+__all__ = ["CacheBackend", "CachePolicy", "MemoryCache", "ResponseCache", "StaleWhileRevalidate"]
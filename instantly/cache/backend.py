@@ -0,0 +1,98 @@
+"""
+Storage interface for cached response bodies
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class CacheBackend(ABC):
+    """
+    Storage for cached byte strings with TTLs and groups.
+
+    Implementations must be safe to use from several threads. One backend may be shared by
+    several clients: each client's response cache prefixes its keys and groups with a hash of
+    its base URL and API key, so clients of different workspaces never see each other's entries.
+    """
+
+    blocking = False
+    """Whether calls wait on disk or network I/O, so asynchronous clients make them from a worker thread."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The value, or None if it is missing or expired
+        """
+        found = self.lookup(key)
+        return None if found is None else found[0]
+
+    @abstractmethod
+    def lookup(self, key: str) -> Optional[Tuple[bytes, bool]]:
+        """
+        Get a value together with whether it is stale, marking it as recently used.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The value and whether its stale_after has passed, or None if it is missing or expired
+        """
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        group: str = "",
+        stale_after: Optional[float] = None,
+    ) -> None:
+        """
+        Store a value, evicting least recently used entries to stay within the backend's limits.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Seconds until the value expires
+            group: Group the entry belongs to, for invalidate_group()
+            stale_after: Seconds until lookup() reports the value as stale (defaults to ttl)
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+
+    @abstractmethod
+    def invalidate_group(self, group: str) -> None:
+        """Remove every value stored with the given group."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every value."""
+
+    def close(self) -> None:
+        """Release the resources held by the backend."""
+
+async def acall_backend(backend: CacheBackend, fn: Callable[..., T], *args: Any) -> T:
+    """
+    Call a function using a backend from async code, in a worker thread if the backend blocks.
+
+    Args:
+        backend: The backend the function uses
+        fn: The function to call
+        *args: Its arguments
+
+    Returns:
+        What the function returned
+    """
+    if not backend.blocking:
+        return fn(*args)
+    import asyncio
+
+    return await asyncio.to_thread(fn, *args)
@@ -0,0 +1,101 @@
+"""
+In-memory LRU cache for raw response bodies
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+from instantly.cache.backend import CacheBackend
+
+class _Entry(NamedTuple):
+    value: bytes
+    expires_at: float
+    stale_at: float
+    group: str
+
+class MemoryCache(CacheBackend):
+    """Thread-safe LRU cache of byte strings with per-entry TTL, bounded by entry count and bytes."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept; the least recently used are evicted first
+            max_bytes: Maximum total size of keys and values kept
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._groups: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, key: str) -> Optional[Tuple[bytes, bool]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = time.monotonic()
+            if entry.expires_at <= now:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.value, entry.stale_at <= now
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        group: str = "",
+        stale_after: Optional[float] = None,
+    ) -> None:
+        size = len(key) + len(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if ttl <= 0 or size > self.max_bytes:
+                return
+            now = time.monotonic()
+            stale_at = now + (ttl if stale_after is None else min(stale_after, ttl))
+            self._entries[key] = _Entry(value, now + ttl, stale_at, group)
+            self._groups.setdefault(group, set()).add(key)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_group(self, group: str) -> None:
+        with self._lock:
+            for key in list(self._groups.get(group, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+            self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the keys and values currently stored."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(key) + len(entry.value)
+        keys = self._groups.get(entry.group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[entry.group]
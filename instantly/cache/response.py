@@ -0,0 +1,370 @@
+"""
+Response caching for read-mostly endpoints of the Instantly.ai API
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from copy import copy
+from functools import lru_cache
+from typing import (
+    Any, Callable, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set, Tuple, Type, TypeVar, get_args,
+    get_origin,
+)
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from instantly.cache.backend import CacheBackend
+from instantly.cache.memory import MemoryCache
+from instantly.endpoints import endpoint_group, endpoint_path
+
+T = TypeVar("T")
+
+CONDITIONAL_HEADERS = {"etag": "If-None-Match", "last-modified": "If-Modified-Since"}
+"""Response validator headers and the request headers that send them back on revalidation."""
+
+def conditional_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Build the headers of a conditional GET from the validators of a response.
+
+    Args:
+        headers: Headers of the response, such as httpx.Response.headers
+
+    Returns:
+        If-None-Match and/or If-Modified-Since, empty if the response has no validators
+    """
+    return {
+        request_header: headers[response_header]
+        for response_header, request_header in CONDITIONAL_HEADERS.items()
+        if headers.get(response_header)
+    }
+
+def cache_namespace(base_url: str, api_key: str) -> str:
+    """
+    Name the cache entries of one API key on one server, so that clients sharing a backend never
+    read each other's responses.
+
+    Args:
+        base_url: The base URL of the API
+        api_key: The API key, which identifies the workspace
+
+    Returns:
+        A short hash of both
+    """
+    return hashlib.sha256(f"{base_url}\n{api_key}".encode()).hexdigest()[:16]
+
+class _Parsed(NamedTuple):
+    group: str
+    content: bytes
+    spec: Any
+    result: Any
+
+class StaleWhileRevalidate(BaseModel):
+    """Serve cached responses past their freshness while refreshing them in the background."""
+
+    model_config = ConfigDict(frozen=True)
+
+    soft_ttl: float = Field(60.0, gt=0, description="Seconds a response is served without a refresh")
+    hard_ttl: float = Field(
+        300.0, gt=0, description="Seconds a stale response may still be served while it is refreshed"
+    )
+
+class CachePolicy(BaseModel):
+    """Which GET responses a client caches, for how long, and how much it keeps."""
+
+    model_config = ConfigDict(frozen=True)
+
+    groups: FrozenSet[str] = Field(
+        default=frozenset({"campaigns", "accounts", "lead-labels", "custom-tags"}),
+        description="Endpoint groups whose GET responses are cached",
+    )
+    ttl: float = Field(60.0, gt=0, description="Seconds a cached response stays fresh")
+    group_ttls: Dict[str, float] = Field(
+        default_factory=dict, description="TTL overrides keyed by endpoint group"
+    )
+    stale_while_revalidate: Dict[str, StaleWhileRevalidate] = Field(
+        default_factory=lambda: {"analytics": StaleWhileRevalidate()},
+        description="Endpoint groups cached with stale-while-revalidate instead of a plain TTL",
+    )
+    revalidate_ttl: float = Field(
+        3600.0,
+        ge=0,
+        description="Seconds an expired response with an ETag or Last-Modified validator is kept "
+        "to be revalidated with a conditional GET",
+    )
+    max_entries: int = Field(1024, ge=1, description="Maximum number of responses kept in memory")
+    max_bytes: int = Field(
+        16 * 1024 * 1024, ge=1, description="Maximum total size of the responses kept in memory"
+    )
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """Get the TTL of an endpoint's responses, or None if they are not cached."""
+        group = endpoint_group(endpoint)
+        if group not in self.groups:
+            return None
+        return self.group_ttls.get(group, self.ttl)
+
+class ResponseCache:
+    """Raw GET response bodies of one client, invalidated by the client's own writes."""
+
+    def __init__(
+        self, policy: CachePolicy, backend: Optional[CacheBackend] = None, namespace: str = ""
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            policy: The caching policy
+            backend: Where response bodies are stored (defaults to a MemoryCache sized by the
+                policy's max_entries and max_bytes)
+            namespace: Prefix of every key and group in the backend, such as cache_namespace(),
+                so that a backend shared by several clients keeps their responses apart
+        """
+        self.policy = policy
+        self.namespace = namespace
+        self.store = (
+            backend if backend is not None else MemoryCache(policy.max_entries, policy.max_bytes)
+        )
+        self._parsed: "OrderedDict[str, _Parsed]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key of a GET request, independent of the API prefix and param order."""
+        path = endpoint_path(endpoint)
+        if not params:
+            return path
+        return f"{path}?{httpx.QueryParams(dict(sorted(params.items())))}"
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """Get the cached body of a GET request, or None on a miss."""
+        return self.store.get(self._stored(self.key(endpoint, params)))
+
+    def lookup(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[bytes, bool]]:
+        """Get the cached body of a GET request and whether it is due for a refresh, or None on a miss."""
+        return self.store.lookup(self._stored(self.key(endpoint, params)))
+
+    def caches(self, endpoint: str) -> bool:
+        """Whether the GET responses of an endpoint are cached."""
+        group = endpoint_group(endpoint)
+        return group in self.policy.stale_while_revalidate or group in self.policy.groups
+
+    def serves_stale(self, endpoint: str) -> bool:
+        """Whether stale responses of an endpoint are served while they are refreshed."""
+        return endpoint_group(endpoint) in self.policy.stale_while_revalidate
+
+    def conditional_headers(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """Get the headers that revalidate the cached response of a GET request, empty if it has none."""
+        stored = self.store.get(self._validators_key(self._stored(self.key(endpoint, params))))
+        return json.loads(stored) if stored else {}
+
+    def parsed(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        content: bytes,
+        spec: Any,
+        parse: Callable[[], T],
+    ) -> T:
+        """
+        Parse a response body once and reuse the result while the cached body is unchanged.
+
+        Every call gets a shallow copy of the held result, which costs a fraction of parsing it
+        again: the result, its lists and the models directly in them can be changed freely, but
+        values nested deeper, such as the lists of the items of a page, are shared and must be
+        replaced rather than changed in place.
+
+        Args:
+            endpoint: The requested endpoint
+            params: The query parameters of the request
+            content: The response body
+            spec: Everything besides the body that the result depends on, such as the model type
+            parse: Parses the body when no reusable result is held
+
+        Returns:
+            The parsed body
+        """
+        key = self.key(endpoint, params)
+        with self._lock:
+            held = self._parsed.get(key)
+            if held is not None and held.spec == spec and held.content == content:
+                self._parsed.move_to_end(key)
+                return shallow_copy(held.result)
+        result = parse()
+        with self._lock:
+            self._parsed[key] = _Parsed(endpoint_group(endpoint), content, spec, result)
+            self._parsed.move_to_end(key)
+            while len(self._parsed) > self.policy.max_entries:
+                self._parsed.popitem(last=False)
+        return shallow_copy(result)
+
+    def claim_refresh(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """Claim the background refresh of a stale response; False if one is already running."""
+        key = self.key(endpoint, params)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Release a refresh claimed with claim_refresh()."""
+        with self._lock:
+            self._refreshing.discard(self.key(endpoint, params))
+
+    def generation(self, endpoint: str) -> int:
+        """Get the invalidation count of an endpoint's group, to pass to set() after fetching."""
+        return self._generations.get(endpoint_group(endpoint), 0)
+
+    def set(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        content: bytes,
+        generation: Optional[int] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Cache the body of a GET request if its endpoint is cached.
+
+        A body with validators is kept for the policy's revalidate_ttl after it expires, flagged
+        as stale, so that it can be revalidated with a conditional GET instead of downloaded again.
+
+        Args:
+            endpoint: The requested endpoint
+            params: The query parameters of the request
+            content: The response body
+            generation: generation() from before the request was sent; the body is not cached if
+                a write invalidated the group since, as it may predate that write
+            validators: The conditional_headers() of the response
+        """
+        group = endpoint_group(endpoint)
+        revalidate = self.policy.stale_while_revalidate.get(group)
+        if revalidate is not None:
+            ttl, stale_after = revalidate.hard_ttl, revalidate.soft_ttl
+        else:
+            ttl, stale_after = self.policy.ttl_for(endpoint), None
+            if ttl is not None and validators and self.policy.revalidate_ttl:
+                ttl, stale_after = ttl + self.policy.revalidate_ttl, ttl
+        if ttl is None or (generation is not None and generation != self.generation(endpoint)):
+            return
+        key = self._stored(self.key(endpoint, params))
+        group = self._stored(group)
+        self.store.set(key, content, ttl, group, stale_after)
+        if validators:
+            self.store.set(self._validators_key(key), json.dumps(validators).encode(), ttl, group)
+        else:
+            self.store.delete(self._validators_key(key))
+
+    def store_response(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+        generation: int,
+        cached: Optional[bytes] = None,
+        sent_headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """
+        Cache the response to a GET request, which may be a 304 to a conditional GET.
+
+        Args:
+            endpoint: The requested endpoint
+            params: The query parameters of the request
+            response: The response
+            generation: generation() from before the request was sent
+            cached: The cached body the request revalidated, if it was conditional
+            sent_headers: The conditional headers sent with the request
+
+        Returns:
+            The current body: the cached one on a 304, otherwise the body of the response
+        """
+        validators = conditional_headers(response.headers)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            content, validators = cached, validators or sent_headers
+        else:
+            content = response.content
+        self.set(endpoint, params, content, generation, validators)
+        return content
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop every cached response of the group a written endpoint belongs to."""
+        group = endpoint_group(endpoint)
+        self._generations[group] = self._generations.get(group, 0) + 1
+        self.store.invalidate_group(self._stored(group))
+        with self._lock:
+            for key in [key for key, held in self._parsed.items() if held.group == group]:
+                del self._parsed[key]
+
+    def clear(self) -> None:
+        """Drop every cached response of this cache, leaving those of other namespaces."""
+        if self.namespace:
+            for group in self.policy.groups | set(self.policy.stale_while_revalidate):
+                self.store.invalidate_group(self._stored(group))
+        else:
+            self.store.clear()
+        with self._lock:
+            self._parsed.clear()
+
+    def _stored(self, name: str) -> str:
+        return f"{self.namespace}:{name}" if self.namespace else name
+
+    @staticmethod
+    def _validators_key(key: str) -> str:
+        return f"{key}#validators"
+
+def shallow_copy(result: Any) -> Any:
+    """
+    Copy a parsed response body deeply enough that changing the copy's fields leaves the original alone.
+
+    Models, lists of models and a model's own lists are copied; values nested deeper are shared.
+
+    Args:
+        result: A parsed response body, such as a model, a list of models or a dict
+
+    Returns:
+        The copy
+    """
+    if isinstance(result, list):
+        return _copy_list(result)
+    if isinstance(result, BaseModel):
+        return _copy_model(result, copy_lists=True)
+    if isinstance(result, (dict, set)):
+        return copy(result)
+    return result
+
+def _copy_list(items: List[Any]) -> List[Any]:
+    if items and isinstance(items[0], BaseModel):
+        return [_copy_model(item) for item in items]
+    return items[:]
+
+def _copy_model(model: BaseModel, copy_lists: bool = False) -> BaseModel:
+    # What BaseModel.__copy__ does, without its per-call overhead, optionally also copying lists
+    fields = model.__dict__.copy()
+    if copy_lists:
+        for name in _list_fields(type(model)):
+            value = fields.get(name)
+            if type(value) is list:
+                fields[name] = _copy_list(value)
+    copied = object.__new__(type(model))
+    object.__setattr__(copied, "__dict__", fields)
+    object.__setattr__(copied, "__pydantic_fields_set__", set(model.__pydantic_fields_set__))
+    extra, private = model.__pydantic_extra__, model.__pydantic_private__
+    object.__setattr__(copied, "__pydantic_extra__", None if extra is None else extra.copy())
+    object.__setattr__(copied, "__pydantic_private__", None if private is None else private.copy())
+    return copied
+
+@lru_cache(maxsize=None)
+def _list_fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(name for name, field in model.model_fields.items() if _holds_list(field.annotation))
+
+def _holds_list(annotation: Any) -> bool:
+    return get_origin(annotation) is list or any(_holds_list(arg) for arg in get_args(annotation))
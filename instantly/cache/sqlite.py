@@ -0,0 +1,185 @@
+"""
+SQLite cache backend shared by the processes of one host
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from instantly.cache.backend import CacheBackend
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    grp TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_grp ON entries (grp);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_inserted AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_deleted AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size;
+END;
+"""
+
+# Reads refresh an entry's LRU position at most this often, to spare hot keys a write per read
+_TOUCH_INTERVAL = 1.0
+
+class SQLiteCache(CacheBackend):
+    """
+    LRU cache of byte strings in a SQLite file, bounded by entry count and bytes.
+
+    The database runs in WAL mode, so processes on one host can read while another writes, and
+    waits up to busy_timeout for locks held by other processes. Times are wall-clock, as
+    monotonic clocks are not comparable across processes. Asynchronous clients call it from a
+    worker thread, as its queries block.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        max_bytes: int = 256 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+    ):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Maximum number of entries kept; the least recently used are evicted first
+            max_bytes: Maximum total size of keys and values kept
+            busy_timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+
+    def lookup(self, key: str) -> Optional[Tuple[bytes, bool]]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at, stale_at, accessed_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at, stale_at, accessed_at = row
+            if expires_at <= now:
+                self._connection.execute(
+                    "DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now)
+                )
+                return None
+            if now - accessed_at >= _TOUCH_INTERVAL:
+                self._connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            return bytes(value), stale_at <= now
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        group: str = "",
+        stale_after: Optional[float] = None,
+    ) -> None:
+        size = len(key.encode()) + len(value)
+        if ttl <= 0 or size > self.max_bytes:
+            self.delete(key)
+            return
+        now = time.time()
+        stale_at = now + (ttl if stale_after is None else min(stale_after, ttl))
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._connection.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, value, group, size, now + ttl, stale_at, now),
+                )
+                self._evict(now)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def invalidate_group(self, group: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE grp = ?", (group,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+
+    def compact(self) -> None:
+        """Drop expired entries and give the freed space back to the file system."""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._connection.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the keys and values currently stored."""
+        with self._lock:
+            return self._totals()[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._totals()[0]
+
+    def _totals(self) -> Tuple[int, int]:
+        return self._connection.execute("SELECT entries, bytes FROM totals").fetchone()
+
+    def _evict(self, now: float) -> None:
+        count, total = self._totals()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        self._connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        count, total = self._totals()
+        excess_entries = count - self.max_entries
+        excess_bytes = total - self.max_bytes
+        if excess_entries <= 0 and excess_bytes <= 0:
+            return
+        doomed = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at, rowid"
+        ):
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            doomed.append((key,))
+            excess_entries -= 1
+            excess_bytes -= size
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", doomed)
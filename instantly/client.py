@@ -2,14 +2,68 @@
 Main client for interacting with the Instantly.ai API
 """
 
-from typing import Any, Dict, Optional
+import threading
+import time
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, TypeVar
 
 import httpx
+from pydantic_core import from_json
 
+from instantly.cache.response import ResponseCache, cache_namespace, shallow_copy
 from instantly.config import InstantlyConfig
+from instantly.parsing import ValidationMode, validate_json
+from instantly.rate_limit import RateLimiter
+from instantly.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from instantly.api.account import AccountAPI
+    from instantly.api.campaign import CampaignAPI
+    from instantly.api.lead import LeadAPI
+    from instantly.api.email import EmailAPI
+    from instantly.api.email_verification import EmailVerificationAPI
+    from instantly.api.lead_list import LeadListAPI
+    from instantly.api.background_job import BackgroundJobAPI
+    from instantly.api.custom_tag import CustomTagAPI
+    from instantly.api.block_list_entry import BlockListEntryAPI
+    from instantly.api.lead_label import LeadLabelAPI
+    from instantly.api.api_key import APIKeyAPI
+    from instantly.api.account_campaign_mapping import AccountCampaignMappingAPI
+
+T = TypeVar("T")
+
+API_NAMESPACES: Dict[str, Tuple[str, str]] = {
+    "accounts": ("instantly.api.account", "AccountAPI"),
+    "campaigns": ("instantly.api.campaign", "CampaignAPI"),
+    "leads": ("instantly.api.lead", "LeadAPI"),
+    "emails": ("instantly.api.email", "EmailAPI"),
+    "email_verification": ("instantly.api.email_verification", "EmailVerificationAPI"),
+    "lead_lists": ("instantly.api.lead_list", "LeadListAPI"),
+    "background_jobs": ("instantly.api.background_job", "BackgroundJobAPI"),
+    "custom_tags": ("instantly.api.custom_tag", "CustomTagAPI"),
+    "block_list_entries": ("instantly.api.block_list_entry", "BlockListEntryAPI"),
+    "lead_labels": ("instantly.api.lead_label", "LeadLabelAPI"),
+    "api_keys": ("instantly.api.api_key", "APIKeyAPI"),
+    "account_campaign_mappings": ("instantly.api.account_campaign_mapping", "AccountCampaignMappingAPI"),
+}
+"""API namespaces of the client, created on first access: attribute -> (module, class)."""
 
 class InstantlyClient:
     """Main client for interacting with the Instantly.ai API."""
+
+    if TYPE_CHECKING:
+        accounts: "AccountAPI"
+        campaigns: "CampaignAPI"
+        leads: "LeadAPI"
+        emails: "EmailAPI"
+        email_verification: "EmailVerificationAPI"
+        lead_lists: "LeadListAPI"
+        background_jobs: "BackgroundJobAPI"
+        custom_tags: "CustomTagAPI"
+        block_list_entries: "BlockListEntryAPI"
+        lead_labels: "LeadLabelAPI"
+        api_keys: "APIKeyAPI"
+        account_campaign_mappings: "AccountCampaignMappingAPI"
     
     def __init__(self, config: InstantlyConfig):
         """
@@ -24,32 +78,42 @@ class InstantlyClient:
             headers=config.headers,
             timeout=config.timeout,
         )
+        self._rate_limiter = RateLimiter(config.rate_limit, config.rate_limit_groups)
+        self._response_cache = (
+            ResponseCache(
+                config.cache,
+                config.cache_backend,
+                cache_namespace(config.base_url, config.api_key.get_secret_value()),
+            )
+            if config.cache
+            else None
+        )
+        self._flights = SingleFlight()
+        self._api_lock = threading.Lock()
         
-        # Initialize API clients
-        self._init_api_clients()
-        
-    def _init_api_clients(self):
-        """Initialize API clients to avoid circular imports."""
-        from instantly.api.account import AccountAPI
-        from instantly.api.campaign import CampaignAPI
-        from instantly.api.lead import LeadAPI
-        from instantly.api.email import EmailAPI
-        from instantly.api.email_verification import EmailVerificationAPI
-        from instantly.api.lead_list import LeadListAPI
-        
-        self.accounts = AccountAPI(self)
-        self.campaigns = CampaignAPI(self)
-        self.leads = LeadAPI(self)
-        self.emails = EmailAPI(self)
-        self.email_verification = EmailVerificationAPI(self)
-        self.lead_lists = LeadListAPI(self)
-        
+    def __getattr__(self, name: str) -> Any:
+        """Create API namespaces such as `leads` on first access, importing only their modules."""
+        try:
+            module, class_name = API_NAMESPACES[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        with self._api_lock:
+            api = self.__dict__.get(name)
+            if api is None:
+                api = getattr(import_module(module), class_name)(self)
+                setattr(self, name, api)
+        return api
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(API_NAMESPACES))
+
     def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
     ) -> Dict[str, Any]:
         """
         Make a request to the Instantly.ai API.
@@ -59,29 +123,199 @@ class InstantlyClient:
             endpoint: The API endpoint to call
             params: Query parameters
             json: JSON body for POST/PUT requests
+            retry_safe: Whether a non-idempotent request may be repeated on failure
             
         Returns:
             The JSON response from the API
             
         Raises:
-            httpx.HTTPError: If the request fails
+            httpx.HTTPError: If the request fails after all retries
         """
-        response = self._client.request(
-            method=method,
-            url=endpoint,
-            params=params,
-            json=json,
-        )
-        response.raise_for_status()
+        if method == "GET":
+            return from_json(self._get_content(endpoint, params))
+        response = self._send(method, endpoint, params=params, json=json, retry_safe=retry_safe)
         return response.json()
         
+    def _request_model(
+        self,
+        method: str,
+        endpoint: str,
+        model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+        validate: Optional[ValidationMode] = None,
+    ) -> T:
+        """
+        Make a request and validate the raw response body straight into a model.
+        
+        Args:
+            method: The HTTP method to use
+            endpoint: The API endpoint to call
+            model: The model or type the response body is validated into
+            params: Query parameters
+            json: JSON body for POST/PUT requests
+            retry_safe: Whether a non-idempotent request may be repeated on failure
+            validate: Validation mode overriding the client config ("full", "none" or "sample")
+            
+        Returns:
+            The validated response
+        """
+        mode = validate or self.config.validation
+        sample_every = self.config.validation_sample_every
+        if method == "GET":
+            return self._flights.do(
+                ("GET", ResponseCache.key(endpoint, params), model, mode, sample_every),
+                lambda: self._get_model(endpoint, params, model, mode, sample_every),
+                share=shallow_copy,
+            )
+        response = self._send(method, endpoint, params=params, json=json, retry_safe=retry_safe)
+        return validate_json(model, response.content, mode, sample_every)
+
+    def _get_model(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        model: Type[T],
+        mode: ValidationMode,
+        sample_every: int,
+    ) -> T:
+        """Get and validate the body of a GET request, reusing the model parsed from a cached body."""
+        content = self._get_content(endpoint, params)
+        cache = self._response_cache
+        if cache is None or not cache.caches(endpoint):
+            return validate_json(model, content, mode, sample_every)
+        return cache.parsed(
+            endpoint,
+            params,
+            content,
+            (model, mode, sample_every),
+            lambda: validate_json(model, content, mode, sample_every),
+        )
+        
+    def _get_content(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """Get the body of a GET request, sharing it with identical requests already in flight."""
+        return self._flights.do(
+            ("GET", ResponseCache.key(endpoint, params)), lambda: self._read(endpoint, params)
+        )
+
+    def _read(self, endpoint: str, params: Optional[Dict[str, Any]]) -> bytes:
+        """Get the body of a GET request, from the response cache when it holds a fresh copy."""
+        if self._response_cache is None:
+            response = self._send("GET", endpoint, params=params)
+            return response.content
+        cached = self._response_cache.lookup(endpoint, params)
+        if cached is None:
+            return self._fetch(endpoint, params)
+        content, stale = cached
+        if not stale:
+            return content
+        if not self._response_cache.serves_stale(endpoint):
+            return self._fetch(endpoint, params, content)
+        if self._response_cache.claim_refresh(endpoint, params):
+            threading.Thread(
+                target=self._revalidate,
+                args=(endpoint, params, content),
+                name="instantly-revalidate",
+                daemon=True,
+            ).start()
+        return content
+
+    def _fetch(
+        self, endpoint: str, params: Optional[Dict[str, Any]], cached: Optional[bytes] = None
+    ) -> bytes:
+        """Fetch and cache the body of a GET request, revalidating the cached body if given."""
+        cache = self._response_cache
+        generation = cache.generation(endpoint)
+        headers = cache.conditional_headers(endpoint, params) if cached is not None else None
+        response = self._send("GET", endpoint, params=params, headers=headers)
+        return cache.store_response(endpoint, params, response, generation, cached, headers)
+
+    def _revalidate(self, endpoint: str, params: Optional[Dict[str, Any]], cached: bytes) -> None:
+        """Refresh a stale cached response; on failure the stale copy is kept until it expires."""
+        try:
+            self._fetch(endpoint, params, cached)
+        except httpx.HTTPError:
+            pass
+        finally:
+            self._response_cache.release_refresh(endpoint, params)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Send a request, pacing it with the rate limiter and retrying it per the retry policy.
+
+        A 304 is returned rather than raised when conditional headers are sent.
+        """
+        policy = self.config.retry
+        deadline = policy.deadline()
+        attempt = 1
+        while True:
+            wait = self._rate_limiter.reserve(endpoint)
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                response = self._client.request(
+                    method=method,
+                    url=endpoint,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+                if not (headers and response.status_code == httpx.codes.NOT_MODIFIED):
+                    response.raise_for_status()
+                if method != "GET" and self._response_cache is not None:
+                    self._response_cache.invalidate(endpoint)
+                return response
+            except httpx.HTTPError as error:
+                delay = policy.next_delay(error, method, attempt, deadline, retry_safe)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+        
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GET request to the API."""
         return self._request("GET", endpoint, params=params)
         
-    def post(self, endpoint: str, json: Dict[str, Any]) -> Dict[str, Any]:
-        """Make a POST request to the API."""
-        return self._request("POST", endpoint, json=json)
+    def post(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+    ) -> Dict[str, Any]:
+        """Make a POST request to the API, retried on failure only when marked retry_safe."""
+        return self._request("POST", endpoint, json=json, retry_safe=retry_safe)
+        
+    def get_model(
+        self,
+        endpoint: str,
+        model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        validate: Optional[ValidationMode] = None,
+    ) -> T:
+        """Make a GET request to the API and validate the response body into a model."""
+        return self._request_model("GET", endpoint, model, params=params, validate=validate)
+        
+    def post_model(
+        self,
+        endpoint: str,
+        model: Type[T],
+        json: Optional[Dict[str, Any]] = None,
+        retry_safe: bool = False,
+        validate: Optional[ValidationMode] = None,
+    ) -> T:
+        """Make a POST request to the API and validate the response body into a model."""
+        return self._request_model(
+            "POST", endpoint, model, json=json, retry_safe=retry_safe, validate=validate
+        )
         
     def put(self, endpoint: str, json: Dict[str, Any]) -> Dict[str, Any]:
         """Make a PUT request to the API."""
@@ -2,10 +2,19 @@
 Configuration for the Instantly.ai SDK
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from pydantic import Field, SecretStr
 
+from instantly.cache.backend import CacheBackend
+from instantly.cache.response import CachePolicy
+from instantly.parsing import ValidationMode
+from instantly.rate_limit import RateLimit
+from instantly.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from instantly.lead_replica import LeadReplica
+
 class InstantlyConfig:
     """Configuration for the Instantly.ai SDK client."""
     
@@ -14,6 +23,17 @@ class InstantlyConfig:
         api_key: str,
         base_url: str = "https://api.instantly.ai/api/v2",
         timeout: int = 30,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        rate_limit_groups: Optional[Dict[str, RateLimit]] = None,
+        prefetch_pages: int = 0,
+        concurrency: int = 8,
+        bulk_chunk_size: int = 1000,
+        validation: ValidationMode = "full",
+        validation_sample_every: int = 100,
+        cache: Optional[CachePolicy] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        lead_replica: Optional["LeadReplica"] = None,
     ):
         """
         Initialize the Instantly.ai SDK configuration.
@@ -22,10 +42,35 @@ class InstantlyConfig:
             api_key: Your Instantly.ai API key
             base_url: The base URL for the API (defaults to v2 API)
             timeout: Request timeout in seconds
+            retry: Retry policy for failed requests (defaults to RetryPolicy())
+            rate_limit: Client-side limit shared by all endpoints without a group limit
+            rate_limit_groups: Client-side limits keyed by endpoint group ("leads", "emails", "analytics", ...)
+            prefetch_pages: Pages that iter_* methods fetch ahead in the background (0 disables prefetching)
+            concurrency: Default number of concurrent requests made by fan-out and bulk helpers
+            bulk_chunk_size: Maximum number of lead IDs sent in one bulk assign, move or export request
+            validation: How list responses are parsed: "full" validation, "none" for read-only
+                views without validation, or "sample" to validate one item in validation_sample_every
+            validation_sample_every: Sampling interval for the "sample" validation mode
+            cache: Response cache for read-mostly GET endpoints (None disables caching)
+            cache_backend: Storage for cached responses, such as a SQLiteCache shared by several
+                processes (defaults to an in-memory cache)
+            lead_replica: Local replica that get_lead and list_leads may read from when called
+                with max_staleness
         """
         self.api_key = SecretStr(api_key)
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.retry = retry or RetryPolicy()
+        self.rate_limit = rate_limit
+        self.rate_limit_groups = rate_limit_groups or {}
+        self.prefetch_pages = prefetch_pages
+        self.concurrency = concurrency
+        self.bulk_chunk_size = bulk_chunk_size
+        self.validation = validation
+        self.validation_sample_every = validation_sample_every
+        self.cache = cache
+        self.cache_backend = cache_backend
+        self.lead_replica = lead_replica
         
     @property
     def headers(self) -> dict[str, str]:
@@ -0,0 +1,35 @@
+"""
+Endpoint classification for the Instantly.ai API
+"""
+
+API_PREFIX = "/api/v2"
+
+def endpoint_path(endpoint: str) -> str:
+    """
+    Normalize an endpoint to its path relative to the API base URL.
+
+    Args:
+        endpoint: The endpoint as passed to the client, with or without the /api/v2 prefix
+
+    Returns:
+        The path starting with a single slash and without the API prefix
+    """
+    path = "/" + endpoint.strip("/")
+    if path == API_PREFIX or path.startswith(API_PREFIX + "/"):
+        path = path[len(API_PREFIX):] or "/"
+    return path
+
+def endpoint_group(endpoint: str) -> str:
+    """
+    Get the group an endpoint belongs to, such as "leads", "emails" or "analytics".
+
+    Args:
+        endpoint: The endpoint as passed to the client
+
+    Returns:
+        "analytics" for any analytics endpoint, otherwise the first path segment
+    """
+    segments = endpoint_path(endpoint).strip("/").split("/")
+    if "analytics" in segments:
+        return "analytics"
+    return segments[0]
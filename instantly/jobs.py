@@ -0,0 +1,327 @@
+"""
+Polling of background jobs of the Instantly.ai API
+"""
+
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from instantly.models.background_job import BackgroundJob
+
+TERMINAL_STATUSES = frozenset({"success", "failed"})
+"""Statuses of background jobs that no longer change."""
+
+class JobPolling(BaseModel):
+    """How often background jobs are polled while waiting for them to finish."""
+
+    model_config = ConfigDict(frozen=True)
+
+    min_interval: float = Field(0.5, gt=0, description="Shortest delay in seconds between two polls")
+    max_interval: float = Field(15.0, gt=0, description="Longest delay in seconds between two polls")
+    backoff: float = Field(
+        1.5, ge=1, description="Factor the delay grows by after a poll that shows no progress"
+    )
+    batch_pages: int = Field(
+        2,
+        ge=0,
+        description="Pages of the job list scanned per round to poll several jobs in one request "
+        "while some have not been seen yet, after which the list is followed down to the oldest of "
+        "them; jobs not found there are fetched one by one, and 0 fetches every job on its own",
+    )
+    max_errors: int = Field(
+        5,
+        ge=1,
+        description="Polling rounds failing in a row, each retried with backoff, after which every "
+        "outstanding handle fails",
+    )
+
+class JobTracker:
+    """Latest state of one background job, and when it should be polled next."""
+
+    def __init__(self, policy: JobPolling):
+        """
+        Initialize a tracker that has not seen the job yet.
+
+        Args:
+            policy: The polling policy
+        """
+        self.policy = policy
+        self.job: Optional["BackgroundJob"] = None
+        self.delay = policy.min_interval
+        self._changed_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has reached a terminal status."""
+        return self.job is not None and self.job.status in TERMINAL_STATUSES
+
+    def observe(self, job: "BackgroundJob", now: float) -> bool:
+        """
+        Record a polled state of the job and schedule the next poll.
+
+        When the progress moves, the next poll is planned for about half the time the job needs
+        to finish at the observed rate; while it stands still, the delay backs off.
+
+        Args:
+            job: The job as just polled
+            now: Monotonic time of the poll
+
+        Returns:
+            Whether the progress or status changed since the previous poll
+        """
+        previous = self.job
+        self.job = job
+        if previous is None:
+            self._changed_at = now
+            return True
+        changed = job.progress != previous.progress or job.status != previous.status
+        if job.progress > previous.progress and now > self._changed_at:
+            rate = (job.progress - previous.progress) / (now - self._changed_at)
+            self.delay = (100 - job.progress) / rate / 2
+        else:
+            self.delay *= self.policy.backoff
+        self.delay = min(max(self.delay, self.policy.min_interval), self.policy.max_interval)
+        if changed:
+            self._changed_at = now
+        return changed
+
+class JobHandle(Future):
+    """
+    Future of a background job, resolving to the job once it has succeeded or failed.
+
+    It can be waited on like any concurrent.futures.Future, or awaited in async code.
+    """
+
+    def __init__(self, job_id: str, submission: Any = None):
+        """
+        Initialize a pending handle.
+
+        Args:
+            job_id: The ID of the background job
+            submission: The response of the request that started the job
+        """
+        super().__init__()
+        self.job_id = job_id
+        self.submission = submission
+
+    def __await__(self):
+        import asyncio
+
+        return asyncio.wrap_future(self).__await__()
+
+    def __repr__(self) -> str:
+        return f"<JobHandle {self.job_id} {self._state.lower()}>"
+
+class _Outstanding:
+    """Bookkeeping shared by the sync and async pollers."""
+
+    def __init__(self, policy: JobPolling):
+        self.policy = policy
+        self.handles: Dict[str, List[JobHandle]] = {}
+        self.trackers: Dict[str, JobTracker] = {}
+        self.errors = 0
+
+    def add(self, handle: JobHandle) -> None:
+        self.handles.setdefault(handle.job_id, []).append(handle)
+        self.trackers.setdefault(handle.job_id, JobTracker(self.policy))
+
+    def pending(self) -> List[str]:
+        for job_id in list(self.handles):
+            handles = [handle for handle in self.handles[job_id] if not handle.done()]
+            if handles:
+                self.handles[job_id] = handles
+            else:
+                del self.handles[job_id]
+                del self.trackers[job_id]
+        return list(self.handles)
+
+    def observe(self, jobs: Dict[str, Union["BackgroundJob", Exception]], now: float) -> float:
+        self.errors = 0
+        for job_id, job in jobs.items():
+            tracker = self.trackers.get(job_id)
+            if tracker is None:
+                continue
+            if isinstance(job, Exception):
+                _fail_all(self.handles.pop(job_id), job)
+                del self.trackers[job_id]
+                continue
+            tracker.observe(job, now)
+            if tracker.done:
+                for handle in self.handles.pop(job_id):
+                    try:
+                        handle.set_result(job)
+                    except InvalidStateError:
+                        pass
+                del self.trackers[job_id]
+        return min((tracker.delay for tracker in self.trackers.values()), default=0.0)
+
+    def retry(self, error: BaseException) -> float:
+        self.errors += 1
+        if self.errors < self.policy.max_errors:
+            return min(self.policy.min_interval * self.policy.backoff ** self.errors, self.policy.max_interval)
+        for handles in self.handles.values():
+            _fail_all(handles, error)
+        self.handles.clear()
+        self.trackers.clear()
+        self.errors = 0
+        return 0.0
+
+def _fail_all(handles: List[JobHandle], error: BaseException) -> None:
+    for handle in handles:
+        try:
+            handle.set_exception(error)
+        except InvalidStateError:
+            pass
+
+class JobPoller:
+    """Polls every outstanding JobHandle of a client from a single background thread."""
+
+    def __init__(
+        self,
+        poll: Callable[[List[str]], Dict[str, Union["BackgroundJob", Exception]]],
+        policy: Optional[JobPolling] = None,
+    ):
+        """
+        Initialize an idle poller; its thread starts with the first tracked job.
+
+        Args:
+            poll: Fetches the current state of several jobs, keyed by job ID; the error of a job
+                that could not be fetched on its own may stand in for it
+            policy: Polling intervals (defaults to JobPolling())
+        """
+        self.policy = policy or JobPolling()
+        self._poll = poll
+        self._outstanding = _Outstanding(self.policy)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, job_id: str, submission: Any = None) -> JobHandle:
+        """
+        Get a handle resolving once a background job has succeeded or failed.
+
+        A polling round that fails after the client's retries is retried with backoff; once
+        JobPolling.max_errors rounds have failed in a row, every outstanding handle fails with the
+        last error. An error fetching one job only fails the handles of that job.
+
+        Args:
+            job_id: The ID of the background job
+            submission: The response of the request that started the job
+
+        Returns:
+            The handle of the job
+        """
+        handle = JobHandle(job_id, submission)
+        with self._lock:
+            self._outstanding.add(handle)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="instantly-job-poller", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return handle
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                pending = self._outstanding.pending()
+                if not pending:
+                    self._thread = None
+                    return
+            started = time.monotonic()
+            try:
+                jobs = self._poll(pending)
+            except Exception as error:
+                with self._lock:
+                    delay = self._outstanding.retry(error)
+            else:
+                with self._lock:
+                    delay = self._outstanding.observe(jobs, time.monotonic())
+            self._wake.wait(delay)
+            self._wake.clear()
+            rest = self.policy.min_interval - (time.monotonic() - started)
+            if rest > 0:
+                time.sleep(rest)
+
+class AsyncJobPoller:
+    """Polls every outstanding JobHandle of an asynchronous client from a single task."""
+
+    def __init__(
+        self,
+        poll: Callable[[List[str]], Awaitable[Dict[str, Union["BackgroundJob", Exception]]]],
+        policy: Optional[JobPolling] = None,
+        on_start: Optional[Callable[["asyncio.Task"], None]] = None,
+    ):
+        """
+        Initialize an idle poller; its task starts with the first tracked job.
+
+        Args:
+            poll: Coroutine function fetching the current state of several jobs, keyed by job ID;
+                the error of a job that could not be fetched on its own may stand in for it
+            policy: Polling intervals (defaults to JobPolling())
+            on_start: Called with the polling task when it starts, e.g. to cancel it on close
+        """
+        self.policy = policy or JobPolling()
+        self._poll = poll
+        self._on_start = on_start
+        self._outstanding = _Outstanding(self.policy)
+        self._wake: Optional["asyncio.Event"] = None
+        self._task: Optional["asyncio.Task"] = None
+
+    def track(self, job_id: str, submission: Any = None) -> JobHandle:
+        """
+        Get an awaitable handle resolving once a background job has succeeded or failed.
+
+        Must be called from the event loop the polling task should run on. A polling round that
+        fails after the client's retries is retried with backoff; once JobPolling.max_errors
+        rounds have failed in a row, every outstanding handle fails with the last error. An error
+        fetching one job only fails the handles of that job.
+
+        Args:
+            job_id: The ID of the background job
+            submission: The response of the request that started the job
+
+        Returns:
+            The handle of the job
+        """
+        import asyncio
+
+        handle = JobHandle(job_id, submission)
+        self._outstanding.add(handle)
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+            if self._on_start is not None:
+                self._on_start(self._task)
+        self._wake.set()
+        return handle
+
+    async def _run(self) -> None:
+        import asyncio
+
+        while True:
+            pending = self._outstanding.pending()
+            if not pending:
+                return
+            started = time.monotonic()
+            try:
+                jobs = await self._poll(pending)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                delay = self._outstanding.retry(error)
+            else:
+                delay = self._outstanding.observe(jobs, time.monotonic())
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            rest = self.policy.min_interval - (time.monotonic() - started)
+            if rest > 0:
+                await asyncio.sleep(rest)
@@ -0,0 +1,186 @@
+"""
+Probabilistic filter of the leads that already exist in a campaign or list
+"""
+
+import hashlib
+import math
+import os
+import struct
+from typing import TYPE_CHECKING, List, Optional, Union
+
+if TYPE_CHECKING:
+    from instantly.models.lead import CreateLeadsResult
+
+_MAGIC = b"ILF1"
+_HEADER = struct.Struct("<QBQQd")
+
+def normalize_lead_email(email: str) -> str:
+    """Normalize the email of a lead so that spellings of the same address compare equal."""
+    return email.strip().lower()
+
+class LeadScopeError(ValueError):
+    """
+    A row passed to create_leads() targets another campaign or list than its filter covers.
+
+    Attributes:
+        index: Index of the row
+        result: What create_leads() did before it stopped, including the rows that were in flight
+    """
+
+    def __init__(self, message: str, index: int, result: "CreateLeadsResult"):
+        """
+        Initialize the error.
+
+        Args:
+            message: Description of the mismatch
+            index: Index of the row
+            result: The result of the upload so far, completed as the rows in flight finish
+        """
+        super().__init__(message)
+        self.index = index
+        self.result = result
+
+class LeadFilter:
+    """
+    Bloom filter of the normalized emails of the leads in one campaign or list.
+
+    Membership checks have no false negatives: an email that was added is always reported.
+    An email that was not added is reported with a probability of about error_rate while at
+    most capacity emails have been added, and more often beyond that.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        campaign: Optional[str] = None,
+        list_id: Optional[str] = None,
+    ):
+        """
+        Initialize an empty filter sized for capacity emails.
+
+        Args:
+            capacity: Number of emails the filter is sized for
+            error_rate: False positive rate at capacity, between 0 and 1
+            campaign: ID of the campaign the filter covers
+            list_id: ID of the lead list the filter covers
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.campaign = campaign
+        self.list_id = list_id
+        self.count = 0
+        self.nbits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.nhashes = max(1, round(self.nbits / capacity * math.log(2)))
+        self._bits = bytearray((self.nbits + 7) // 8)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, email: str) -> bool:
+        bits = self._bits
+        for position in self._positions(email):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, email: str) -> None:
+        """
+        Add the email of a lead.
+
+        Args:
+            email: The email, normalized before it is hashed
+        """
+        bits = self._bits
+        added = False
+        for position in self._positions(email):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Estimated false positive rate for the number of emails added so far."""
+        return (1 - math.exp(-self.nhashes * self.count / self.nbits)) ** self.nhashes
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter, including its scope."""
+        scope = f"{self.campaign or ''}\n{self.list_id or ''}".encode()
+        header = _HEADER.pack(self.nbits, self.nhashes, self.count, self.capacity, self.error_rate)
+        return _MAGIC + header + struct.pack("<H", len(scope)) + scope + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LeadFilter":
+        """
+        Deserialize a filter written by to_bytes().
+
+        Args:
+            data: The serialized filter
+
+        Returns:
+            The filter
+
+        Raises:
+            ValueError: If the data is not a serialized filter
+        """
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError("not a serialized LeadFilter")
+        offset = len(_MAGIC)
+        nbits, nhashes, count, capacity, error_rate = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        (scope_size,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        campaign, list_id = data[offset:offset + scope_size].decode().split("\n")
+        bits = data[offset + scope_size:]
+        if len(bits) != (nbits + 7) // 8:
+            raise ValueError("truncated LeadFilter")
+        lead_filter = cls.__new__(cls)
+        lead_filter.capacity = capacity
+        lead_filter.error_rate = error_rate
+        lead_filter.campaign = campaign or None
+        lead_filter.list_id = list_id or None
+        lead_filter.count = count
+        lead_filter.nbits = nbits
+        lead_filter.nhashes = nhashes
+        lead_filter._bits = bytearray(bits)
+        return lead_filter
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Write the filter to a file, replacing it atomically.
+
+        Args:
+            path: Where to write the filter
+        """
+        partial = f"{os.fspath(path)}.partial"
+        with open(partial, "wb") as file:
+            file.write(self.to_bytes())
+        os.replace(partial, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "LeadFilter":
+        """
+        Read a filter written by save().
+
+        Args:
+            path: The file to read
+
+        Returns:
+            The filter
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    def _positions(self, email: str) -> List[int]:
+        digest = hashlib.blake2b(normalize_lead_email(email).encode(), digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        second |= 1
+        nbits = self.nbits
+        return [(first + i * second) % nbits for i in range(self.nhashes)]
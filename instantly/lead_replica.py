@@ -0,0 +1,395 @@
+"""
+Local SQLite replica of the leads of an Instantly.ai workspace
+"""
+
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from instantly.models.lead import Lead, LeadSyncResult, ListLeadsRequest
+from instantly.models.lead_batch import to_epoch_micros
+from instantly.parsing import ModelView, ValidationMode, validate_json
+
+COLUMNS = (
+    "campaign", "list_id", "email", "status", "lt_interest_status", "verification_status",
+    "enrichment_status", "assigned_to", "uploaded_by_user", "upload_method",
+    "is_website_visitor", "esp_code",
+)
+"""Lead fields stored in their own columns, next to the full JSON of the lead."""
+
+FILTERS = {
+    "campaign": "campaign",
+    "list_id": "list_id",
+    "status": "status",
+    "interest_status": "lt_interest_status",
+    "verification_status": "verification_status",
+    "enrichment_status": "enrichment_status",
+    "assigned_to": "assigned_to",
+    "uploaded_by_user": "uploaded_by_user",
+    "upload_method": "upload_method",
+    "is_website_visitor": "is_website_visitor",
+    "esp_code": "esp_code",
+}
+"""Column filtered on by each ListLeadsRequest field in local queries."""
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS leads (
+    id TEXT PRIMARY KEY,
+    {", ".join(COLUMNS)},
+    timestamp_updated INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS marks (
+    scope TEXT PRIMARY KEY,
+    timestamp_updated INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL
+);
+""" + "".join(f"CREATE INDEX IF NOT EXISTS leads_{column} ON leads ({column});\n" for column in FILTERS.values())
+
+_UPSERT = (
+    f"INSERT INTO leads VALUES ({', '.join('?' * (len(COLUMNS) + 3))}) "
+    f"ON CONFLICT (id) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in COLUMNS + ("timestamp_updated", "data"))
+)
+
+_MARK = (
+    "INSERT INTO marks VALUES (?, ?, ?, ?) ON CONFLICT (scope) DO UPDATE SET "
+    "timestamp_updated = excluded.timestamp_updated, synced_at = excluded.synced_at, "
+    "full_synced_at = COALESCE(excluded.full_synced_at, marks.full_synced_at)"
+)
+
+_runs = itertools.count()
+
+def _scope_filter(campaign: Optional[str], list_id: Optional[str]) -> Tuple[str, List[str]]:
+    conditions = []
+    values = []
+    if campaign is not None:
+        conditions.append("campaign = ?")
+        values.append(str(campaign))
+    if list_id is not None:
+        conditions.append("list_id = ?")
+        values.append(str(list_id))
+    return " AND ".join(conditions) or "1", values
+
+class LeadReplica:
+    """
+    Leads stored in a SQLite file, kept up to date with LeadAPI.sync_leads().
+
+    Each campaign, list or the whole workspace has its own high-water mark: the latest
+    timestamp_updated seen by its last sync. Later syncs of that scope skip the leads not updated
+    since, without validating or writing them. The first sync of a scope is a full sync.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        """
+        Initialize the replica, creating the database file if needed.
+
+        Args:
+            path: Path of the SQLite database file
+            busy_timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("PRAGMA analysis_limit=1000")
+            self._connection.executescript(_SCHEMA)
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(marks)")}
+            if "full_synced_at" not in columns:
+                self._connection.execute("ALTER TABLE marks ADD COLUMN full_synced_at REAL")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+
+    @staticmethod
+    def scope(campaign: Optional[str] = None, list_id: Optional[str] = None) -> str:
+        """Name of the sync scope of a campaign and/or list, or of the whole workspace."""
+        parts = [
+            f"campaign:{str(campaign).lower()}" if campaign else "",
+            f"list:{str(list_id).lower()}" if list_id else "",
+        ]
+        return "|".join(part for part in parts if part) or "workspace"
+
+    def high_water_mark(self, scope: str) -> Optional[Tuple[int, float]]:
+        """
+        Get the high-water mark of a scope.
+
+        Args:
+            scope: The scope, as returned by scope()
+
+        Returns:
+            The latest timestamp_updated seen, in epoch microseconds, and the wall-clock time of
+            the sync; None if the scope was never synced
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT timestamp_updated, synced_at FROM marks WHERE scope = ?", (scope,)
+            ).fetchone()
+
+    def synced_within(
+        self, max_staleness: float, campaign: Optional[str] = None, list_id: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether the leads of a campaign and/or list were fully synced recently enough.
+
+        Only full syncs count, since incremental ones miss the leads deleted or moved out of the
+        scope. A sync of the workspace, or of the campaign or list alone, also covers the
+        narrower scope.
+
+        Args:
+            max_staleness: Maximum age in seconds of the last full sync covering the scope
+            campaign: ID of the campaign
+            list_id: ID of the lead list
+
+        Returns:
+            Whether a covering full sync started at most max_staleness seconds ago
+        """
+        scopes = {
+            self.scope(campaign, list_id), self.scope(campaign), self.scope(list_id=list_id), "workspace"
+        }
+        with self._lock:
+            synced_at = self._connection.execute(
+                f"SELECT MAX(full_synced_at) FROM marks WHERE scope IN ({', '.join('?' * len(scopes))})",
+                list(scopes),
+            ).fetchone()[0]
+        return synced_at is not None and time.time() - synced_at <= max_staleness
+
+    def get_lead(self, lead_id: str) -> Optional[Lead]:
+        """
+        Get a stored lead by ID.
+
+        Args:
+            lead_id: The unique identifier of the lead
+
+        Returns:
+            The lead, or None if the replica does not hold it
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM leads WHERE id = ?", (lead_id,)).fetchone()
+        return None if row is None else _tagged(Lead.model_validate_json(row[0]))
+
+    def list_leads(
+        self, params: Optional[ListLeadsRequest] = None, validate: ValidationMode = "full"
+    ) -> List[Lead]:
+        """
+        List the stored leads matching the filters, like LeadAPI.list_leads() without a request.
+
+        Leads are ordered by ID; params.limit and params.starting_after page through them.
+
+        Args:
+            params: Optional filtering parameters
+            validate: Validation mode ("full", "none" or "sample")
+
+        Returns:
+            At most params.limit leads
+        """
+        if params is None:
+            params = ListLeadsRequest()
+        return self._page(params, params.starting_after, params.limit or 100, validate)
+
+    def iter_leads(
+        self,
+        params: Optional[ListLeadsRequest] = None,
+        validate: ValidationMode = "full",
+        batch_size: int = 1000,
+    ) -> Iterator[Lead]:
+        """
+        Iterate over all stored leads matching the filters, ignoring params.limit.
+
+        Args:
+            params: Optional filtering parameters; starting_after sets where to start
+            validate: Validation mode ("full", "none" or "sample")
+            batch_size: Number of leads read from the database at a time
+
+        Yields:
+            Each matching lead, ordered by ID
+        """
+        if params is None:
+            params = ListLeadsRequest()
+        cursor = params.starting_after
+        while True:
+            leads = self._page(params, cursor, batch_size, validate)
+            yield from leads
+            if len(leads) < batch_size:
+                return
+            cursor = leads[-1].id
+
+    def count_leads(self, params: Optional[ListLeadsRequest] = None) -> int:
+        """
+        Count the stored leads matching the filters.
+
+        Args:
+            params: Optional filtering parameters
+
+        Returns:
+            The number of matching leads
+        """
+        where, values = _filters(params or ListLeadsRequest(), None)
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM leads WHERE {where}", values).fetchone()[0]
+
+    def _page(
+        self, params: ListLeadsRequest, starting_after: Optional[str], limit: int, validate: ValidationMode
+    ) -> List[Lead]:
+        where, values = _filters(params, starting_after)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT data FROM leads WHERE {where} ORDER BY id LIMIT ?", values + [limit]
+            ).fetchall()
+        leads = validate_json(List[Lead], "[" + ",".join(row[0] for row in rows) + "]", validate)
+        return [_tagged(lead) for lead in leads]
+
+    def start_sync(
+        self, campaign: Optional[str] = None, list_id: Optional[str] = None, full: bool = False
+    ) -> "LeadSyncRun":
+        """
+        Start syncing a scope; feed it the pages of its leads and finish it.
+
+        Args:
+            campaign: ID of the campaign synced
+            list_id: ID of the lead list synced
+            full: Whether to ignore the high-water mark and delete the leads no longer listed;
+                always the case for the first sync of the scope
+
+        Returns:
+            The sync in progress
+        """
+        return LeadSyncRun(self, campaign, list_id, full)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+class LeadSyncRun:
+    """One sync of a scope of a LeadReplica, fed page by page."""
+
+    def __init__(self, replica: LeadReplica, campaign: Optional[str], list_id: Optional[str], full: bool):
+        self.replica = replica
+        self.scope = LeadReplica.scope(campaign, list_id)
+        self.result = LeadSyncResult()
+        self._where, self._values = _scope_filter(campaign, list_id)
+        self._started = time.monotonic()
+        self._synced_at = time.time()
+        mark = None if full else replica.high_water_mark(self.scope)
+        self._since = None if mark is None else mark[0]
+        self._latest = self._since
+        self._seen = f"sync_seen_{next(_runs)}" if mark is None else None
+        if self._seen is not None:
+            with replica._lock:
+                replica._connection.execute(f"CREATE TEMP TABLE {self._seen} (id TEXT PRIMARY KEY)")
+
+    def apply(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Upsert the changed leads of one page in a single transaction.
+
+        Args:
+            items: Leads as decoded from the API's JSON
+        """
+        changed = {}
+        for item in items:
+            updated = to_epoch_micros(item["timestamp_updated"])
+            if self._latest is None or updated > self._latest:
+                self._latest = updated
+            if self._since is not None and updated < self._since:
+                self.result.unchanged += 1
+                continue
+            changed[str(item["id"])] = (updated, item)
+        connection = self.replica._connection
+        with self.replica._lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self._seen is not None:
+                    connection.executemany(
+                        f"INSERT OR IGNORE INTO {self._seen} VALUES (?)", ((str(item["id"]),) for item in items)
+                    )
+                stored = dict(connection.execute(
+                    f"SELECT id, timestamp_updated FROM leads WHERE id IN ({', '.join('?' * len(changed))})",
+                    list(changed),
+                ).fetchall()) if changed else {}
+                rows = []
+                for lead_id, (updated, item) in changed.items():
+                    if lead_id not in stored:
+                        self.result.inserted_ids.append(lead_id)
+                    elif stored[lead_id] != updated:
+                        self.result.updated_ids.append(lead_id)
+                    else:
+                        self.result.unchanged += 1
+                        continue
+                    rows.append(
+                        (lead_id, *(_column(item.get(name)) for name in COLUMNS), updated, json.dumps(item))
+                    )
+                connection.executemany(_UPSERT, rows)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        self.result.elapsed_seconds = time.monotonic() - self._started
+
+    def finish(self) -> LeadSyncResult:
+        """
+        Record the high-water mark of the scope, and for a full sync delete the leads not listed
+        and record when it started.
+
+        Returns:
+            What the sync inserted, updated and deleted
+        """
+        connection = self.replica._connection
+        with self.replica._lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self._seen is not None:
+                    self.result.deleted_ids = [row[0] for row in connection.execute(
+                        f"DELETE FROM leads WHERE {self._where} AND id NOT IN (SELECT id FROM {self._seen}) "
+                        "RETURNING id",
+                        self._values,
+                    ).fetchall()]
+                connection.execute(_MARK, (
+                    self.scope,
+                    0 if self._latest is None else self._latest,
+                    self._synced_at,
+                    self._synced_at if self._seen is not None else None,
+                ))
+                connection.execute("COMMIT")
+                if self.result.inserted_ids or self.result.deleted_ids:
+                    connection.execute("ANALYZE leads")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            finally:
+                if self._seen is not None:
+                    connection.execute(f"DROP TABLE IF EXISTS {self._seen}")
+        self.result.elapsed_seconds = time.monotonic() - self._started
+        return self.result
+
+def _filters(params: ListLeadsRequest, starting_after: Optional[str]) -> Tuple[str, List[Any]]:
+    conditions = []
+    values = []
+    for name, value in params.model_dump(exclude_none=True).items():
+        column = FILTERS.get(name)
+        if column is not None:
+            conditions.append(f"{column} = ?")
+            values.append(value)
+    if starting_after is not None:
+        conditions.append("id > ?")
+        values.append(starting_after)
+    return " AND ".join(conditions) or "1", values
+
+def _tagged(lead: Union[Lead, ModelView]) -> Union[Lead, ModelView]:
+    if isinstance(lead, ModelView):
+        lead._data["_source"] = "replica"
+    else:
+        lead._source = "replica"
+    return lead
+
+def _column(value: Any) -> Any:
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
@@ -40,6 +40,7 @@ class AccountCreate(BaseModel):
     """Model for creating a new account."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "email": "account@example.com",
@@ -59,6 +60,7 @@ class AccountUpdate(BaseModel):
     """Model for updating an existing account."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "first_name": "John",
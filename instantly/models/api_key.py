@@ -38,6 +38,7 @@ class APIKeyCreate(BaseModel):
     """Model for creating a new API key."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "Test API Key",
@@ -11,6 +11,7 @@ class InstantlyModel(BaseModel):
     """Base model for all Instantly.ai API entities."""
     
     model_config = ConfigDict(
+        defer_build=True,
         from_attributes=True,
         populate_by_name=True,
         extra="allow",
@@ -10,6 +10,9 @@ from instantly.models.base import InstantlyModel
 
 class AutoVariantSelect(BaseModel):
     """Auto variant selection settings."""
+
+    model_config = ConfigDict(defer_build=True)
+
     trigger: str = Field(..., description="The trigger for auto variant selection (e.g., 'click_rate')")
 
 class Campaign(InstantlyModel):
@@ -73,6 +76,7 @@ class CampaignCreate(BaseModel):
     """Model for creating a new campaign."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "My Campaign",
@@ -126,6 +130,7 @@ class CampaignUpdate(BaseModel):
     """Model for updating an existing campaign."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "Updated Campaign Name",
@@ -10,6 +10,9 @@ from instantly.models.base import InstantlyModel
 
 class EmailBody(BaseModel):
     """Email body content in both text and HTML formats."""
+
+    model_config = ConfigDict(defer_build=True)
+
     text: str = Field(..., description="Text content of the email")
     html: Optional[str] = Field(None, description="HTML content of the email")
 
@@ -92,6 +95,7 @@ class EmailCreate(BaseModel):
     """Model for creating a new email."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "subject": "Your inquiry",
@@ -132,6 +136,7 @@ class EmailUpdate(BaseModel):
     """Model for updating an existing email."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "subject": "Updated subject",
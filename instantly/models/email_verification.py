@@ -31,6 +31,7 @@ class EmailVerificationCreate(BaseModel):
     """Model for creating a new email verification."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "email": "test@example.com"
@@ -38,4 +39,16 @@ class EmailVerificationCreate(BaseModel):
         }
     )
 
-    email: EmailStr = Field(..., description="The email address to verify") 
\ No newline at end of file
+    email: EmailStr = Field(..., description="The email address to verify")
+
+class EmailVerificationFailure(BaseModel):
+    """An address whose verification request failed in verify_emails()."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    email: str = Field(description="The normalized address")
+    error: str = Field(description="Why the address could not be verified")
+    status_code: Optional[int] = Field(
+        default=None,
+        description="HTTP status of the failed request, if the API rejected it"
+    )
@@ -1,20 +1,24 @@
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List, Literal, Union
 from uuid import UUID
-from pydantic import BaseModel, Field, EmailStr, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, PrivateAttr, field_serializer
 
 class LeadStatusSummary(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     from_: Optional[str] = Field(alias="from", default=None)
     step_id: Optional[str] = None
     timestamp_executed: Optional[datetime] = None
 
 class LeadStatusSummarySubseq(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     from_: Optional[str] = Field(alias="from", default=None)
     step_id: Optional[str] = None
     timestamp_executed: Optional[datetime] = None
 
 class ListLeadsRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     limit: Optional[int] = Field(default=100, ge=1, le=100)
     starting_after: Optional[str] = Field(default=None)
@@ -49,7 +53,7 @@ class ListLeadsRequest(BaseModel):
         return str(v)
 
 class LeadCreateRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     email: EmailStr
     first_name: Optional[str] = None
@@ -69,7 +73,7 @@ class LeadCreateRequest(BaseModel):
         return str(v)
 
 class LeadUpdateRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -89,30 +93,30 @@ class LeadUpdateRequest(BaseModel):
         return str(v)
 
 class LeadMergeRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     primary_lead_id: str
     secondary_lead_id: str
 
 class LeadInterestStatusRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     lead_id: str
     status: Literal[1, 2, 3] = Field(description="1: Interested, 2: Not Interested, 3: Maybe Later")
 
 class LeadSubsequenceRemoveRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     lead_id: str
 
 class LeadBulkAssignRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     lead_ids: List[str]
     user_id: str
 
 class LeadMoveRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     search: Optional[str] = Field(
         default=None,
@@ -205,19 +209,19 @@ class LeadMoveRequest(BaseModel):
         return str(v)
 
 class LeadExportRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     lead_ids: List[str]
     app_id: str
 
 class LeadSubsequenceMoveRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     lead_id: str
     subsequence_id: str
 
 class Lead(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     id: str
     timestamp_created: datetime
@@ -268,6 +272,13 @@ class Lead(BaseModel):
     timestamp_last_touch: Optional[datetime] = None
     esp_code: Optional[int] = None
 
+    _source: Literal["api", "replica"] = PrivateAttr(default="api")
+
+    @property
+    def source(self) -> Literal["api", "replica"]:
+        """Where the lead was read from: "api", or "replica" when served by a local LeadReplica."""
+        return self._source
+
     @field_serializer("timestamp_created", "timestamp_updated", "last_step_timestamp_executed", "timestamp_added_subsequence", "timestamp_last_contact", "timestamp_last_open", "timestamp_last_reply", "timestamp_last_interest_change", "timestamp_last_click", "timestamp_last_touch", mode="plain")
     def serialize_datetime(cls, v: Optional[datetime]):
         if v is None:
@@ -281,7 +292,7 @@ class Lead(BaseModel):
         return str(v)
 
 class BulkAssignLeadsResult(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
     assigned_count: int
     user_id: UUID
     lead_ids: List[str]
@@ -292,8 +303,19 @@ class BulkAssignLeadsResult(BaseModel):
             return None
         return str(v)
 
+    @classmethod
+    def merge(cls, results: List["BulkAssignLeadsResult"]) -> "BulkAssignLeadsResult":
+        """Combine the results of the chunks of one bulk assignment."""
+        if len(results) == 1:
+            return results[0]
+        return cls.model_construct(
+            assigned_count=sum(result.assigned_count for result in results),
+            user_id=results[0].user_id,
+            lead_ids=[lead_id for result in results for lead_id in result.lead_ids],
+        )
+
 class MoveLeadsResult(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
 
     id: str = Field(
         description="Unique identifier for the background job"
@@ -334,6 +356,33 @@ class MoveLeadsResult(BaseModel):
         default=None,
         description="Data about the job, used to store any additional information we need to process the job"
     )
+    job_ids: List[str] = Field(
+        default_factory=list,
+        description="IDs of the background jobs of the move, one per request when the lead IDs were split"
+    )
+
+    @classmethod
+    def merge(cls, results: List["MoveLeadsResult"]) -> "MoveLeadsResult":
+        """
+        Combine the background jobs of the chunks of one move.
+
+        The combined job takes its ID and target from the first chunk, the lowest progress, and
+        a status that is failed if any chunk failed and success only once all have succeeded.
+        """
+        statuses = {result.status for result in results}
+        if "failed" in statuses:
+            status = "failed"
+        elif len(statuses) == 1:
+            status = statuses.pop()
+        else:
+            status = "in-progress"
+        return results[0].model_copy(update={
+            "progress": min(result.progress for result in results),
+            "status": status,
+            "created_at": min(result.created_at for result in results),
+            "updated_at": max(result.updated_at for result in results),
+            "job_ids": [result.id for result in results],
+        })
 
     @field_serializer("workspace_id", "user_id", "entity_id", mode="plain")
     def serialize_uuid(self, v: Optional[UUID]):
@@ -348,8 +397,79 @@ class MoveLeadsResult(BaseModel):
         return v.isoformat().replace('+00:00', 'Z')
 
 class ExportLeadsResult(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, defer_build=True)
     exported_count: int
     app_id: str
     lead_ids: List[str]
-    job_id: Optional[str] = None  # background job id if async 
\ No newline at end of file
+    job_id: Optional[str] = None  # background job id if async
+    job_ids: List[str] = []  # background job ids of every request of the export
+
+    @classmethod
+    def merge(cls, results: List["ExportLeadsResult"]) -> "ExportLeadsResult":
+        """Combine the results of the chunks of one export; job_id is the first of job_ids, if any."""
+        job_ids = [result.job_id for result in results if result.job_id]
+        return cls.model_construct(
+            exported_count=sum(result.exported_count for result in results),
+            app_id=results[0].app_id,
+            lead_ids=[lead_id for result in results for lead_id in result.lead_ids],
+            job_id=job_ids[0] if job_ids else None,
+            job_ids=job_ids,
+        )
+
+class LeadCreateFailure(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    index: int = Field(description="Position of the row in the input")
+    row: Union[LeadCreateRequest, Dict[str, Any]] = Field(description="The row as it was given")
+    error: str = Field(description="Why the lead was not created")
+    status_code: Optional[int] = Field(
+        default=None,
+        description="HTTP status of the failed request, if the API rejected it"
+    )
+
+class CreateLeadsResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    created_ids: List[str] = Field(
+        default_factory=list,
+        description="IDs of the created leads, in the order their requests completed"
+    )
+    failures: List[LeadCreateFailure] = Field(
+        default_factory=list,
+        description="Rows that could not be created"
+    )
+    skipped: List[int] = Field(
+        default_factory=list,
+        description="Indexes of the rows skipped because their email likely exists already"
+    )
+    elapsed_seconds: float = Field(default=0.0, description="Time spent creating the leads so far")
+
+    @property
+    def completed(self) -> int:
+        """Number of rows processed so far, created, failed or skipped."""
+        return len(self.created_ids) + len(self.failures) + len(self.skipped)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput of the upload so far."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.completed / self.elapsed_seconds
+
+class LeadSyncResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    inserted_ids: List[str] = Field(default_factory=list, description="IDs of the leads added to the replica")
+    updated_ids: List[str] = Field(
+        default_factory=list, description="IDs of the leads whose stored copy was replaced"
+    )
+    deleted_ids: List[str] = Field(
+        default_factory=list, description="IDs of the leads removed because a full sync no longer listed them"
+    )
+    unchanged: int = Field(default=0, description="Number of listed leads not updated since the last sync")
+    elapsed_seconds: float = Field(default=0.0, description="Time spent syncing")
+
+    @property
+    def scanned(self) -> int:
+        """Number of leads listed by the sync."""
+        return len(self.inserted_ids) + len(self.updated_ids) + self.unchanged
@@ -0,0 +1,216 @@
+"""
+Columnar storage for large numbers of leads
+"""
+
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from ..parsing import ModelView
+from .lead import Lead
+from .pagination import CursorPage
+
+# Stored in place of None in the integer columns; no real count, status or timestamp gets near it
+MISSING = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _column_kind(annotation: Any) -> str:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else Any
+    if annotation is bool:
+        return "flag"
+    if annotation is int:
+        return "int"
+    if annotation is datetime:
+        return "timestamp"
+    if annotation in (str, UUID):
+        return "string"
+    return "object"
+
+COLUMN_KINDS: Dict[str, str] = {
+    name: _column_kind(field.annotation) for name, field in Lead.model_fields.items()
+}
+"""Storage kind of every Lead field: "int", "timestamp", "flag", "string" or "object"."""
+
+_ALIASES: Dict[str, str] = {
+    field.alias: name for name, field in Lead.model_fields.items() if field.alias
+}
+
+def to_epoch_micros(value: Union[datetime, str]) -> int:
+    """
+    Convert a timestamp to microseconds since the Unix epoch.
+
+    Args:
+        value: A datetime, or an ISO 8601 string as returned by the API; naive values are UTC
+
+    Returns:
+        The timestamp as an integer
+    """
+    if isinstance(value, str):
+        value = _parse_timestamp(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+def from_epoch_micros(value: int) -> datetime:
+    """Convert microseconds since the Unix epoch back to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+def _parse_timestamp(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        from ..parsing import type_adapter
+        return type_adapter(datetime).validate_python(value)
+
+class LeadBatch:
+    """
+    Memory-compact, column-per-field container of leads.
+
+    Integer fields and timestamps (as epoch microseconds) live in typed arrays with MISSING in
+    place of None, string and UUID fields in lists of interned strings so repeated values such as
+    campaign and organization IDs are stored once, and the few nested fields as decoded JSON.
+    Leads are only materialized as Lead models when a row is accessed.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, leads: Iterable[Union[Lead, Dict[str, Any]]] = ()):
+        """
+        Initialize the batch.
+
+        Args:
+            leads: Leads to add, as Lead models or as lead objects decoded from the API's JSON
+        """
+        self._columns: Dict[str, Union[array, List[Any]]] = {}
+        for name, kind in COLUMN_KINDS.items():
+            if kind in ("int", "timestamp"):
+                self._columns[name] = array("q")
+            elif kind == "flag":
+                self._columns[name] = array("b")
+            else:
+                self._columns[name] = []
+        self._length = 0
+        self.extend(leads)
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Union[CursorPage, Dict[str, Any]]]) -> "LeadBatch":
+        """
+        Build a batch from pages of the leads list endpoint.
+
+        Args:
+            pages: CursorPages of Lead models or of decoded lead objects (as yielded by
+                LeadAPI.iter_lead_pages), or raw page objects with an "items" list
+
+        Returns:
+            A batch holding the items of every page, in order
+        """
+        batch = cls()
+        for page in pages:
+            batch.extend(page["items"] if isinstance(page, dict) else page.items)
+        return batch
+
+    def append(self, lead: Union[Lead, Dict[str, Any]]) -> None:
+        """
+        Add a lead to the end of the batch.
+
+        Args:
+            lead: A Lead model or ModelView, or a lead object decoded from the API's JSON
+        """
+        if isinstance(lead, BaseModel):
+            values = {name: getattr(lead, name) for name in COLUMN_KINDS}
+        elif isinstance(lead, dict):
+            values = {_ALIASES.get(key, key): value for key, value in lead.items()}
+        else:
+            values = {name: getattr(lead, name, None) for name in COLUMN_KINDS}
+        for name, kind in COLUMN_KINDS.items():
+            value = values.get(name)
+            column = self._columns[name]
+            if kind == "int":
+                column.append(MISSING if value is None else int(value))
+            elif kind == "timestamp":
+                column.append(MISSING if value is None else to_epoch_micros(value))
+            elif kind == "flag":
+                column.append(-1 if value is None else int(bool(value)))
+            elif kind == "string":
+                column.append(None if value is None else sys.intern(str(value)))
+            else:
+                if isinstance(value, ModelView):
+                    value = value.to_model()
+                column.append(value.model_dump(by_alias=True) if isinstance(value, BaseModel) else value)
+        self._length += 1
+
+    def extend(self, leads: Iterable[Union[Lead, Dict[str, Any]]]) -> None:
+        """Add several leads to the end of the batch."""
+        for lead in leads:
+            self.append(lead)
+
+    def column(self, name: str) -> Union[array, List[Any]]:
+        """
+        Get the storage of one field, for vectorized scans without materializing rows.
+
+        Args:
+            name: The Lead field name
+
+        Returns:
+            An array for "int", "timestamp" and "flag" columns (see COLUMN_KINDS), otherwise a list
+        """
+        return self._columns[name]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Get the fields of one lead as plain Python values.
+
+        Args:
+            index: Position of the lead; negative values count from the end
+
+        Returns:
+            A mapping of field name to value, with None for missing values
+        """
+        index = self._index(index)
+        values = {}
+        for name, kind in COLUMN_KINDS.items():
+            value = self._columns[name][index]
+            if kind in ("int", "timestamp"):
+                if value == MISSING:
+                    value = None
+                elif kind == "timestamp":
+                    value = from_epoch_micros(value)
+            elif kind == "flag":
+                value = None if value < 0 else bool(value)
+            values[name] = value
+        return values
+
+    def nbytes(self) -> int:
+        """Get an estimate of the memory held by the batch's columns, not counting shared strings."""
+        return sum(
+            column.itemsize * len(column) if isinstance(column, array) else sys.getsizeof(column)
+            for column in self._columns.values()
+        )
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("LeadBatch index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Lead:
+        return Lead.model_validate(self.row(index))
+
+    def __iter__(self) -> Iterator[Lead]:
+        for index in range(self._length):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"LeadBatch({self._length} leads)"
@@ -42,6 +42,7 @@ class LeadListCreate(BaseModel):
     """Model for creating a new lead list."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "My Lead List",
@@ -57,6 +58,7 @@ class LeadListUpdate(BaseModel):
     """Model for updating an existing lead list."""
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "Updated Lead List Name",
@@ -0,0 +1,27 @@
+"""
+Pagination models for the Instantly.ai API
+"""
+
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+T = TypeVar("T")
+
+class CursorPage(BaseModel, Generic[T]):
+    """One page of a cursor-paginated list endpoint."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    items: List[T] = Field(default_factory=list, description="The items on this page")
+    next_starting_after: Optional[str] = Field(
+        None, description="Cursor to pass as starting_after to fetch the next page"
+    )
+
+class OffsetPage(BaseModel, Generic[T]):
+    """One page of an offset or page-number paginated list endpoint."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    items: List[T] = Field(default_factory=list, description="The items on this page")
+    total: Optional[int] = Field(None, description="Total number of items across all pages, if reported")
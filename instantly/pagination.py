@@ -0,0 +1,287 @@
+"""
+Pagination helpers for list endpoints of the Instantly.ai API
+"""
+
+import math
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Deque, Iterator, Optional, TypeVar
+
+from instantly.models.pagination import CursorPage, OffsetPage
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+_DONE = object()
+
+class _Failure:
+    """Exception raised while prefetching, re-raised in the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+def iter_cursor(
+    fetch_page: Callable[[Optional[str]], CursorPage[T]],
+    starting_after: Optional[str] = None,
+    prefetch: int = 0,
+) -> Iterator[T]:
+    """
+    Lazily iterate over every item of a cursor-paginated endpoint.
+
+    Args:
+        fetch_page: Fetches the page that starts after the given cursor
+        starting_after: Cursor to start from, or None for the first page
+        prefetch: Number of pages to fetch ahead on a background thread, 0 to fetch on demand
+
+    Yields:
+        The items of each page
+    """
+    pages = iter_cursor_pages(fetch_page, starting_after)
+    if prefetch > 0:
+        pages = prefetched(pages, prefetch)
+    for page in pages:
+        yield from page.items
+
+def iter_cursor_pages(
+    fetch_page: Callable[[Optional[str]], CursorPage[T]],
+    starting_after: Optional[str] = None,
+) -> Iterator[CursorPage[T]]:
+    """
+    Lazily iterate over the pages of a cursor-paginated endpoint.
+
+    Args:
+        fetch_page: Fetches the page that starts after the given cursor
+        starting_after: Cursor to start from, or None for the first page
+
+    Yields:
+        Each page, fetching the next one only when needed
+    """
+    cursor = starting_after
+    while True:
+        page = fetch_page(cursor)
+        yield page
+        if not page.items or not page.next_starting_after:
+            return
+        cursor = page.next_starting_after
+
+def prefetched(source: Iterator[T], depth: int) -> Iterator[T]:
+    """
+    Consume an iterator on a background thread, staying up to depth values ahead of the caller.
+
+    Args:
+        source: The iterator to consume, typically one that performs network requests
+        depth: Maximum number of values buffered ahead of the caller
+
+    Yields:
+        The values of the source, in order; errors of the source are re-raised here
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(value) -> None:
+        while not stop.is_set():
+            try:
+                buffer.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        try:
+            for value in source:
+                if stop.is_set():
+                    return
+                put(value)
+            put(_DONE)
+        except BaseException as error:
+            put(_Failure(error))
+
+    threading.Thread(target=produce, name="instantly-prefetch", daemon=True).start()
+    try:
+        while True:
+            value = buffer.get()
+            if value is _DONE:
+                return
+            if isinstance(value, _Failure):
+                raise value.error
+            yield value
+    finally:
+        stop.set()
+
+async def aiter_cursor(
+    fetch_page: Callable[[Optional[str]], Awaitable[CursorPage[T]]],
+    starting_after: Optional[str] = None,
+    prefetch: int = 0,
+) -> AsyncIterator[T]:
+    """
+    Lazily iterate over every item of a cursor-paginated endpoint.
+
+    Args:
+        fetch_page: Coroutine function fetching the page that starts after the given cursor
+        starting_after: Cursor to start from, or None for the first page
+        prefetch: Number of pages to fetch ahead in a background task, 0 to fetch on demand
+
+    Yields:
+        The items of each page
+    """
+    pages = aiter_cursor_pages(fetch_page, starting_after)
+    if prefetch > 0:
+        pages = aprefetched(pages, prefetch)
+    async for page in pages:
+        for item in page.items:
+            yield item
+
+async def aiter_cursor_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[CursorPage[T]]],
+    starting_after: Optional[str] = None,
+) -> AsyncIterator[CursorPage[T]]:
+    """
+    Lazily iterate over the pages of a cursor-paginated endpoint.
+
+    Args:
+        fetch_page: Coroutine function fetching the page that starts after the given cursor
+        starting_after: Cursor to start from, or None for the first page
+
+    Yields:
+        Each page, fetching the next one only when needed
+    """
+    cursor = starting_after
+    while True:
+        page = await fetch_page(cursor)
+        yield page
+        if not page.items or not page.next_starting_after:
+            return
+        cursor = page.next_starting_after
+
+async def aprefetched(source: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+    """
+    Consume an async iterator in a background task, staying up to depth values ahead of the caller.
+
+    Args:
+        source: The async iterator to consume, typically one that performs network requests
+        depth: Maximum number of values buffered ahead of the caller
+
+    Yields:
+        The values of the source, in order; errors of the source are re-raised here
+    """
+    import asyncio
+
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for value in source:
+                await buffer.put(value)
+            await buffer.put(_DONE)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as error:
+            await buffer.put(_Failure(error))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            value = await buffer.get()
+            if value is _DONE:
+                return
+            if isinstance(value, _Failure):
+                raise value.error
+            yield value
+    finally:
+        task.cancel()
+
+def fan_out_pages(
+    fetch_page: Callable[[int], OffsetPage[T]],
+    page_size: int,
+    concurrency: int,
+) -> Iterator[T]:
+    """
+    Fetch all pages of an offset or page-number paginated endpoint concurrently.
+
+    The first page is fetched alone to learn the total. The remaining pages are then fetched with
+    at most concurrency requests in flight. Without a total, pages are fetched speculatively until
+    a short page marks the end.
+
+    Args:
+        fetch_page: Fetches the page with the given zero-based index
+        page_size: Number of items requested per page
+        concurrency: Maximum number of pages fetched at the same time
+
+    Yields:
+        The items of every page, in page order
+    """
+    first = fetch_page(0)
+    yield from first.items
+    page_count = _page_count(first, page_size)
+    if page_count == 1:
+        return
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="instantly-fan-out") as executor:
+        in_flight: Deque = deque()
+        next_index = 1
+        try:
+            while True:
+                while len(in_flight) < concurrency and (page_count is None or next_index < page_count):
+                    in_flight.append(executor.submit(fetch_page, next_index))
+                    next_index += 1
+                if not in_flight:
+                    return
+                page = in_flight.popleft().result()
+                yield from page.items
+                if page_count is None and len(page.items) < page_size:
+                    return
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+async def afan_out_pages(
+    fetch_page: Callable[[int], Awaitable[OffsetPage[T]]],
+    page_size: int,
+    concurrency: int,
+) -> AsyncIterator[T]:
+    """
+    Fetch all pages of an offset or page-number paginated endpoint concurrently.
+
+    Args:
+        fetch_page: Coroutine function fetching the page with the given zero-based index
+        page_size: Number of items requested per page
+        concurrency: Maximum number of pages fetched at the same time
+
+    Yields:
+        The items of every page, in page order
+    """
+    first = await fetch_page(0)
+    for item in first.items:
+        yield item
+    page_count = _page_count(first, page_size)
+    if page_count == 1:
+        return
+    import asyncio
+
+    in_flight: Deque[asyncio.Future] = deque()
+    next_index = 1
+    try:
+        while True:
+            while len(in_flight) < concurrency and (page_count is None or next_index < page_count):
+                in_flight.append(asyncio.ensure_future(fetch_page(next_index)))
+                next_index += 1
+            if not in_flight:
+                return
+            page = await in_flight.popleft()
+            for item in page.items:
+                yield item
+            if page_count is None and len(page.items) < page_size:
+                return
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+def _page_count(first: OffsetPage, page_size: int) -> Optional[int]:
+    if first.total is not None:
+        return max(1, math.ceil(first.total / page_size))
+    if len(first.items) < page_size:
+        return 1
+    return None
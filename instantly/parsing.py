@@ -0,0 +1,200 @@
+"""
+Response parsing for the Instantly.ai API
+"""
+
+from functools import lru_cache
+from itertools import count
+from typing import (
+    Any, Callable, Dict, List, Literal, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+)
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+
+T = TypeVar("T")
+
+ValidationMode = Literal["full", "none", "sample"]
+
+def validate_json(
+    model: Type[T],
+    content: Union[bytes, str],
+    mode: ValidationMode = "full",
+    sample_every: int = 100,
+) -> T:
+    """
+    Turn a raw JSON payload into a model.
+
+    Args:
+        model: A pydantic model class or any type supported by TypeAdapter, such as List[Lead]
+        content: The raw JSON response body
+        mode: "full" validates everything in one pass over the bytes, "none" returns read-only
+            ModelViews over the decoded JSON without validating it, "sample" does the same but
+            fully validates the first item of each list and every sample_every-th item after it
+        sample_every: Sampling interval for the "sample" mode
+
+    Returns:
+        The parsed value
+    """
+    if mode == "full":
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            return model.model_validate_json(content)
+        return type_adapter(model).validate_json(content)
+    validate_item = _sampler(sample_every) if mode == "sample" else _never
+    return construct(model, from_json(content), validate_item)
+
+@lru_cache(maxsize=None)
+def type_adapter(model: Any) -> TypeAdapter:
+    """Get a cached TypeAdapter, so its validator is built only once per type."""
+    return TypeAdapter(model)
+
+def construct(model: Any, data: Any, validate_item: Optional[Callable[[], bool]] = None) -> Any:
+    """
+    Build models from trusted JSON data without validating it.
+
+    Models inside lists and nested models become read-only ModelViews over the decoded JSON; a
+    top-level model, such as the page wrapper, is built with model_construct.
+
+    Args:
+        model: The model or type to build, such as CursorPage[Lead] or List[Lead]
+        data: Data decoded from a JSON response
+        validate_item: Called for each model inside a list; when it returns True that item is
+            fully validated before its view is built, so schema drift still raises
+
+    Returns:
+        The constructed value; values that are not models are returned as decoded from JSON
+    """
+    validate_item = validate_item or _never
+    kind, target = _shape(model)
+    if kind == "model" and isinstance(data, dict):
+        plan = _view_plan(target)
+        values = {}
+        for key, value in data.items():
+            field = plan.by_key.get(key)
+            if field is not None:
+                values[field[0]] = _view_value(field[4], field[5], value, validate_item)
+            elif plan.keep_extra:
+                values[key] = value
+        return target.model_construct(**values)
+    return _view_value(kind, target, data, validate_item)
+
+class ModelView:
+    """
+    Read-only view of a model over decoded JSON, built without validation.
+
+    Attributes resolve lazily and match the model's fields: values are returned as decoded from
+    JSON (e.g. timestamps stay strings), nested models as further views and missing fields as
+    the model's defaults. Private attributes are read from the data when set there and
+    otherwise keep their defaults, and properties are evaluated against the view.
+    """
+
+    __slots__ = ("_data", "_plan")
+
+    def __init__(self, model: Type[BaseModel], data: Dict[str, Any]):
+        """
+        Initialize the view.
+
+        Args:
+            model: The model class the data belongs to
+            data: The decoded JSON object of one item
+        """
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_plan", _view_plan(model))
+
+    def __getattr__(self, name: str) -> Any:
+        field = self._plan.by_name.get(name)
+        data = self._data
+        if field is None:
+            if self._plan.keep_extra and name in data:
+                return data[name]
+            private = self._plan.model.__private_attributes__.get(name)
+            if private is not None:
+                return data[name] if name in data else private.get_default()
+            member = getattr(self._plan.model, name, None)
+            if isinstance(member, property):
+                return member.fget(self)
+            raise AttributeError(f"{self._plan.model.__name__} view has no attribute {name!r}")
+        _, keys, default, factory, kind, target = field
+        for key in keys:
+            if key in data:
+                value = data[key]
+                return value if kind is None else _view_value(kind, target, value, _never)
+        return factory() if factory is not None else default
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self._plan.model.__name__} view is read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ModelView):
+            return self._plan.model is other._plan.model and self._data == other._data
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self._plan.model.__name__}View({self._data!r})"
+
+    def to_model(self) -> BaseModel:
+        """Fully validate the underlying data into the model."""
+        return self._plan.model.model_validate(self._data)
+
+def _view_value(kind: Any, target: Any, data: Any, validate_item: Callable[[], bool]) -> Any:
+    if kind == "model" and isinstance(data, dict):
+        return ModelView(target, data)
+    if kind == "list" and isinstance(data, list):
+        plan = _view_plan(target)
+        views = []
+        for item in data:
+            if validate_item():
+                target.model_validate(item)
+            if isinstance(item, dict):
+                view = object.__new__(ModelView)
+                object.__setattr__(view, "_data", item)
+                object.__setattr__(view, "_plan", plan)
+                item = view
+            views.append(item)
+        return views
+    return data
+
+class _ViewPlan:
+    """Field lookups of one model class, computed once so views resolve attributes cheaply."""
+
+    __slots__ = ("model", "by_name", "by_key", "keep_extra")
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.by_name: Dict[str, Tuple[Any, ...]] = {}
+        self.by_key: Dict[str, Tuple[Any, ...]] = {}
+        for name, field in model.model_fields.items():
+            keys = (field.alias, name) if field.alias and field.alias != name else (name,)
+            kind, target = _shape(field.annotation)
+            default = None if field.is_required() else field.default
+            entry = (name, keys, default, field.default_factory, kind, target)
+            self.by_name[name] = entry
+            for key in keys:
+                self.by_key[key] = entry
+        self.keep_extra = model.model_config.get("extra") == "allow"
+
+@lru_cache(maxsize=None)
+def _view_plan(model: Type[BaseModel]) -> _ViewPlan:
+    return _ViewPlan(model)
+
+def _shape(annotation: Any) -> Tuple[Any, Any]:
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None, None
+        return _shape(args[0])
+    if origin in (list, List):
+        (item,) = get_args(annotation) or (Any,)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return "list", item
+        return None, None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "model", annotation
+    return None, None
+
+def _sampler(every: int) -> Callable[[], bool]:
+    counter = count()
+    return lambda: next(counter) % every == 0
+
+def _never() -> bool:
+    return False
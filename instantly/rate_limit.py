@@ -0,0 +1,87 @@
+"""
+Client-side rate limiting for requests to the Instantly.ai API
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from instantly.endpoints import endpoint_group
+
+class RateLimit(BaseModel):
+    """Sustained request rate and burst size of a token bucket."""
+
+    model_config = ConfigDict(frozen=True)
+
+    requests_per_second: float = Field(..., gt=0, description="Sustained number of requests per second")
+    burst: int = Field(1, ge=1, description="Number of requests that may be sent back to back")
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations instead of blocking."""
+
+    def __init__(self, limit: RateLimit):
+        """
+        Initialize a full token bucket.
+
+        Args:
+            limit: The rate and burst size of the bucket
+        """
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt when the bucket is empty.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + elapsed * self.limit.requests_per_second,
+            )
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.limit.requests_per_second
+
+class RateLimiter:
+    """Paces requests with a shared bucket plus optional per-endpoint-group buckets."""
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        groups: Optional[Dict[str, RateLimit]] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            default: Limit for endpoints without a group limit, or None to leave them unpaced
+            groups: Limits keyed by endpoint group, such as "leads", "emails" or "analytics"
+        """
+        self._default = TokenBucket(default) if default else None
+        self._groups = {group: TokenBucket(limit) for group, limit in (groups or {}).items()}
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve a request slot for an endpoint.
+
+        Args:
+            endpoint: The endpoint about to be called
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        bucket = self._groups.get(endpoint_group(endpoint), self._default)
+        if bucket is None:
+            return 0.0
+        return bucket.reserve()
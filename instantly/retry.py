@@ -0,0 +1,113 @@
+"""
+Retry policy for requests to the Instantly.ai API
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+class RetryPolicy(BaseModel):
+    """Policy deciding whether and when a failed request is retried."""
+
+    model_config = ConfigDict(frozen=True)
+
+    max_attempts: int = Field(3, ge=1, description="Total attempts per request, including the first")
+    retry_statuses: FrozenSet[int] = Field(
+        default=frozenset({429, 502, 503, 504}),
+        description="HTTP status codes that are retried",
+    )
+    retry_connect_errors: bool = Field(True, description="Whether to retry requests that never reached the server")
+    backoff_base: float = Field(0.5, ge=0, description="Backoff ceiling in seconds for the first retry")
+    backoff_max: float = Field(30.0, ge=0, description="Upper bound in seconds for a single backoff")
+    total_timeout: Optional[float] = Field(
+        120.0, gt=0, description="Time budget in seconds for all attempts of one request"
+    )
+    respect_retry_after: bool = Field(True, description="Whether to wait as long as the Retry-After header asks")
+    idempotent_methods: FrozenSet[str] = Field(
+        default=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+        description="Methods that are retried without being marked safe",
+    )
+
+    def deadline(self) -> Optional[float]:
+        """Get the monotonic time after which no further attempt is started."""
+        if self.total_timeout is None:
+            return None
+        return time.monotonic() + self.total_timeout
+
+    def next_delay(
+        self,
+        error: httpx.HTTPError,
+        method: str,
+        attempt: int,
+        deadline: Optional[float],
+        retry_safe: bool = False,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            error: The error raised by the failed attempt
+            method: The HTTP method of the request
+            attempt: The number of the failed attempt, starting at 1
+            deadline: The monotonic deadline returned by deadline()
+            retry_safe: Whether a non-idempotent request was marked safe to repeat
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= self.max_attempts or not self._is_retryable(error, method, retry_safe):
+            return None
+        delay = self._retry_after(error)
+        if delay is None:
+            delay = self.backoff(attempt)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            return None
+        return delay
+
+    def backoff(self, attempt: int) -> float:
+        """Get a full-jitter exponential backoff for the given failed attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def _is_retryable(self, error: httpx.HTTPError, method: str, retry_safe: bool) -> bool:
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+            return self.retry_connect_errors
+        if not (retry_safe or method.upper() in self.idempotent_methods):
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(error, httpx.TransportError)
+
+    def _retry_after(self, error: httpx.HTTPError) -> Optional[float]:
+        if not self.respect_retry_after or not isinstance(error, httpx.HTTPStatusError):
+            return None
+        return parse_retry_after(error.response.headers.get("Retry-After"))
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
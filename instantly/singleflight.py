@@ -0,0 +1,122 @@
+"""
+Coalescing of identical concurrent requests to the Instantly.ai API
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+class _Call:
+    """A call in flight, awaited by the threads that joined it."""
+
+    __slots__ = ("done", "result", "error", "joined")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.joined = False
+
+class _AsyncCall:
+    """A coroutine in flight, awaited by the tasks that joined it."""
+
+    __slots__ = ("task", "joined")
+
+    def __init__(self, task: "asyncio.Future"):
+        self.task = task
+        self.joined = False
+
+class SingleFlight:
+    """Runs one call per key at a time, handing its outcome to every thread that asked for it."""
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T], share: Optional[Callable[[T], T]] = None) -> T:
+        """
+        Call fn, or wait for the call already running for the same key and share its outcome.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            fn: Produces the result
+            share: Copies the result for each caller when several joined the call, so that none
+                of them sees the changes of the others; without it they all get the same object
+
+        Returns:
+            The result of the call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.joined = True
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if share is None else share(call.result)
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result if share is None or not call.joined else share(call.result)
+
+class AsyncSingleFlight:
+    """Runs one coroutine per key at a time, handing its outcome to every task that asked for it."""
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[T]], share: Optional[Callable[[T], T]] = None
+    ) -> T:
+        """
+        Await fn(), or join the call already running for the same key and share its outcome.
+
+        The call runs in its own task, so cancelling one caller does not cancel it for the others.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            fn: Produces the awaitable result
+            share: Copies the result for each caller when several joined the call, so that none
+                of them sees the changes of the others; without it they all get the same object
+
+        Returns:
+            The result of the call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        import asyncio
+
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda done: self._finish(key, call))
+        else:
+            call.joined = True
+        result = await asyncio.shield(call.task)
+        return result if share is None or not call.joined else share(result)
+
+    def _finish(self, key: Hashable, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            call.task.exception()
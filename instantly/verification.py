@@ -0,0 +1,82 @@
+"""
+Helpers for bulk email verification with the Instantly.ai API
+"""
+
+import json
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from instantly.cache.backend import CacheBackend
+from instantly.models.email_verification import EmailVerification, EmailVerificationFailure
+
+PENDING = "pending"
+
+def normalize_email(email: str) -> Optional[str]:
+    """
+    Normalize an email address so that spellings of the same address compare equal.
+
+    Args:
+        email: The address as given
+
+    Returns:
+        The trimmed, lowercased address, or None if it is not of the form local@domain
+    """
+    email = email.strip().lower()
+    local, at, domain = email.rpartition("@")
+    if not at or not local or not domain or " " in email:
+        return None
+    return email
+
+def is_pending(result: Dict[str, Any]) -> bool:
+    """Whether a verification response is still waiting for its result."""
+    return result.get("verification_status", result.get("status")) == PENDING
+
+def verification_failure(email: str, error: httpx.HTTPError) -> EmailVerificationFailure:
+    """Record the failed verification request of a normalized address."""
+    status_code = error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None
+    return EmailVerificationFailure.model_construct(email=email, error=str(error), status_code=status_code)
+
+class VerificationCache:
+    """
+    Final verification results stored in a cache backend for a limited time.
+
+    Results are stored under their own group, which no endpoint maps to, so that the response
+    cache sharing the backend never drops them when it invalidates the email-verification group.
+    """
+
+    GROUP = "verification:results"
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Where results are stored
+            ttl: Seconds a result is reused before the address is verified again
+        """
+        self.backend = backend
+        self.ttl = ttl
+
+    def get(self, email: str) -> Optional[EmailVerification]:
+        """Get the cached result of a normalized address, or None if it must be verified."""
+        if self.ttl <= 0:
+            return None
+        stored = self.backend.get(self._key(email))
+        if stored is None:
+            return None
+        entry = json.loads(stored)
+        if time.time() - entry["verified_at"] >= self.ttl:
+            return None
+        return EmailVerification.model_validate(entry["result"])
+
+    def set(self, email: str, result: Dict[str, Any]) -> None:
+        """Cache the result of a normalized address, unless it is still pending."""
+        if self.ttl > 0 and not is_pending(result):
+            entry = {"verified_at": time.time(), "result": result}
+            self.backend.set(self._key(email), json.dumps(entry).encode(), self.ttl, self.GROUP)
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return f"verification:result:{email}"
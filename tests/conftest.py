@@ -2,11 +2,13 @@
 Test configuration and fixtures
 """
 
+import httpx
 import pytest
 from uuid import uuid4
 from datetime import datetime
 
-from instantly import InstantlyClient, InstantlyConfig
+from instantly import AsyncInstantlyClient, InstantlyClient, InstantlyConfig
+from instantly.retry import RetryPolicy
 
 @pytest.fixture
 def config():
@@ -15,6 +17,7 @@ def config():
         api_key="test-api-key",
         base_url="https://developer.instantly.ai/_mock/api/v2",
         timeout=30,
+        retry=RetryPolicy(max_attempts=1),
     )
 
 @pytest.fixture
@@ -22,6 +25,24 @@ def client(config):
     """Create a test client."""
     return InstantlyClient(config)
 
+@pytest.fixture
+def transport_client(config):
+    """Create clients whose requests are answered by a handler instead of the network."""
+    def make(handler):
+        client = InstantlyClient(config)
+        client._client = httpx.Client(
+            base_url=config.base_url,
+            headers=config.headers,
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+    return make
+
+@pytest.fixture
+def async_client(config):
+    """Create a test asynchronous client."""
+    return AsyncInstantlyClient(config)
+
 @pytest.fixture
 def account_data():
     """Sample account data for testing."""
@@ -94,6 +115,33 @@ def lead_data():
         "organization_id": "org_123"
     }
 
+@pytest.fixture
+def api_lead_data():
+    """Sample lead data as returned by the leads list endpoint."""
+    return {
+        "id": "0196eed7-b516-7082-bd55-11a1e14138ca",
+        "email": "test@example.com",
+        "first_name": "John",
+        "last_name": "Doe",
+        "company_name": "Test Company",
+        "company_domain": "example.com",
+        "status": 1,
+        "email_open_count": 2,
+        "email_reply_count": 0,
+        "email_click_count": 1,
+        "lt_interest_status": 1,
+        "verification_status": 1,
+        "esp_code": 1,
+        "upload_method": "api",
+        "organization": "0196eed7-b516-7082-bd55-11a2cf42ba3f",
+        "campaign": "0196eed7-b516-7082-bd55-11a3e14138ca",
+        "assigned_to": "0196eed7-b516-7082-bd55-11a4e14138ca",
+        "payload": {"role": "CTO"},
+        "timestamp_created": "2024-01-01T00:00:00Z",
+        "timestamp_updated": "2024-01-02T00:00:00Z",
+        "timestamp_last_contact": "2024-01-03T10:30:00Z"
+    }
+
 @pytest.fixture
 def background_job_data():
     """Sample background job data for testing."""
@@ -0,0 +1,80 @@
+"""
+Tests for the asynchronous client
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from instantly import AsyncInstantlyClient
+from instantly.async_api.custom_tag import AsyncCustomTagAPI
+from instantly.async_api.lead import AsyncLeadAPI
+from instantly.models.custom_tag import CustomTag
+
+def mock_transport(async_client, handler):
+    """Replace the underlying HTTP client with one backed by a mock transport."""
+    async_client._client = httpx.AsyncClient(
+        base_url=async_client.config.base_url,
+        headers=async_client.config.headers,
+        transport=httpx.MockTransport(handler),
+    )
+
+def test_async_client_initialization(async_client, config):
+    """Test asynchronous client initialization."""
+    assert async_client.config == config
+    assert isinstance(async_client._client, httpx.AsyncClient)
+    assert str(async_client._client.base_url).rstrip("/") == config.base_url.rstrip("/")
+    assert isinstance(async_client.leads, AsyncLeadAPI)
+    assert async_client._client.headers["Authorization"] == f"Bearer {config.api_key.get_secret_value()}"
+
+def test_async_get_custom_tag(async_client, custom_tag_data):
+    """Test an asynchronous API call through the mock transport."""
+    def handler(request):
+        assert request.url.path.endswith("/custom-tags/tag_123")
+        return httpx.Response(200, json=custom_tag_data)
+
+    mock_transport(async_client, handler)
+
+    async def run():
+        async with async_client:
+            return await AsyncCustomTagAPI(async_client).get_custom_tag("tag_123")
+
+    tag = asyncio.run(run())
+    assert isinstance(tag, CustomTag)
+    assert tag.id == custom_tag_data["id"]
+
+def test_async_requests_run_concurrently(async_client, custom_tag_data):
+    """Test that many requests are kept in flight on one event loop."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=custom_tag_data)
+
+    mock_transport(async_client, handler)
+    api = AsyncCustomTagAPI(async_client)
+
+    async def run():
+        async with async_client:
+            return await asyncio.gather(*(api.get_custom_tag(str(i)) for i in range(50)))
+
+    tags = asyncio.run(run())
+    assert len(tags) == 50
+    assert peak == 50
+
+def test_async_request_raises_on_error_status(async_client):
+    """Test that HTTP errors are raised."""
+    mock_transport(async_client, lambda request: httpx.Response(404, json={}))
+
+    async def run():
+        async with async_client:
+            await async_client.get("/missing")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
@@ -2,10 +2,21 @@
 Tests for the background job API endpoints
 """
 
+import asyncio
+import threading
+import httpx
 import pytest
-from unittest.mock import patch
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
+from instantly import AsyncInstantlyClient
 from instantly.api.background_job import BackgroundJobAPI
+from instantly.async_api.background_job import AsyncBackgroundJobAPI
+from instantly.jobs import JobHandle, JobPoller, JobPolling, JobTracker
+from instantly.models.background_job import BackgroundJob
+from instantly.models.lead import LeadMoveRequest
 
 def test_list_background_jobs(client, background_job_data):
     """Test listing background jobs."""
@@ -52,4 +63,234 @@ def test_get_background_job(client, background_job_data):
         
         mock_get.assert_called_once_with(
             f"/background-jobs/{background_job_data['id']}", params=None
-        ) 
\ No newline at end of file
+        )
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    """Replace the clock of the job waiter with one that only advances when it sleeps."""
+    clock = SimpleNamespace(now=0.0, sleeps=[])
+
+    def sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(
+        "instantly.api.background_job.time", SimpleNamespace(monotonic=lambda: clock.now, sleep=sleep)
+    )
+    return clock
+
+def job_states(background_job_data, job_id, *states):
+    """Build the successive states of a job from (progress, status) pairs."""
+    return [
+        {**background_job_data, "id": job_id, "progress": progress, "status": status}
+        for progress, status in states
+    ]
+
+def test_job_tracker_adapts_delay_to_progress():
+    """Test that the poll delay follows the progress rate and backs off while a job stalls."""
+    tracker = JobTracker(JobPolling(min_interval=1, max_interval=60, backoff=2))
+    job = lambda progress: BackgroundJob.model_construct(id="job", progress=progress, status="in-progress")
+
+    tracker.observe(job(0), now=0)
+    tracker.observe(job(20), now=10)
+    assert tracker.delay == 20
+
+    tracker.observe(job(20), now=30)
+    assert tracker.delay == 40
+    tracker.observe(job(20), now=70)
+    assert tracker.delay == 60
+
+def test_wait(client, background_job_data, fake_time):
+    """Test waiting for a job, reporting each change of progress."""
+    states = job_states(
+        background_job_data, "job_123", (0, "pending"), (0, "pending"), (50, "in-progress"), (100, "success")
+    )
+    progress = []
+    with patch.object(client, 'get', side_effect=states) as mock_get:
+        job = BackgroundJobAPI(client).wait("job_123", on_progress=lambda job: progress.append(job.progress))
+
+    assert job.status == "success"
+    assert progress == [0, 50, 100]
+    assert mock_get.call_count == 4
+    assert fake_time.sleeps[1] > fake_time.sleeps[0]
+
+def test_wait_all_polls_with_the_job_list(client, background_job_data, fake_time):
+    """Test that several jobs are polled through the job list instead of one request each."""
+    first = job_states(background_job_data, "job_1", (10, "in-progress"), (100, "success"))
+    second = job_states(background_job_data, "job_2", (10, "in-progress"), (100, "failed"))
+    pages = [{"items": [first[0], second[0]]}, {"items": [second[1], first[1]]}]
+    with patch.object(client, 'get', side_effect=pages) as mock_get:
+        jobs = BackgroundJobAPI(client).wait_all(["job_1", "job_2"])
+
+    assert [(job.id, job.status) for job in jobs] == [("job_1", "success"), ("job_2", "failed")]
+    assert all(call.args[0] == "/background-jobs" for call in mock_get.call_args_list)
+    assert mock_get.call_count == 2
+
+def test_wait_all_fetches_jobs_missing_from_the_list(client, background_job_data, fake_time):
+    """Test that jobs not found in the scanned pages are fetched individually."""
+    done = job_states(background_job_data, "job_1", (100, "success"))[0]
+    old = job_states(background_job_data, "job_old", (100, "success"))[0]
+
+    def get(path, params=None):
+        if path == "/background-jobs":
+            return {"items": [done]}
+        return old
+
+    with patch.object(client, 'get', side_effect=get) as mock_get:
+        jobs = BackgroundJobAPI(client).wait_all(["job_1", "job_old"])
+
+    assert [job.id for job in jobs] == ["job_1", "job_old"]
+    assert mock_get.call_args_list[-1].args[0] == "/background-jobs/job_old"
+
+def test_poll_follows_the_job_list_down_to_the_oldest_job(transport_client, background_job_data):
+    """Test that many jobs are polled with a few list pages once they have all been seen."""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def job(job_id, minutes_old):
+        created = (base - timedelta(minutes=minutes_old)).isoformat()
+        return {**background_job_data, "id": job_id, "status": "in-progress", "timestamp_created": created}
+
+    listed = [job(f"job_{index}", index) for index in range(1000)]
+    gone = job("job_gone", 150.5)
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path.rsplit("/", 1)[1])
+        if request.url.path.endswith("/background-jobs"):
+            after = request.url.params.get("starting_after")
+            start = 0 if after is None else int(after.split("_")[1]) + 1
+            items = listed[start:start + 100]
+            return httpx.Response(200, json={"items": items, "next_starting_after": items[-1]["id"]})
+        return httpx.Response(200, json=gone)
+
+    api = BackgroundJobAPI(transport_client(handler))
+    job_ids = [f"job_{index}" for index in range(250)] + ["job_gone"]
+
+    first = api.poll(job_ids)
+    first_requests, requests[:] = list(requests), []
+    second = api.poll(job_ids)
+
+    assert set(first) == set(second) == set(job_ids)
+    assert first_requests.count("background-jobs") == 2
+    assert len(first_requests) == 2 + 51
+    assert requests == ["background-jobs"] * 3 + ["job_gone"]
+
+def test_wait_times_out(client, background_job_data, fake_time):
+    """Test that waiting past the timeout raises TimeoutError."""
+    running = job_states(background_job_data, "job_123", (10, "in-progress"))[0]
+    with patch.object(client, 'get', return_value=running):
+        with pytest.raises(TimeoutError):
+            BackgroundJobAPI(client).wait("job_123", timeout=5)
+
+    assert fake_time.now == pytest.approx(5)
+
+def test_async_wait(async_client, background_job_data, monkeypatch):
+    """Test waiting for a job with the asynchronous client."""
+    monkeypatch.setattr("instantly.async_api.background_job.asyncio.sleep", AsyncMock())
+    states = job_states(background_job_data, "job_123", (40, "in-progress"), (100, "success"))
+    with patch.object(async_client, 'get', AsyncMock(side_effect=states)):
+        job = asyncio.run(AsyncBackgroundJobAPI(async_client).wait("job_123"))
+
+    assert job.status == "success"
+
+def test_job_poller_shares_one_poll_loop(background_job_data):
+    """Test that all outstanding handles are polled together, one request per round."""
+    rounds = []
+    seen = Counter()
+    tracked = threading.Event()
+
+    def poll(job_ids):
+        tracked.wait(5)
+        rounds.append(sorted(job_ids))
+        seen.update(job_ids)
+        return {
+            job_id: BackgroundJob.model_validate({
+                **background_job_data, "id": job_id, "progress": 50 * seen[job_id],
+                "status": "success" if seen[job_id] >= 2 else "in-progress",
+            })
+            for job_id in job_ids
+        }
+
+    poller = JobPoller(poll, JobPolling(min_interval=0.01, max_interval=0.05))
+    handles = [poller.track(f"job_{index}") for index in range(100)]
+    tracked.set()
+
+    jobs = [handle.result(timeout=5) for handle in handles]
+
+    assert [job.id for job in jobs] == [f"job_{index}" for index in range(100)]
+    assert all(job.status == "success" for job in jobs)
+    assert len(rounds) <= 3
+
+def test_job_poller_retries_failed_rounds(background_job_data):
+    """Test that a failing polling round is retried and handles fail only once rounds keep failing."""
+    results = [RuntimeError("down"), RuntimeError("down"), "success"]
+
+    def poll(job_ids):
+        result = results.pop(0) if results else RuntimeError("down")
+        if isinstance(result, Exception):
+            raise result
+        return {job_id: BackgroundJob.model_validate({**background_job_data, "id": job_id, "status": result})
+                for job_id in job_ids}
+
+    policy = JobPolling(min_interval=0.01, max_interval=0.05, max_errors=3)
+    poller = JobPoller(poll, policy)
+
+    assert poller.track("job_1").result(timeout=5).status == "success"
+
+    handle = poller.track("job_2")
+    with pytest.raises(RuntimeError, match="down"):
+        handle.result(timeout=5)
+
+def test_job_poller_fails_only_the_job_that_could_not_be_fetched(transport_client, background_job_data):
+    """Test that an error fetching one job fails its handle while the other jobs carry on."""
+    finished = {**background_job_data, "id": "job_ok", "progress": 100, "status": "success"}
+
+    def handler(request):
+        if request.url.path.endswith("/background-jobs"):
+            return httpx.Response(200, json={"items": [finished]})
+        if request.url.path.endswith("/job_ok"):
+            return httpx.Response(200, json=finished)
+        return httpx.Response(404, json={"message": "not found"})
+
+    client = transport_client(handler)
+    missing, found = client.background_jobs.track("job_gone"), client.background_jobs.track("job_ok")
+
+    assert found.result(timeout=5).status == "success"
+    with pytest.raises(httpx.HTTPStatusError):
+        missing.result(timeout=5)
+
+def test_move_leads_as_handle(transport_client, background_job_data):
+    """Test that move_leads can return a future resolving to the finished job."""
+    finished = {
+        **background_job_data, "progress": 100, "status": "success",
+        "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-01T00:00:00Z",
+    }
+
+    def handler(request):
+        return httpx.Response(200, json=finished)
+
+    client = transport_client(handler)
+    [handle] = client.leads.move_leads(LeadMoveRequest(ids=["a"]), as_handle=True)
+
+    assert isinstance(handle, JobHandle)
+    assert handle.job_id == background_job_data["id"]
+    assert handle.submission.id == background_job_data["id"]
+    assert handle.result(timeout=5).status == "success"
+
+def test_async_move_leads_as_handle(config, background_job_data):
+    """Test that handles can be awaited with the asynchronous client."""
+    finished = {
+        **background_job_data, "progress": 100, "status": "success",
+        "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-01T00:00:00Z",
+    }
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=finished)),
+    )
+
+    async def run():
+        [handle] = await client.leads.move_leads(LeadMoveRequest(ids=["a"]), as_handle=True)
+        return await handle
+
+    assert asyncio.run(run()).status == "success"
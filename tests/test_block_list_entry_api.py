@@ -2,10 +2,15 @@
 Tests for the block list entry API endpoints
 """
 
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import patch
 
 from instantly.api.block_list_entry import BlockListEntryAPI
+from instantly.async_api.block_list_entry import AsyncBlockListEntryAPI
 
 def test_create_block_list_entry(client, block_list_entry_data):
     """Test creating a block list entry."""
@@ -73,4 +78,79 @@ def test_delete_block_list_entry(client, block_list_entry_data):
         
         mock_delete.assert_called_once_with(
             f"/block-lists-entries/{block_list_entry_data['id']}"
-        ) 
\ No newline at end of file
+        ) 
+def _entry(block_list_entry_data, entry_id, type, value, expires_at=None):
+    return {**block_list_entry_data, "id": entry_id, "type": type, "value": value, "expires_at": expires_at}
+
+def test_block_list_index_matches_emails_and_subdomains(client, block_list_entry_data):
+    """Test that blocked emails match exactly and blocked domains match their subdomains."""
+    entries = [
+        _entry(block_list_entry_data, "b1", "email", "Blocked@Example.org"),
+        _entry(block_list_entry_data, "b2", "domain", "@Competitor.com"),
+        _entry(block_list_entry_data, "b3", "domain", "*.internal.example.net"),
+    ]
+    with patch.object(client, 'get') as mock_get:
+        mock_get.return_value = {"items": entries}
+        index = BlockListEntryAPI(client).sync_block_list_index()
+
+    assert index.is_blocked([
+        "blocked@example.org",
+        " BLOCKED@example.org ",
+        "other@example.org",
+        "sales@competitor.com",
+        "sales@eu.mail.competitor.com",
+        "sales@notcompetitor.com",
+        "dev@internal.example.net",
+        "dev@example.net",
+    ]) == [True, True, False, True, True, False, True, False]
+    assert "x@competitor.com" in index
+    assert len(index) == 3
+
+def test_block_list_index_honors_expires_at(client, block_list_entry_data):
+    """Test that expired entries are ignored and entries stop matching once they expire."""
+    soon = datetime.now(timezone.utc) + timedelta(seconds=0.05)
+    entries = [
+        _entry(block_list_entry_data, "b1", "email", "old@example.com", "2000-01-01T00:00:00Z"),
+        _entry(block_list_entry_data, "b2", "domain", "example.com", soon.isoformat()),
+        _entry(block_list_entry_data, "b3", "domain", "example.com"),
+        _entry(block_list_entry_data, "b4", "domain", "temporary.com", soon.isoformat()),
+    ]
+    with patch.object(client, 'get') as mock_get:
+        mock_get.return_value = {"items": entries}
+        index = BlockListEntryAPI(client).sync_block_list_index()
+
+    assert index.is_blocked(["a@temporary.com", "a@example.com"]) == [True, True]
+    time.sleep(0.1)
+    assert index.is_blocked(["a@temporary.com", "a@example.com", "old@other.com"]) == [False, True, False]
+
+def test_block_list_index_refreshes_incrementally(client, block_list_entry_data):
+    """Test that a refresh lists only entries after the cursor, and a full sync replaces the index."""
+    api = BlockListEntryAPI(client)
+    with patch.object(client, 'get') as mock_get:
+        mock_get.return_value = {"items": [_entry(block_list_entry_data, "b1", "domain", "one.com")]}
+        index = api.sync_block_list_index()
+        mock_get.return_value = {"items": [_entry(block_list_entry_data, "b2", "domain", "two.com")]}
+        assert api.sync_block_list_index(index) is index
+        mock_get.assert_called_with("/block-lists-entries", params={"limit": 100, "starting_after": "b1"})
+
+        assert index.is_blocked(["a@one.com", "a@two.com"]) == [True, True]
+
+        mock_get.return_value = {"items": [_entry(block_list_entry_data, "b2", "domain", "two.com")]}
+        api.sync_block_list_index(index, full=True)
+        mock_get.assert_called_with("/block-lists-entries", params={"limit": 100})
+
+    assert index.is_blocked(["a@one.com", "a@two.com"]) == [False, True]
+    assert index.cursor == "b2"
+
+def test_async_sync_block_list_index(async_client, block_list_entry_data):
+    """Test that the async client builds the same index."""
+    async def get(path, params=None):
+        return {"items": [_entry(block_list_entry_data, "b1", "domain", "example.com")]}
+
+    async def run():
+        with patch.object(async_client, 'get', side_effect=get):
+            return await AsyncBlockListEntryAPI(async_client).sync_block_list_index()
+
+    index = asyncio.run(run())
+
+    assert index.is_blocked(["a@mail.example.com", "a@example.org"]) == [True, False]
@@ -0,0 +1,457 @@
+"""
+Tests for response caching
+"""
+
+import asyncio
+import json
+import threading
+import time
+import timeit
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from instantly import InstantlyClient, InstantlyConfig
+from instantly.api.campaign import CampaignAPI
+from instantly.api.custom_tag import CustomTagAPI
+from instantly.cache import CachePolicy, MemoryCache, ResponseCache, StaleWhileRevalidate
+from instantly.cache.sqlite import SQLiteCache
+from instantly.models.campaign import Campaign
+from instantly.models.pagination import CursorPage
+from instantly.parsing import validate_json
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the monotonic clock seen by the cache."""
+    now = [1000.0]
+    monkeypatch.setattr("instantly.cache.memory.time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+def test_memory_cache_expires_entries(clock):
+    """Test that entries are dropped once their TTL has passed."""
+    cache = MemoryCache()
+    cache.set("a", b"1", ttl=10)
+
+    assert cache.get("a") == b"1"
+    clock[0] += 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_memory_cache_evicts_least_recently_used_by_count():
+    """Test that the least recently used entry is evicted when the cache is full."""
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", b"1", ttl=60)
+    cache.set("b", b"2", ttl=60)
+    cache.get("a")
+    cache.set("c", b"3", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+def test_memory_cache_evicts_by_bytes():
+    """Test that entries are evicted to stay within the byte budget."""
+    cache = MemoryCache(max_bytes=9)
+    cache.set("a", b"1234", ttl=60)
+    cache.set("b", b"5678", ttl=60)
+
+    assert cache.get("a") is None
+    assert cache.nbytes == 5
+
+    cache.set("c", b"too large for the cache", ttl=60)
+    assert cache.get("c") is None
+
+def test_memory_cache_invalidates_groups():
+    """Test that invalidating a group only drops its own entries."""
+    cache = MemoryCache()
+    cache.set("a", b"1", ttl=60, group="campaigns")
+    cache.set("b", b"2", ttl=60, group="accounts")
+
+    cache.invalidate_group("campaigns")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+
+def test_cache_policy_ttls():
+    """Test that only the configured groups are cached, with per-group TTLs."""
+    policy = CachePolicy(ttl=30, group_ttls={"accounts": 300})
+
+    assert policy.ttl_for("/campaigns/c1") == 30
+    assert policy.ttl_for("/api/v2/accounts/a1") == 300
+    assert policy.ttl_for("/leads/l1") is None
+    assert policy.ttl_for("/campaigns/c1/analytics") is None
+
+def test_cache_key_ignores_prefix_and_param_order():
+    """Test that equivalent requests share a cache key."""
+    assert ResponseCache.key("/api/v2/accounts", {"limit": 1, "skip": 2}) == ResponseCache.key(
+        "/accounts", {"skip": 2, "limit": 1}
+    )
+
+def test_write_during_fetch_is_not_cached():
+    """Test that a response fetched before a write to its group is not stored."""
+    cache = ResponseCache(CachePolicy())
+    generation = cache.generation("/campaigns/c1")
+    cache.invalidate("/campaigns/c1")
+
+    cache.set("/campaigns/c1", None, b"{}", generation)
+
+    assert cache.get("/campaigns/c1") is None
+
+@pytest.fixture
+def cached_client(config, transport_client, custom_tag_data):
+    """Create a caching client whose requests are counted by method."""
+    config.cache = CachePolicy()
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(200, json=custom_tag_data)
+
+    client = transport_client(handler)
+    client.calls = calls
+    return client
+
+def test_repeated_gets_are_served_from_cache(cached_client):
+    """Test that a cached GET only reaches the network once."""
+    api = CustomTagAPI(cached_client)
+
+    first = api.get_custom_tag("tag_123")
+    second = api.get_custom_tag("tag_123")
+
+    assert first == second
+    assert cached_client.calls == ["GET"]
+
+def test_writes_invalidate_the_resource(cached_client):
+    """Test that updating or deleting a resource drops its cached responses."""
+    api = CustomTagAPI(cached_client)
+
+    api.get_custom_tag("tag_123")
+    api.update_custom_tag("tag_123", name="Renamed")
+    api.get_custom_tag("tag_123")
+
+    assert cached_client.calls == ["GET", "PATCH", "GET"]
+
+def test_uncached_groups_always_reach_the_network(cached_client):
+    """Test that endpoints outside the cached groups are not cached."""
+    cached_client.get("/leads/l1")
+    cached_client.get("/leads/l1")
+
+    assert cached_client.calls == ["GET", "GET"]
+
+def test_memory_cache_reports_stale_entries(clock):
+    """Test that entries past stale_after are still served but flagged as stale."""
+    cache = MemoryCache()
+    cache.set("a", b"1", ttl=100, stale_after=10)
+
+    assert cache.lookup("a") == (b"1", False)
+    clock[0] += 10
+    assert cache.lookup("a") == (b"1", True)
+    clock[0] += 90
+    assert cache.lookup("a") is None
+
+@pytest.fixture
+def analytics_client(config, transport_client, clock):
+    """Create a client caching analytics with a soft TTL of 10s and a hard TTL of 100s."""
+    config.cache = CachePolicy(
+        stale_while_revalidate={"analytics": StaleWhileRevalidate(soft_ttl=10, hard_ttl=100)}
+    )
+    responses = iter(range(1, 100))
+    refreshed = threading.Event()
+
+    def handler(request):
+        refreshed.set()
+        return httpx.Response(200, json={"version": next(responses)})
+
+    client = transport_client(handler)
+    client.refreshed = refreshed
+    return client
+
+def test_stale_analytics_are_served_while_refreshing(analytics_client, clock):
+    """Test that a stale response is returned at once and refreshed in the background."""
+    assert analytics_client.get("/campaigns/analytics/overview") == {"version": 1}
+    analytics_client.refreshed.clear()
+    clock[0] += 10
+
+    assert analytics_client.get("/campaigns/analytics/overview") == {"version": 1}
+    assert analytics_client.refreshed.wait(5)
+    for _ in range(100):
+        if analytics_client.get("/campaigns/analytics/overview") == {"version": 2}:
+            break
+        time.sleep(0.01)
+    assert analytics_client.get("/campaigns/analytics/overview") == {"version": 2}
+
+def test_expired_analytics_block_on_a_fetch(analytics_client, clock):
+    """Test that responses past the hard TTL are fetched before returning."""
+    analytics_client.get("/campaigns/c1/analytics")
+    clock[0] += 100
+
+    assert analytics_client.get("/campaigns/c1/analytics") == {"version": 2}
+
+def test_async_stale_analytics_are_refreshed_in_a_task(config, clock):
+    """Test that the asynchronous client refreshes stale responses in a background task."""
+    from instantly import AsyncInstantlyClient
+
+    config.cache = CachePolicy(
+        stale_while_revalidate={"analytics": StaleWhileRevalidate(soft_ttl=10, hard_ttl=100)}
+    )
+    client = AsyncInstantlyClient(config)
+    responses = iter(range(1, 100))
+    client._client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"version": next(responses)})),
+    )
+
+    async def run():
+        await client.get("/campaigns/analytics/overview")
+        clock[0] += 10
+        stale = await client.get("/campaigns/analytics/overview")
+        await asyncio.gather(*client._background_tasks)
+        return stale, await client.get("/campaigns/analytics/overview")
+
+    assert asyncio.run(run()) == ({"version": 1}, {"version": 2})
+
+@pytest.fixture
+def wall_clock(monkeypatch):
+    """Control the wall clock seen by the SQLite cache."""
+    now = [1000.0]
+    monkeypatch.setattr("instantly.cache.sqlite.time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    """Path of a fresh SQLite cache database."""
+    return str(tmp_path / "cache.db")
+
+def test_sqlite_cache_expires_and_reports_stale_entries(sqlite_path, wall_clock):
+    """Test that SQLite entries go stale after stale_after and are dropped after their TTL."""
+    cache = SQLiteCache(sqlite_path)
+    cache.set("a", b"1", ttl=100, stale_after=10)
+
+    assert cache.lookup("a") == (b"1", False)
+    wall_clock[0] += 10
+    assert cache.lookup("a") == (b"1", True)
+    wall_clock[0] += 90
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_sqlite_cache_evicts_least_recently_used(sqlite_path, wall_clock):
+    """Test that the SQLite cache evicts the least recently used entries by count and bytes."""
+    cache = SQLiteCache(sqlite_path, max_entries=2, max_bytes=9)
+    cache.set("a", b"1", ttl=60)
+    cache.set("b", b"2", ttl=60)
+    wall_clock[0] += 1
+    cache.get("a")
+    cache.set("c", b"3", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+
+    cache.set("d", b"12345678", ttl=60)
+    assert len(cache) == 1
+    assert cache.nbytes == 9
+    assert cache.get("d") == b"12345678"
+
+def test_sqlite_cache_invalidates_groups(sqlite_path):
+    """Test that invalidating a group only drops its own SQLite entries."""
+    cache = SQLiteCache(sqlite_path)
+    cache.set("a", b"1", ttl=60, group="campaigns")
+    cache.set("b", b"2", ttl=60, group="accounts")
+
+    cache.invalidate_group("campaigns")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+    assert cache.nbytes == 2
+
+def test_sqlite_cache_is_shared_between_instances(sqlite_path):
+    """Test that caches opened on the same file see each other's writes."""
+    writer = SQLiteCache(sqlite_path)
+    reader = SQLiteCache(sqlite_path)
+
+    writer.set("a", b"1", ttl=60, group="campaigns")
+    assert reader.get("a") == b"1"
+
+    reader.invalidate_group("campaigns")
+    assert writer.get("a") is None
+
+def test_sqlite_cache_compact_drops_expired_entries(sqlite_path, wall_clock):
+    """Test that compact() removes expired entries."""
+    cache = SQLiteCache(sqlite_path)
+    cache.set("a", b"1", ttl=10)
+    cache.set("b", b"2", ttl=60)
+    wall_clock[0] += 10
+
+    cache.compact()
+
+    assert len(cache) == 1
+    assert cache.get("b") == b"2"
+
+def test_client_uses_the_configured_cache_backend(config, transport_client, custom_tag_data, sqlite_path):
+    """Test that a client with a cache backend stores responses in it."""
+    config.cache = CachePolicy()
+    config.cache_backend = SQLiteCache(sqlite_path)
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(200, json=custom_tag_data)
+
+    api = CustomTagAPI(transport_client(handler))
+    api.get_custom_tag("tag_123")
+    fresh_api = CustomTagAPI(transport_client(handler))
+    fresh_api.get_custom_tag("tag_123")
+
+    assert calls == ["GET"]
+    assert len(SQLiteCache(sqlite_path)) == 1
+
+def test_async_client_queries_sqlite_off_the_event_loop(config, custom_tag_data, sqlite_path):
+    """Test that the asynchronous client makes the blocking calls of a SQLite backend from worker threads."""
+    from instantly import AsyncInstantlyClient
+
+    threads = set()
+
+    class RecordingCache(SQLiteCache):
+        def lookup(self, key):
+            threads.add(threading.get_ident())
+            return super().lookup(key)
+
+        def set(self, *args, **kwargs):
+            threads.add(threading.get_ident())
+            super().set(*args, **kwargs)
+
+    config.cache = CachePolicy()
+    config.cache_backend = RecordingCache(sqlite_path)
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=custom_tag_data)),
+    )
+
+    async def run():
+        await client.get("/custom-tags/tag_123")
+        await client.get("/custom-tags/tag_123")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    assert threads and loop_thread not in threads
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_clients_of_different_workspaces_do_not_share_entries(config, custom_tag_data, sqlite_path, backend):
+    """Test that clients with different API keys on one backend keep their responses apart."""
+    shared = MemoryCache() if backend == "memory" else SQLiteCache(sqlite_path)
+    seen = []
+
+    def client_for(api_key):
+        client = InstantlyClient(InstantlyConfig(
+            api_key=api_key, base_url=config.base_url, cache=CachePolicy(), cache_backend=shared
+        ))
+
+        def handler(request):
+            seen.append(api_key)
+            return httpx.Response(200, json={**custom_tag_data, "name": api_key})
+
+        client._client = httpx.Client(base_url=config.base_url, transport=httpx.MockTransport(handler))
+        return client
+
+    first, second = client_for("key-a"), client_for("key-b")
+
+    assert first.custom_tags.get_custom_tag("tag_123").name == "key-a"
+    assert second.custom_tags.get_custom_tag("tag_123").name == "key-b"
+    assert first.custom_tags.get_custom_tag("tag_123").name == "key-a"
+    assert len(seen) == 2
+
+    second._response_cache.invalidate("/custom-tags/tag_123")
+    assert first.custom_tags.get_custom_tag("tag_123").name == "key-a"
+    assert len(seen) == 2
+
+@pytest.fixture
+def etag_client(config, transport_client, campaign_data, clock):
+    """Create a caching client whose server answers conditional GETs with a 304."""
+    config.cache = CachePolicy(ttl=10)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=campaign_data, headers={"ETag": '"v1"'})
+
+    client = transport_client(handler)
+    client.requests = requests
+    return client
+
+def test_expired_responses_are_revalidated_with_their_etag(etag_client, clock):
+    """Test that an expired response with an ETag is revalidated and reused on a 304."""
+    api = CampaignAPI(etag_client)
+    first = api.get_campaign("camp_123")
+    clock[0] += 10
+
+    second = api.get_campaign("camp_123")
+
+    assert second == first
+    assert [request.headers.get("If-None-Match") for request in etag_client.requests] == [None, '"v1"']
+    assert api.get_campaign("camp_123") == first
+    assert len(etag_client.requests) == 2
+
+def test_reused_models_are_copies(etag_client, clock):
+    """Test that changing a model parsed from a cached body does not leak into later calls."""
+    api = CampaignAPI(etag_client)
+    first = api.get_campaign("camp_123")
+    name = first.name
+    first.name = "changed"
+    clock[0] += 10
+
+    second = api.get_campaign("camp_123")
+
+    assert second is not first
+    assert second.name == name
+    assert len(etag_client.requests) == 2
+
+def test_reused_models_are_cheaper_than_parsing_again(campaign_data):
+    """Test that handing out a copy of a parsed page costs less than validating its body again."""
+    cache = ResponseCache(CachePolicy())
+    content = json.dumps({"items": [campaign_data] * 100}).encode()
+    spec = (CursorPage[Campaign], "full", 10)
+
+    def parse():
+        return validate_json(CursorPage[Campaign], content, "full")
+
+    first = cache.parsed("/campaigns", None, content, spec, parse)
+    hit = min(timeit.repeat(lambda: cache.parsed("/campaigns", None, content, spec, parse), number=20, repeat=5))
+    miss = min(timeit.repeat(parse, number=20, repeat=5))
+    second = cache.parsed("/campaigns", None, content, spec, parse)
+    second.items.pop()
+    second.items[0].name = "changed"
+
+    assert hit < miss
+    assert second.items[1] is not first.items[1]
+    assert (len(first.items), first.items[0].name) == (100, campaign_data["name"])
+
+def test_changed_responses_replace_the_cached_body(config, transport_client, clock):
+    """Test that a 200 to a conditional GET replaces the cached body and its validators."""
+    config.cache = CachePolicy(ttl=10)
+    sent = []
+
+    def handler(request):
+        sent.append(request.headers.get("If-Modified-Since"))
+        version = len(sent)
+        return httpx.Response(200, json={"version": version}, headers={"Last-Modified": f"day {version}"})
+
+    client = transport_client(handler)
+    assert client.get("/campaigns/c1") == {"version": 1}
+    clock[0] += 10
+    assert client.get("/campaigns/c1") == {"version": 2}
+    clock[0] += 10
+    assert client.get("/campaigns/c1") == {"version": 3}
+
+    assert sent == [None, "day 1", "day 2"]
+
+def test_responses_without_validators_are_fetched_again(cached_client, clock):
+    """Test that expired responses without validators are dropped rather than revalidated."""
+    cached_client._response_cache.policy = CachePolicy(ttl=10)
+    cached_client.get("/campaigns/c1")
+    clock[0] += 10
+
+    assert cached_client._response_cache.lookup("/campaigns/c1") is None
@@ -35,4 +35,20 @@ def test_client_close(config):
     client.close()
     # The client should be closed and not raise an error
     with pytest.raises(Exception):
-        client.get("/test") 
\ No newline at end of file
+        client.get("/test") 
+
+
+def test_api_namespaces_are_created_on_first_access(config):
+    """Test that API namespaces are built lazily and then reused."""
+    from instantly.api.lead import LeadAPI
+    from instantly.client import API_NAMESPACES
+
+    client = InstantlyClient(config)
+    assert "leads" not in vars(client)
+
+    leads = client.leads
+    assert isinstance(leads, LeadAPI)
+    assert client.leads is leads
+    assert set(API_NAMESPACES) <= set(dir(client))
+    with pytest.raises(AttributeError):
+        client.not_an_api
@@ -2,11 +2,19 @@
 Tests for the Email Verification API endpoints
 """
 
+import asyncio
+import json
+
+import httpx
 import pytest
 from unittest.mock import Mock, patch
 
-from instantly import InstantlyClient, InstantlyConfig
+from instantly import AsyncInstantlyClient, InstantlyClient, InstantlyConfig
 from instantly.api.email_verification import EmailVerificationAPI
+from instantly.async_api.email_verification import AsyncEmailVerificationAPI
+from instantly.cache import CachePolicy, MemoryCache
+from instantly.models.email_verification import EmailVerification, EmailVerificationFailure
+from instantly.retry import RetryPolicy
 
 @pytest.fixture
 def email_verification_api(config):
@@ -27,7 +35,7 @@ def test_verify_email(email_verification_api):
         }
         response = email_verification_api.verify_email(email)
         
-        mock_post.assert_called_once_with("/email-verification", json=expected_data)
+        mock_post.assert_called_once_with("/email-verification", json=expected_data, retry_safe=True)
         assert response == {
             "email": email,
             "status": "valid",
@@ -50,4 +58,186 @@ def test_get_verification_status(email_verification_api):
             "email": email,
             "status": "valid",
             "last_verified": "2024-03-20T12:00:00Z"
-        } 
\ No newline at end of file
+        } 
+
+def _verification(email, status="valid"):
+    return {
+        "id": f"ver_{email}",
+        "email": email,
+        "status": status,
+        "timestamp_created": "2024-01-01T00:00:00Z",
+    }
+
+def test_verify_emails_normalizes_and_dedupes(email_verification_api):
+    """Test that spellings of one address are verified once and invalid ones are skipped."""
+    emails = [" Alice@Example.com", "alice@example.com", "bob@example.com", "not-an-email", "ALICE@example.COM"]
+    with patch.object(email_verification_api._client, 'post') as mock_post:
+        mock_post.side_effect = lambda path, json, retry_safe: _verification(json["email"])
+        results = list(email_verification_api.verify_emails(emails, concurrency=2))
+
+    assert sorted(result.email for result in results) == ["alice@example.com", "bob@example.com"]
+    assert all(isinstance(result, EmailVerification) for result in results)
+    assert mock_post.call_count == 2
+
+def test_verify_emails_reuses_cached_results(email_verification_api):
+    """Test that addresses verified within the TTL are answered without a request."""
+    with patch.object(email_verification_api._client, 'post') as mock_post:
+        mock_post.side_effect = lambda path, json, retry_safe: _verification(json["email"], "invalid")
+        list(email_verification_api.verify_emails(["a@example.com"]))
+        results = list(email_verification_api.verify_emails(["a@example.com", "b@example.com"]))
+        list(email_verification_api.verify_emails(["a@example.com"], cache_ttl=0))
+
+    assert [result.status for result in results] == ["invalid", "invalid"]
+    assert mock_post.call_count == 3
+
+def test_verify_emails_keeps_results_when_responses_are_cached(config, transport_client):
+    """Test that the response cache invalidating writes leaves cached results in a shared backend."""
+    config.cache = CachePolicy()
+    config.cache_backend = MemoryCache()
+    posts = []
+
+    def handler(request):
+        email = json.loads(request.content)["email"]
+        posts.append(email)
+        return httpx.Response(200, json=_verification(email))
+
+    api = EmailVerificationAPI(transport_client(handler))
+    emails = ["a@example.com", "b@example.com"]
+
+    first = list(api.verify_emails(emails))
+    second = list(api.verify_emails(emails))
+
+    assert sorted(result.email for result in second) == emails
+    assert sorted(posts) == emails
+    assert len(first) == 2
+
+def test_verify_emails_yields_failed_requests(transport_client):
+    """Test that a failed request yields a failure for its address and the others carry on."""
+    def handler(request):
+        if request.method == "POST":
+            email = json.loads(request.content)["email"]
+            if email == "bad@example.com":
+                return httpx.Response(422, json={"message": "rejected"})
+            return httpx.Response(200, json=_verification(email, "pending"))
+        email = request.url.path.rsplit("/", 1)[1]
+        if email == "gone@example.com":
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(200, json=_verification(email))
+
+    api = EmailVerificationAPI(transport_client(handler))
+
+    results = list(api.verify_emails(
+        ["bad@example.com", "gone@example.com", "good@example.com"], poll_interval=0.01
+    ))
+
+    failures = {result.email: result.status_code for result in results if isinstance(result, EmailVerificationFailure)}
+    assert failures == {"bad@example.com": 422, "gone@example.com": 404}
+    assert [result.email for result in results if isinstance(result, EmailVerification)] == ["good@example.com"]
+
+def test_verify_emails_retries_rate_limited_requests(config, transport_client):
+    """Test that a verification answered with 429 is retried and the address still ends up verified."""
+    config.retry = RetryPolicy()
+    posts = []
+
+    def handler(request):
+        email = json.loads(request.content)["email"]
+        posts.append(email)
+        if len(posts) == 1:
+            return httpx.Response(429, json={"message": "rate limited"}, headers={"Retry-After": "1"})
+        return httpx.Response(200, json=_verification(email))
+
+    api = EmailVerificationAPI(transport_client(handler))
+
+    with patch("instantly.client.time.sleep"):
+        results = list(api.verify_emails(["a@example.com"]))
+
+    assert [(result.email, result.status) for result in results] == [("a@example.com", "valid")]
+    assert posts == ["a@example.com", "a@example.com"]
+
+def test_verify_emails_polls_pending_results(email_verification_api):
+    """Test that pending verifications are polled until they finish, and are not cached."""
+    statuses = {"a@example.com": iter(["pending", "valid"]), "b@example.com": iter(["pending", "pending"])}
+    with patch.object(email_verification_api._client, 'post') as mock_post, \
+            patch.object(email_verification_api._client, 'get') as mock_get:
+        mock_post.side_effect = lambda path, json, retry_safe: _verification(json["email"], "pending")
+        mock_get.side_effect = lambda path: _verification(
+            path.rsplit("/", 1)[1], next(statuses[path.rsplit("/", 1)[1]])
+        )
+        results = list(email_verification_api.verify_emails(
+            ["a@example.com", "b@example.com"], poll_interval=0.01, pending_timeout=0.015
+        ))
+
+    assert {result.email: result.status for result in results} == {
+        "a@example.com": "valid",
+        "b@example.com": "pending",
+    }
+    assert mock_get.call_count == 4
+    assert email_verification_api._results.get("verification:result:b@example.com") is None
+
+def test_verify_emails_stops_requests_when_closed(email_verification_api):
+    """Test that closing the generator early cancels verifications not yet started."""
+    with patch.object(email_verification_api._client, 'post') as mock_post:
+        mock_post.side_effect = lambda path, json, retry_safe: _verification(json["email"])
+        results = email_verification_api.verify_emails(
+            (f"user{i}@example.com" for i in range(1000)), concurrency=2
+        )
+        next(results)
+        results.close()
+
+    assert mock_post.call_count < 10
+
+def test_async_verify_emails(config):
+    """Test that the async client verifies, polls and caches addresses the same way."""
+    client = AsyncInstantlyClient(config)
+    api = AsyncEmailVerificationAPI(client)
+
+    async def post(path, json, retry_safe):
+        return _verification(json["email"], "pending" if json["email"].startswith("slow") else "valid")
+
+    async def get(path):
+        return _verification(path.rsplit("/", 1)[1])
+
+    async def run():
+        with patch.object(client, 'post', side_effect=post), patch.object(client, 'get', side_effect=get) as mock_get:
+            first = [result async for result in api.verify_emails(
+                ["slow@example.com", "Fast@example.com", "fast@example.com"], poll_interval=0.01
+            )]
+            second = [result async for result in api.verify_emails(["slow@example.com"])]
+            return first, second, mock_get.call_count
+
+    first, second, polls = asyncio.run(run())
+
+    assert sorted((result.email, result.status) for result in first) == [
+        ("fast@example.com", "valid"),
+        ("slow@example.com", "valid"),
+    ]
+    assert [result.email for result in second] == ["slow@example.com"]
+    assert polls == 1
+
+def test_async_verify_emails_yields_failed_requests(config):
+    """Test that the async client also yields failures for addresses whose requests failed."""
+    def handler(request):
+        if request.method == "POST":
+            email = json.loads(request.content)["email"]
+            if email == "bad@example.com":
+                return httpx.Response(422, json={"message": "rejected"})
+            return httpx.Response(200, json=_verification(email, "pending"))
+        email = request.url.path.rsplit("/", 1)[1]
+        if email == "gone@example.com":
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(200, json=_verification(email))
+
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+    api = AsyncEmailVerificationAPI(client)
+
+    async def run():
+        return [result async for result in api.verify_emails(
+            ["bad@example.com", "gone@example.com", "good@example.com"], poll_interval=0.01
+        )]
+
+    results = asyncio.run(run())
+
+    failures = {result.email: result.status_code for result in results if isinstance(result, EmailVerificationFailure)}
+    assert failures == {"bad@example.com": 422, "gone@example.com": 404}
+    assert [result.email for result in results if isinstance(result, EmailVerification)] == ["good@example.com"]
@@ -0,0 +1,56 @@
+"""
+Tests guarding the cold-start cost of the SDK
+"""
+
+import json
+import subprocess
+import sys
+
+# Coarse upper bound for the SDK's own share of a cold start, far above the expected cost so it
+# only trips when a change makes the whole SDK load eagerly again
+COLD_START_BUDGET = 1.0
+
+def run_cold(code: str) -> dict:
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+def test_import_loads_no_clients_or_apis():
+    """Test that importing the package defers loading the clients and API modules."""
+    loaded = run_cold(
+        "import json, sys, instantly\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith(('instantly', 'asyncio', 'sqlite3')))))"
+    )
+
+    assert loaded == ["instantly"]
+
+def test_first_call_loads_only_the_api_it_uses():
+    """Test that using one API namespace imports only that namespace and times the cold start."""
+    result = run_cold(
+        "import json, sys, time\n"
+        "import httpx, pydantic\n"
+        "start = time.perf_counter()\n"
+        "from instantly import InstantlyClient, InstantlyConfig\n"
+        "client = InstantlyClient(InstantlyConfig(api_key='test'))\n"
+        "client.leads\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = sorted(m for m in sys.modules if m in ('asyncio', 'instantly.lead_replica', 'sqlite3'))\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy, 'modules': sorted(m for m in sys.modules if m.startswith('instantly.'))}))"
+    )
+
+    apis = [name for name in result["modules"] if name.startswith(("instantly.api.", "instantly.async_api"))]
+    assert apis == ["instantly.api.lead"]
+    assert "instantly.async_client" not in result["modules"]
+    assert result["heavy"] == []
+    assert result["elapsed"] < COLD_START_BUDGET
+
+def test_async_client_loads_asyncio():
+    """Test that the modules kept out of sync clients are really loaded by the async client."""
+    loaded = run_cold(
+        "import json, sys\n"
+        "from instantly import AsyncInstantlyClient, InstantlyConfig\n"
+        "AsyncInstantlyClient(InstantlyConfig(api_key='test')).leads\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m in ('asyncio', 'instantly.lead_replica', 'sqlite3'))))"
+    )
+
+    assert "asyncio" in loaded
@@ -2,9 +2,18 @@
 Tests for the Lead API
 """
 
+import asyncio
+import json
+import threading
+import time
+
+import httpx
 import pytest
 from datetime import datetime
 from uuid import UUID, uuid4
+from instantly import AsyncInstantlyClient
+from instantly.bulk import ChunkDispatchError
+from instantly.lead_filter import LeadFilter, LeadScopeError
 from instantly.models.lead import (
     LeadCreateRequest, LeadUpdateRequest, LeadMergeRequest,
     LeadInterestStatusRequest, LeadSubsequenceRemoveRequest,
@@ -229,4 +238,348 @@ def test_context_manager(client):
             assert all(isinstance(lead, Lead) for lead in leads)
         except Exception as e:
             # The mock server might not support listing, so we'll just check the error
-            assert isinstance(e, Exception) 
\ No newline at end of file
+            assert isinstance(e, Exception) 
+
+@pytest.fixture
+def create_leads_client(transport_client):
+    """Create a client whose server rejects one address and tracks concurrent requests."""
+    state = {"active": 0, "peak": 0, "sent": 0}
+    lock = threading.Lock()
+
+    def handler(request):
+        body = json.loads(request.content)
+        with lock:
+            state["active"] += 1
+            state["sent"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        if body["email"] == "rejected@example.com":
+            return httpx.Response(422, json={"message": "duplicate"})
+        return httpx.Response(200, json={"id": f"lead-{body['email']}"})
+
+    client = transport_client(handler)
+    client.state = state
+    return client
+
+def test_create_leads(create_leads_client):
+    """Test creating leads in bulk with partial failures and bounded concurrency."""
+    rows = (
+        {"email": f"user{index}@example.com"} if index not in (3, 7) else
+        {"email": "rejected@example.com"} if index == 3 else
+        {"first_name": "No email"}
+        for index in range(40)
+    )
+    progress = []
+
+    result = create_leads_client.leads.create_leads(
+        rows, concurrency=4, on_progress=lambda snapshot: progress.append(snapshot.completed)
+    )
+
+    assert len(result.created_ids) == 38
+    assert "lead-user0@example.com" in result.created_ids
+    failures = {failure.index: failure for failure in result.failures}
+    assert failures[3].status_code == 422
+    assert failures[3].row == {"email": "rejected@example.com"}
+    assert failures[7].status_code is None
+    assert failures[7].row == {"first_name": "No email"}
+    assert create_leads_client.state["sent"] == 39
+    assert create_leads_client.state["peak"] <= 4
+    assert progress == list(range(1, 41))
+    assert result.rows_per_second > 0
+
+def test_create_leads_records_responses_without_an_id(transport_client):
+    """Test that a response without a lead ID fails its row without aborting the upload."""
+    def handler(request):
+        email = json.loads(request.content)["email"]
+        return httpx.Response(200, json={} if email == "odd@example.com" else {"id": f"lead-{email}"})
+
+    client = transport_client(handler)
+    rows = [{"email": "a@example.com"}, {"email": "odd@example.com"}, {"email": "b@example.com"}]
+
+    result = client.leads.create_leads(rows, concurrency=2)
+
+    assert sorted(result.created_ids) == ["lead-a@example.com", "lead-b@example.com"]
+    assert [failure.index for failure in result.failures] == [1]
+    assert "no lead id" in result.failures[0].error
+    assert result.failures[0].status_code is None
+
+def test_create_leads_async(config):
+    """Test creating leads in bulk with the asynchronous client."""
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "lead"})),
+    )
+    rows = [LeadCreateRequest(email=f"user{index}@example.com") for index in range(10)]
+
+    result = asyncio.run(client.leads.create_leads(iter(rows), concurrency=3))
+
+    assert result.created_ids == ["lead"] * 10
+    assert result.failures == []
+
+@pytest.fixture
+def bulk_client(transport_client):
+    """Create a client whose server echoes bulk requests and records their bodies."""
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        if request.url.path.endswith("/bulk-assign"):
+            return httpx.Response(200, json={
+                "assigned_count": len(body["lead_ids"]), "user_id": str(TEST_USER_ID), "lead_ids": body["lead_ids"],
+            })
+        if request.url.path.endswith("/export"):
+            return httpx.Response(200, json={
+                "exported_count": len(body["lead_ids"]), "app_id": body["app_id"], "lead_ids": body["lead_ids"],
+                "job_id": f"job-{len(bodies)}",
+            })
+        return httpx.Response(200, json={
+            "id": f"job-{body['ids'][0]}", "workspace_id": str(TEST_WORKSPACE_ID), "type": "move-leads",
+            "progress": 0, "status": "pending", "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        })
+
+    client = transport_client(handler)
+    client.bodies = bodies
+    return client
+
+def test_bulk_assign_leads_in_chunks(bulk_client):
+    """Test that long ID lists are assigned in chunks whose results are merged."""
+    lead_ids = [f"lead_{index}" for index in range(2500)]
+
+    result = bulk_client.leads.bulk_assign_leads(
+        LeadBulkAssignRequest(lead_ids=lead_ids, user_id=str(TEST_USER_ID)), chunk_size=1000
+    )
+
+    assert sorted(len(body["lead_ids"]) for body in bulk_client.bodies) == [500, 1000, 1000]
+    assert result.assigned_count == 2500
+    assert result.lead_ids == lead_ids
+    assert result.user_id == TEST_USER_ID
+
+def test_export_leads_in_chunks(bulk_client):
+    """Test that long ID lists are exported in chunks whose results are merged."""
+    lead_ids = [f"lead_{index}" for index in range(5)]
+
+    result = bulk_client.leads.export_leads(LeadExportRequest(lead_ids=lead_ids, app_id="app"), chunk_size=2)
+
+    assert len(bulk_client.bodies) == 3
+    assert result.exported_count == 5
+    assert result.lead_ids == lead_ids
+    assert len(result.job_ids) == 3
+    assert result.job_id == result.job_ids[0]
+
+def test_move_leads_in_chunks(bulk_client):
+    """Test that long ID lists are moved in chunks, with excluded IDs removed beforehand."""
+    move = LeadMoveRequest(
+        ids=["a", "b", "c", "d", "e"], excluded_ids=["b"], to_campaign_id=TEST_CAMPAIGN_ID
+    )
+
+    job = bulk_client.leads.move_leads(move, chunk_size=2)
+
+    assert isinstance(job, MoveLeadsResult)
+    assert job.id == "job-a"
+    assert job.job_ids == ["job-a", "job-d"]
+    assert job.status == "pending"
+    assert sorted(body["ids"] for body in bulk_client.bodies) == [["a", "c"], ["d", "e"]]
+    assert all("excluded_ids" not in body for body in bulk_client.bodies)
+
+def test_short_id_lists_are_sent_whole(bulk_client):
+    """Test that ID lists within the chunk size are sent in one request, as before."""
+    job = bulk_client.leads.move_leads(LeadMoveRequest(ids=["a", "b"], excluded_ids=["b"]))
+
+    assert job.id == "job-a"
+    assert job.job_ids == ["job-a"]
+    assert bulk_client.bodies == [{"ids": ["a", "b"], "excluded_ids": ["b"]}]
+
+def test_move_jobs_merge_to_the_least_advanced_status():
+    """Test that merged move jobs report the lowest progress and fail if any chunk failed."""
+    job = {
+        "id": "job-a", "workspace_id": str(TEST_WORKSPACE_ID), "type": "move-leads", "progress": 100,
+        "status": "success", "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-01T00:01:00Z",
+    }
+    done = MoveLeadsResult.model_validate(job)
+    running = MoveLeadsResult.model_validate({**job, "id": "job-b", "progress": 40, "status": "in-progress"})
+    failed = MoveLeadsResult.model_validate({**job, "id": "job-c", "status": "failed"})
+
+    merged = MoveLeadsResult.merge([done, running])
+
+    assert (merged.progress, merged.status, merged.job_ids) == (40, "in-progress", ["job-a", "job-b"])
+    assert MoveLeadsResult.merge([done, running, failed]).status == "failed"
+    assert MoveLeadsResult.merge([done, done]).status == "success"
+
+def test_failed_chunks_stop_the_rest(transport_client):
+    """Test that a failed chunk stops the chunks not yet sent and reports those that completed."""
+    sent = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        sent.append(body["lead_ids"])
+        if body["lead_ids"] == ["lead_2"]:
+            return httpx.Response(400, json={"message": "bad chunk"})
+        return httpx.Response(200, json={
+            "assigned_count": 1, "user_id": str(TEST_USER_ID), "lead_ids": body["lead_ids"],
+        })
+
+    client = transport_client(handler)
+    client.config.concurrency = 1
+    lead_ids = [f"lead_{index}" for index in range(10)]
+
+    with pytest.raises(ChunkDispatchError) as raised:
+        client.leads.bulk_assign_leads(LeadBulkAssignRequest(lead_ids=lead_ids, user_id=str(TEST_USER_ID)), chunk_size=1)
+
+    assert sent == [["lead_0"], ["lead_1"], ["lead_2"]]
+    assert isinstance(raised.value.error, httpx.HTTPStatusError)
+    assert {index: result.lead_ids for index, result in raised.value.results.items()} == {
+        0: ["lead_0"], 1: ["lead_1"],
+    }
+
+def test_failed_chunks_stop_the_rest_async(config):
+    """Test that the asynchronous client also stops sending chunks after a failure."""
+    sent = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        sent.append(body["lead_ids"])
+        if body["lead_ids"] == ["lead_2"]:
+            return httpx.Response(400, json={"message": "bad chunk"})
+        return httpx.Response(200, json={
+            "assigned_count": 1, "user_id": str(TEST_USER_ID), "lead_ids": body["lead_ids"],
+        })
+
+    config.concurrency = 1
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+    lead_ids = [f"lead_{index}" for index in range(10)]
+
+    with pytest.raises(ChunkDispatchError) as raised:
+        asyncio.run(client.leads.bulk_assign_leads(
+            LeadBulkAssignRequest(lead_ids=lead_ids, user_id=str(TEST_USER_ID)), chunk_size=1
+        ))
+
+    assert sent == [["lead_0"], ["lead_1"], ["lead_2"]]
+    assert sorted(raised.value.results) == [0, 1]
+
+def test_bulk_assign_leads_in_chunks_async(config):
+    """Test that the asynchronous client also assigns long ID lists in chunks."""
+    client = AsyncInstantlyClient(config)
+    sizes = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        sizes.append(len(body["lead_ids"]))
+        return httpx.Response(200, json={
+            "assigned_count": len(body["lead_ids"]), "user_id": str(TEST_USER_ID), "lead_ids": body["lead_ids"],
+        })
+
+    client._client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+    lead_ids = [f"lead_{index}" for index in range(7)]
+
+    result = asyncio.run(client.leads.bulk_assign_leads(
+        LeadBulkAssignRequest(lead_ids=lead_ids, user_id=str(TEST_USER_ID)), chunk_size=3
+    ))
+
+    assert sorted(sizes) == [1, 3, 3]
+    assert result.lead_ids == lead_ids
+
+def test_build_lead_filter(transport_client, api_lead_data):
+    """Test that a lead filter is built from a scan of the campaign's leads."""
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"items": [
+            {**api_lead_data, "email": "First@example.com"},
+            {**api_lead_data, "email": "second@example.com"},
+        ]})
+
+    client = transport_client(handler)
+
+    lead_filter = client.leads.build_lead_filter(campaign=str(TEST_CAMPAIGN_ID), capacity=100, prefetch=0)
+
+    assert bodies == [{"limit": 100, "campaign": str(TEST_CAMPAIGN_ID)}]
+    assert "first@example.com" in lead_filter
+    assert "second@example.com" in lead_filter
+    assert lead_filter.campaign == str(TEST_CAMPAIGN_ID)
+
+def test_create_leads_skips_existing_leads(create_leads_client):
+    """Test that rows the filter reports are skipped and created leads are added to it."""
+    existing = LeadFilter(capacity=100)
+    existing.add("user1@example.com")
+    rows = [{"email": "USER1@example.com"}, {"email": "user2@example.com"}, {"first_name": "No email"}]
+
+    first = create_leads_client.leads.create_leads(rows, existing=existing)
+    second = create_leads_client.leads.create_leads(rows, existing=existing)
+
+    assert (first.skipped, first.created_ids, first.completed) == ([0], ["lead-user2@example.com"], 3)
+    assert second.skipped == [0, 1]
+    assert [failure.index for failure in second.failures] == [2]
+    assert create_leads_client.state["sent"] == 1
+
+def test_create_leads_rejects_rows_outside_the_filter_scope(create_leads_client):
+    """Test that rows targeting another campaign than the filter covers are refused."""
+    existing = LeadFilter(capacity=100, campaign=str(TEST_CAMPAIGN_ID))
+    rows = [
+        {"email": "user1@example.com", "campaign": str(TEST_CAMPAIGN_ID).upper()},
+        LeadCreateRequest(email="user2@example.com", campaign=TEST_CAMPAIGN_ID),
+    ]
+
+    result = create_leads_client.leads.create_leads(rows, existing=existing)
+    with pytest.raises(ValueError, match="row 0 targets campaign"):
+        create_leads_client.leads.create_leads([{"email": "user3@example.com", "campaign": str(uuid4())}], existing=existing)
+    with pytest.raises(ValueError, match="row 0 targets campaign None"):
+        create_leads_client.leads.create_leads([{"email": "user4@example.com"}], existing=existing)
+
+    assert len(result.created_ids) == 2
+    assert create_leads_client.state["sent"] == 2
+
+def test_create_leads_scope_error_keeps_the_leads_already_created(create_leads_client):
+    """Test that a row outside the filter scope stops the upload with what was created so far."""
+    existing = LeadFilter(capacity=100, campaign=str(TEST_CAMPAIGN_ID))
+    rows = [{"email": f"user{index}@example.com", "campaign": str(TEST_CAMPAIGN_ID)} for index in range(5)]
+    rows += [{"email": "other@example.com", "campaign": str(uuid4())}, {"email": "never@example.com"}]
+
+    with pytest.raises(LeadScopeError) as raised:
+        create_leads_client.leads.create_leads(iter(rows), concurrency=2, existing=existing)
+
+    assert raised.value.index == 5
+    assert sorted(raised.value.result.created_ids) == [f"lead-user{index}@example.com" for index in range(5)]
+    assert "user4@example.com" in existing
+    assert create_leads_client.state["sent"] == 5
+
+def test_create_leads_scope_error_keeps_the_leads_already_created_async(config):
+    """Test that the asynchronous client also finishes the rows in flight before raising."""
+    client = AsyncInstantlyClient(config)
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": f"lead-{json.loads(request.content)['email']}"})
+
+    client._client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+    existing = LeadFilter(capacity=100, campaign=str(TEST_CAMPAIGN_ID))
+    rows = [{"email": f"user{index}@example.com", "campaign": str(TEST_CAMPAIGN_ID)} for index in range(3)]
+    rows.append({"email": "other@example.com"})
+
+    with pytest.raises(LeadScopeError) as raised:
+        asyncio.run(client.leads.create_leads(iter(rows), concurrency=3, existing=existing))
+
+    assert sorted(raised.value.result.created_ids) == [f"lead-user{index}@example.com" for index in range(3)]
+
+def test_create_leads_skips_existing_leads_async(config):
+    """Test that the asynchronous client skips rows the filter reports."""
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "lead"})),
+    )
+    existing = LeadFilter(capacity=100)
+    existing.add("user0@example.com")
+    rows = [LeadCreateRequest(email=f"user{index}@example.com") for index in range(3)]
+
+    result = asyncio.run(client.leads.create_leads(rows, existing=existing))
+
+    assert result.skipped == [0]
+    assert result.created_ids == ["lead", "lead"]
+    assert "user2@example.com" in existing
@@ -0,0 +1,81 @@
+"""
+Tests for the columnar lead batch
+"""
+
+import json
+from array import array
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from instantly.api.lead import LeadAPI
+from instantly.models.lead import Lead, ListLeadsRequest
+from instantly.models.lead_batch import MISSING, LeadBatch, from_epoch_micros, to_epoch_micros
+from instantly.models.pagination import CursorPage
+from instantly.parsing import validate_json
+
+def test_rows_round_trip_to_leads(api_lead_data):
+    """Test that rows materialize into the same Lead as validating the JSON directly."""
+    data = dict(api_lead_data, status=-1, status_summary={"from": "campaign", "step_id": "s1"})
+
+    batch = LeadBatch([data, Lead.model_validate(data)])
+
+    assert len(batch) == 2
+    assert batch[0] == Lead.model_validate(data)
+    assert batch[-1] == batch[0]
+    assert list(batch) == [batch[0], batch[1]]
+
+def test_columns_are_typed_with_sentinels(api_lead_data):
+    """Test that counts and timestamps are stored as integers and missing values as MISSING."""
+    batch = LeadBatch([api_lead_data])
+
+    assert batch.column("email_open_count") == array("q", [2])
+    assert batch.column("timestamp_created")[0] == to_epoch_micros(datetime(2024, 1, 1, tzinfo=timezone.utc))
+    assert batch.column("timestamp_last_reply")[0] == MISSING
+    assert batch.row(0)["timestamp_last_reply"] is None
+    assert batch.row(0)["is_website_visitor"] is None
+
+def test_repeated_strings_are_shared(api_lead_data):
+    """Test that repeated IDs are stored once."""
+    first = json.loads(json.dumps(api_lead_data))
+    second = json.loads(json.dumps(api_lead_data))
+
+    batch = LeadBatch([first, second])
+
+    campaigns = batch.column("campaign")
+    assert campaigns[0] is campaigns[1]
+
+def test_timestamps_keep_microseconds():
+    """Test that timestamp conversion is lossless at microsecond precision."""
+    value = to_epoch_micros("2024-05-06T07:08:09.123456Z")
+
+    assert from_epoch_micros(value) == datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+
+def test_accepts_unvalidated_views(api_lead_data):
+    """Test that items parsed without validation can be added."""
+    data = dict(api_lead_data, status_summary={"from": "campaign"})
+    page = validate_json(CursorPage[Lead], json.dumps({"items": [data]}), mode="none")
+
+    batch = LeadBatch.from_pages([page])
+
+    assert batch[0] == Lead.model_validate(data)
+
+def test_index_out_of_range(api_lead_data):
+    """Test that indexing past the end raises IndexError."""
+    batch = LeadBatch([api_lead_data])
+
+    with pytest.raises(IndexError):
+        batch[1]
+
+def test_fetch_lead_batch_reads_every_page(transport_client, api_lead_data):
+    """Test that the lead batch is filled from the raw pages of the leads list endpoint."""
+    pages = [
+        {"items": [dict(api_lead_data, id="l1")], "next_starting_after": "l1"},
+        {"items": [dict(api_lead_data, id="l2")], "next_starting_after": None},
+    ]
+    client = transport_client(lambda request: httpx.Response(200, json=pages.pop(0)))
+
+    batch = LeadAPI(client).fetch_lead_batch(ListLeadsRequest(limit=1))
+
+    assert [lead.id for lead in batch] == ["l1", "l2"]
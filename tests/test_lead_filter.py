@@ -0,0 +1,50 @@
+"""
+Tests for the probabilistic filter of existing leads
+"""
+
+import pytest
+
+from instantly.lead_filter import LeadFilter
+
+def test_added_emails_are_always_found():
+    """Test that the filter has no false negatives and ignores case and whitespace."""
+    lead_filter = LeadFilter(capacity=1000)
+    for index in range(1000):
+        lead_filter.add(f"User{index}@Example.com ")
+
+    assert all(f"user{index}@example.com" in lead_filter for index in range(1000))
+    assert len(lead_filter) == 1000
+
+def test_false_positive_rate_stays_near_target():
+    """Test that unknown emails are reported at about the configured error rate."""
+    lead_filter = LeadFilter(capacity=10_000, error_rate=0.01)
+    for index in range(10_000):
+        lead_filter.add(f"known{index}@example.com")
+
+    false_positives = sum(f"unknown{index}@example.com" in lead_filter for index in range(20_000))
+
+    assert false_positives / 20_000 < 0.02
+    assert 0.005 < lead_filter.false_positive_rate < 0.02
+
+def test_filter_round_trips_through_a_file(tmp_path):
+    """Test that a saved filter loads with the same contents and scope."""
+    lead_filter = LeadFilter(capacity=100, campaign="camp_123")
+    lead_filter.add("a@example.com")
+    path = tmp_path / "leads.filter"
+
+    lead_filter.save(path)
+    loaded = LeadFilter.load(path)
+
+    assert "a@example.com" in loaded
+    assert "b@example.com" not in loaded
+    assert (loaded.campaign, loaded.list_id, len(loaded)) == ("camp_123", None, 1)
+    assert loaded.to_bytes() == lead_filter.to_bytes()
+
+def test_invalid_filters_are_rejected():
+    """Test that bad parameters and foreign data raise ValueError."""
+    with pytest.raises(ValueError):
+        LeadFilter(error_rate=1)
+    with pytest.raises(ValueError):
+        LeadFilter.from_bytes(b"not a filter")
+    with pytest.raises(ValueError):
+        LeadFilter.from_bytes(LeadFilter(capacity=100).to_bytes()[:-1])
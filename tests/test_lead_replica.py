@@ -0,0 +1,280 @@
+"""
+Tests for the local SQLite replica of leads
+"""
+
+import asyncio
+import threading
+import json
+import time
+
+import httpx
+import pytest
+
+from instantly import AsyncInstantlyClient
+from instantly.lead_replica import LeadReplica
+from instantly.models.lead import Lead, ListLeadsRequest
+
+CAMPAIGN_ID = "0196eed7-b516-7082-bd55-11a3e14138ca"
+
+@pytest.fixture
+def replica(tmp_path):
+    """Create an empty replica in a temporary file."""
+    replica = LeadReplica(str(tmp_path / "leads.db"))
+    yield replica
+    replica.close()
+
+@pytest.fixture
+def workspace(api_lead_data):
+    """Leads served by the fake list endpoint, keyed by ID."""
+    return {
+        f"lead_{index}": {
+            **api_lead_data,
+            "id": f"lead_{index}",
+            "email": f"user{index}@example.com",
+            "timestamp_updated": f"2024-01-0{index + 1}T00:00:00Z",
+        }
+        for index in range(5)
+    }
+
+@pytest.fixture
+def sync_client(transport_client, workspace):
+    """Create a client listing the workspace's leads two per page."""
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        leads = sorted(workspace.values(), key=lambda lead: lead["id"])
+        start = next(
+            (index + 1 for index, lead in enumerate(leads) if lead["id"] == body.get("starting_after")), 0
+        )
+        page = leads[start:start + 2]
+        cursor = page[-1]["id"] if start + 2 < len(leads) else None
+        return httpx.Response(200, json={"items": page, "next_starting_after": cursor})
+
+    client = transport_client(handler)
+    client.bodies = bodies
+    return client
+
+def test_first_sync_inserts_every_lead(sync_client, replica):
+    """Test that the first sync stores all leads and records the high-water mark."""
+    result = sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+
+    assert sorted(result.inserted_ids) == [f"lead_{index}" for index in range(5)]
+    assert (result.updated_ids, result.unchanged) == ([], 0)
+    assert len(replica) == 5
+    assert replica.high_water_mark(LeadReplica.scope(CAMPAIGN_ID)) is not None
+    assert sync_client.bodies[0]["campaign"] == CAMPAIGN_ID
+
+def test_later_syncs_only_write_changed_leads(sync_client, replica, workspace, api_lead_data):
+    """Test that leads not updated since the last sync are skipped."""
+    sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+    workspace["lead_1"] = {**workspace["lead_1"], "status": 3, "timestamp_updated": "2024-02-01T00:00:00Z"}
+    workspace["lead_9"] = {**api_lead_data, "id": "lead_9", "timestamp_updated": "2024-02-01T00:00:00Z"}
+
+    result = sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+
+    assert result.inserted_ids == ["lead_9"]
+    assert result.updated_ids == ["lead_1"]
+    assert result.unchanged == 4
+    assert result.scanned == 6
+    stored = replica._connection.execute("SELECT status, data FROM leads WHERE id = 'lead_1'").fetchone()
+    assert stored[0] == 3
+    assert json.loads(stored[1])["status"] == 3
+
+def test_full_sync_deletes_leads_no_longer_listed(sync_client, replica, workspace):
+    """Test that a full sync removes leads of the scope that the API stopped listing."""
+    sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+    del workspace["lead_2"]
+
+    incremental = sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+    full = sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, full=True, prefetch=0)
+
+    assert incremental.deleted_ids == []
+    assert full.deleted_ids == ["lead_2"]
+    assert full.unchanged == 4
+    assert len(replica) == 4
+
+def test_only_full_syncs_keep_the_replica_fresh(sync_client, replica):
+    """Test that freshness dates from the last full sync, which alone catches deletions."""
+    sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+    assert replica.synced_within(60, CAMPAIGN_ID)
+    replica._connection.execute("UPDATE marks SET synced_at = synced_at - 100, full_synced_at = full_synced_at - 100")
+
+    sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+    stale = replica.synced_within(60, CAMPAIGN_ID)
+    sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, full=True, prefetch=0)
+
+    assert not stale
+    assert replica.synced_within(60, CAMPAIGN_ID)
+
+def test_first_sync_of_a_scope_deletes_leads_no_longer_listed(sync_client, replica, workspace):
+    """Test that the first sync of a campaign drops stored leads that left it."""
+    run = replica.start_sync(campaign=CAMPAIGN_ID, full=True)
+    run.apply(list(workspace.values()))
+    run.finish()
+    replica._connection.execute("DELETE FROM marks")
+    del workspace["lead_4"]
+
+    result = sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+
+    assert result.deleted_ids == ["lead_4"]
+
+def test_scopes_have_separate_marks(sync_client, replica):
+    """Test that syncing one campaign does not advance the mark of the workspace."""
+    sync_client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+
+    result = sync_client.leads.sync_leads(replica, prefetch=0)
+
+    assert replica.high_water_mark("workspace") is not None
+    assert result.unchanged == 5
+    assert LeadReplica.scope(CAMPAIGN_ID, "list_1") == f"campaign:{CAMPAIGN_ID}|list:list_1"
+
+def test_async_sync_leads(config, replica, workspace):
+    """Test that the async client syncs the replica the same way."""
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"items": list(workspace.values())})
+        ),
+    )
+
+    result = asyncio.run(client.leads.sync_leads(replica, prefetch=0))
+
+    assert len(result.inserted_ids) == 5
+    assert len(replica) == 5
+
+@pytest.fixture
+def filled_replica(replica, api_lead_data):
+    """A replica holding leads with varied statuses, providers and campaigns."""
+    run = replica.start_sync()
+    run.apply([
+        {
+            **api_lead_data,
+            "id": f"lead_{index:03d}",
+            "status": -1 if index % 3 == 0 else 1,
+            "esp_code": 2 if index % 2 == 0 else 1,
+            "lt_interest_status": 1 if index < 5 else None,
+            "campaign": CAMPAIGN_ID if index < 30 else "0196eed7-b516-7082-bd55-000000000000",
+            "is_website_visitor": index == 7,
+        }
+        for index in range(60)
+    ])
+    run.finish()
+    return replica
+
+def test_query_combines_filters(filled_replica):
+    """Test that several ListLeadsRequest filters are combined with AND."""
+    params = ListLeadsRequest(status=-1, esp_code=2, campaign=CAMPAIGN_ID)
+
+    leads = filled_replica.list_leads(params)
+
+    assert [lead.id for lead in leads] == ["lead_000", "lead_006", "lead_012", "lead_018", "lead_024"]
+    assert all(isinstance(lead, Lead) for lead in leads)
+    assert filled_replica.count_leads(params) == 5
+    assert filled_replica.count_leads(ListLeadsRequest(interest_status=1)) == 5
+    assert filled_replica.count_leads(ListLeadsRequest(is_website_visitor=True)) == 1
+    assert filled_replica.count_leads() == 60
+
+def test_query_pages_through_results(filled_replica):
+    """Test that limit and starting_after page through results ordered by ID."""
+    first = filled_replica.list_leads(ListLeadsRequest(esp_code=2, limit=10))
+    second = filled_replica.list_leads(ListLeadsRequest(esp_code=2, limit=10, starting_after=first[-1].id))
+    every = list(filled_replica.iter_leads(ListLeadsRequest(esp_code=2), validate="none", batch_size=7))
+
+    assert [lead.id for lead in first + second] == [f"lead_{index:03d}" for index in range(0, 40, 2)]
+    assert len(every) == 30
+    assert every[29].id == "lead_058"
+
+def test_query_uses_an_index(replica):
+    """Test that filtered queries can be answered from a secondary index, not a table scan."""
+    plan = replica._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM leads WHERE status = ? AND esp_code = ? ORDER BY id",
+        (-1, 2),
+    ).fetchall()
+
+    assert any("USING INDEX leads_" in row[-1] for row in plan)
+
+@pytest.fixture
+def read_through_client(transport_client, workspace, replica):
+    """Create a client with a synced replica, recording the requests it sends."""
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.method == "GET":
+            return httpx.Response(200, json=workspace["lead_0"])
+        return httpx.Response(200, json={"items": list(workspace.values())})
+
+    client = transport_client(handler)
+    client.config.lead_replica = replica
+    client.leads.sync_leads(replica, campaign=CAMPAIGN_ID, prefetch=0)
+    requests.clear()
+    client.requests = requests
+    return client
+
+def test_get_lead_reads_through_a_fresh_replica(read_through_client):
+    """Test that get_lead is served locally when the replica is fresh enough."""
+    local = read_through_client.leads.get_lead("lead_3", max_staleness=60)
+    remote = read_through_client.leads.get_lead("lead_3")
+    missing = read_through_client.leads.get_lead("lead_unknown", max_staleness=60)
+
+    assert (local.id, local.source) == ("lead_3", "replica")
+    assert remote.source == "api"
+    assert missing.source == "api"
+    assert len(read_through_client.requests) == 2
+
+def test_list_leads_reads_through_a_fresh_replica(read_through_client):
+    """Test that list_leads is served locally only for scopes the replica synced recently."""
+    params = ListLeadsRequest(campaign=CAMPAIGN_ID, limit=3)
+
+    local = read_through_client.leads.list_leads(params, max_staleness=60)
+    views = read_through_client.leads.list_leads(params, validate="none", max_staleness=60)
+    assert read_through_client.requests == []
+
+    time.sleep(0.02)
+    stale = read_through_client.leads.list_leads(params, max_staleness=0.01)
+    other_scope = read_through_client.leads.list_leads(ListLeadsRequest(), max_staleness=60)
+
+    assert [lead.id for lead in local] == ["lead_0", "lead_1", "lead_2"]
+    assert {lead.source for lead in local} == {"replica"}
+    assert [view.source for view in views] == ["replica"] * 3
+    assert {lead.source for lead in stale + other_scope} == {"api"}
+    assert len(read_through_client.requests) == 2
+
+def test_async_get_lead_reads_through_a_fresh_replica(config, replica, workspace):
+    """Test that the async client also reads through the replica."""
+    run = replica.start_sync()
+    run.apply(list(workspace.values()))
+    run.finish()
+    config.lead_replica = replica
+    client = AsyncInstantlyClient(config)
+
+    lead = asyncio.run(client.leads.get_lead("lead_1", max_staleness=60))
+
+    assert (lead.id, lead.source) == ("lead_1", "replica")
+
+def test_async_reads_query_the_replica_off_the_event_loop(config, replica, workspace):
+    """Test that the async client queries the replica from worker threads, not the event loop."""
+    run = replica.start_sync()
+    run.apply(list(workspace.values()))
+    run.finish()
+    threads = []
+    for name in ("get_lead", "list_leads", "synced_within"):
+        def record(*args, _query=getattr(replica, name), **kwargs):
+            threads.append(threading.get_ident())
+            return _query(*args, **kwargs)
+        setattr(replica, name, record)
+    config.lead_replica = replica
+    client = AsyncInstantlyClient(config)
+
+    async def read():
+        await client.leads.get_lead("lead_1", max_staleness=60)
+        await client.leads.list_leads(max_staleness=60)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(read())
+
+    assert len(threads) == 4
+    assert loop_thread not in threads
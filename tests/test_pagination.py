@@ -0,0 +1,245 @@
+"""
+Tests for cursor pagination
+"""
+
+import asyncio
+import json
+import threading
+import time
+from itertools import islice
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from instantly import InstantlyClient
+from instantly.api.campaign import CampaignAPI
+from instantly.api.custom_tag import CustomTagAPI
+from instantly.api.lead import LeadAPI
+from instantly.api.lead_list import LeadListAPI
+from instantly.async_api.block_list_entry import AsyncBlockListEntryAPI
+from instantly.async_api.lead_list import AsyncLeadListAPI
+from instantly.models.lead import ListLeadsRequest
+from instantly.pagination import prefetched
+
+def pages_of(data, *ids, cursor_after_last=False):
+    """Build consecutive cursor pages, one per group of ids."""
+    pages = []
+    for index, page_ids in enumerate(ids):
+        last = index == len(ids) - 1
+        pages.append({
+            "items": [dict(data, id=item_id) for item_id in page_ids],
+            "next_starting_after": None if last and not cursor_after_last else page_ids[-1],
+        })
+    return pages
+
+def test_list_page_returns_cursor(client, custom_tag_data):
+    """Test that a page exposes the cursor of the next page."""
+    with patch.object(client, 'get') as mock_get:
+        mock_get.return_value = pages_of(custom_tag_data, ["a", "b"], ["c"])[0]
+
+        page = CustomTagAPI(client).list_custom_tags_page(limit=2)
+
+        assert [tag.id for tag in page.items] == ["a", "b"]
+        assert page.next_starting_after == "b"
+
+def test_iter_follows_cursor(client, custom_tag_data):
+    """Test that iteration follows the cursor until the last page."""
+    with patch.object(client, 'get') as mock_get:
+        mock_get.side_effect = pages_of(custom_tag_data, ["a", "b"], ["c", "d"], ["e"])
+
+        tags = list(CustomTagAPI(client).iter_custom_tags(limit=2))
+
+        assert [tag.id for tag in tags] == ["a", "b", "c", "d", "e"]
+        assert [call.kwargs["params"].get("starting_after") for call in mock_get.call_args_list] == [None, "b", "d"]
+
+def test_iter_is_lazy(client, custom_tag_data):
+    """Test that pages are only fetched when their items are needed."""
+    with patch.object(client, 'get') as mock_get:
+        mock_get.side_effect = pages_of(custom_tag_data, ["a", "b"], ["c", "d"], ["e"])
+
+        tags = CustomTagAPI(client).iter_custom_tags(limit=2)
+        assert mock_get.call_count == 0
+
+        list(islice(tags, 3))
+        assert mock_get.call_count == 2
+
+def test_iter_stops_on_empty_page(client, custom_tag_data):
+    """Test that an empty page ends iteration even if a cursor is returned."""
+    with patch.object(client, 'get') as mock_get:
+        mock_get.side_effect = [
+            pages_of(custom_tag_data, ["a"], cursor_after_last=True)[0],
+            {"items": [], "next_starting_after": "a"},
+        ]
+
+        assert [tag.id for tag in CustomTagAPI(client).iter_custom_tags()] == ["a"]
+        assert mock_get.call_count == 2
+
+def test_iter_leads_passes_filters_and_cursor(transport_client, api_lead_data):
+    """Test that lead iteration keeps filters while advancing the cursor."""
+    pages = pages_of(api_lead_data, ["l1"], ["l2"])
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=pages.pop(0))
+
+    client = transport_client(handler)
+    leads = list(LeadAPI(client).iter_leads(ListLeadsRequest(limit=1, status=1)))
+
+    assert [item.id for item in leads] == ["l1", "l2"]
+    assert bodies == [{"limit": 1, "status": 1}, {"limit": 1, "status": 1, "starting_after": "l1"}]
+
+def test_async_iter_follows_cursor(async_client, block_list_entry_data):
+    """Test that asynchronous iteration follows the cursor."""
+    api = AsyncBlockListEntryAPI(async_client)
+
+    async def run():
+        with patch.object(async_client, 'get', new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = pages_of(block_list_entry_data, ["a", "b"], ["c"])
+            return [entry.id async for entry in api.iter_block_list_entries(limit=2)]
+
+    assert asyncio.run(run()) == ["a", "b", "c"]
+
+def test_prefetch_fetches_next_page_while_caller_consumes(client, custom_tag_data):
+    """Test that the next page is requested before the caller asks for it."""
+    fetched = threading.Event()
+    pages = pages_of(custom_tag_data, ["a"], ["b"], ["c"])
+
+    def get(path, params=None):
+        if params.get("starting_after") == "a":
+            fetched.set()
+        return pages.pop(0)
+
+    with patch.object(client, 'get', side_effect=get):
+        tags = CustomTagAPI(client).iter_custom_tags(limit=1, prefetch=1)
+
+        assert next(tags).id == "a"
+        assert fetched.wait(timeout=5)
+        assert [tag.id for tag in tags] == ["b", "c"]
+
+def test_prefetch_depth_comes_from_config(config, custom_tag_data):
+    """Test that the client config sets the default prefetch depth."""
+    config.prefetch_pages = 2
+    client = InstantlyClient(config)
+    with patch.object(client, 'get') as mock_get:
+        mock_get.side_effect = pages_of(custom_tag_data, ["a"], ["b"], ["c"], ["d"])
+
+        tags = CustomTagAPI(client).iter_custom_tags(limit=1)
+        assert next(tags).id == "a"
+        deadline = time.monotonic() + 5
+        while mock_get.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert mock_get.call_count >= 3
+        assert [tag.id for tag in tags] == ["b", "c", "d"]
+
+def test_prefetch_reraises_errors_in_order(client, custom_tag_data):
+    """Test that a failed fetch surfaces after the pages fetched before it."""
+    with patch.object(client, 'get') as mock_get:
+        mock_get.side_effect = [pages_of(custom_tag_data, ["a"], ["b"])[0], RuntimeError("boom")]
+
+        tags = CustomTagAPI(client).iter_custom_tags(limit=1, prefetch=2)
+
+        assert next(tags).id == "a"
+        with pytest.raises(RuntimeError, match="boom"):
+            next(tags)
+
+def test_prefetched_stops_producer_when_closed():
+    """Test that closing the iterator stops the background thread."""
+    produced = []
+
+    def source():
+        for value in range(1000):
+            produced.append(value)
+            yield value
+
+    values = prefetched(source(), depth=1)
+    assert next(values) == 0
+    values.close()
+    time.sleep(0.3)
+
+    assert len(produced) < 10
+
+def test_async_prefetch_keeps_order(async_client, block_list_entry_data):
+    """Test that asynchronous prefetching yields items in order."""
+    api = AsyncBlockListEntryAPI(async_client)
+
+    async def run():
+        with patch.object(async_client, 'get', new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = pages_of(block_list_entry_data, ["a"], ["b"], ["c"])
+            return [entry.id async for entry in api.iter_block_list_entries(limit=1, prefetch=2)]
+
+    assert asyncio.run(run()) == ["a", "b", "c"]
+
+def test_fetch_all_uses_total_to_fan_out(client):
+    """Test that pages after the first are requested concurrently and yielded in order."""
+    lock = threading.Lock()
+    in_flight = [0, 0]
+    requested = []
+
+    def get(path, params=None):
+        page = params["page"]
+        with lock:
+            requested.append(page)
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.05 * (5 - page))
+        with lock:
+            in_flight[0] -= 1
+        items = [{"id": f"{page}-{i}"} for i in range(2)][: 7 - 2 * (page - 1)]
+        return {"items": items, "total": 7}
+
+    with patch.object(client, 'get', side_effect=get):
+        lists = list(LeadListAPI(client).fetch_all_lists(per_page=2, concurrency=3))
+
+    assert [item["id"] for item in lists] == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1", "4-0"]
+    assert sorted(requested) == [1, 2, 3, 4]
+    assert in_flight[1] == 3
+
+def test_fetch_all_without_total_stops_at_short_page(transport_client, campaign_data):
+    """Test that pages are fetched speculatively until a short page is returned."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        offset = int(request.url.params["offset"])
+        count = 2 if offset < 4 else (1 if offset == 4 else 0)
+        items = [dict(campaign_data, id=f"c{offset + i}") for i in range(count)]
+        return httpx.Response(200, json={"items": items})
+
+    client = transport_client(handler)
+    campaigns = list(CampaignAPI(client).fetch_all_campaigns(limit=2, concurrency=2))
+
+    assert [campaign.id for campaign in campaigns] == ["c0", "c1", "c2", "c3", "c4"]
+    assert len(requests) <= 5
+
+def test_fetch_all_single_page(transport_client, campaign_data):
+    """Test that a short first page needs no further requests."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"items": [campaign_data]})
+
+    client = transport_client(handler)
+    campaigns = list(CampaignAPI(client).fetch_all_campaigns(limit=10))
+
+    assert len(campaigns) == 1
+    assert len(requests) == 1
+    assert dict(requests[0].url.params) == {"limit": "10", "offset": "0"}
+
+def test_async_fetch_all_keeps_order(async_client):
+    """Test that asynchronous fan-out yields pages in order."""
+    async def get(path, params=None):
+        page = params["page"]
+        await asyncio.sleep(0.01 * (4 - page))
+        return {"items": [{"id": page}], "total": 3}
+
+    api = AsyncLeadListAPI(async_client)
+
+    async def run():
+        with patch.object(async_client, 'get', side_effect=get):
+            return [item["id"] async for item in api.fetch_all_lists(per_page=1)]
+
+    assert asyncio.run(run()) == [1, 2, 3]
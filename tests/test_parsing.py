@@ -0,0 +1,118 @@
+"""
+Tests for response parsing
+"""
+
+import json
+from datetime import datetime
+from typing import List
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from instantly import InstantlyClient
+from instantly.models.custom_tag import CustomTag
+from instantly.models.lead import Lead
+from instantly.models.pagination import CursorPage
+from instantly.parsing import ModelView, type_adapter, validate_json
+
+def test_validate_json_matches_dict_validation(api_lead_data):
+    """Test that validating raw bytes gives the same result as validating a dict."""
+    body = {"items": [api_lead_data, dict(api_lead_data, id="second")], "next_starting_after": "second"}
+
+    page = validate_json(CursorPage[Lead], json.dumps(body).encode())
+
+    assert page == CursorPage[Lead].model_validate(body)
+    assert page.items[0].timestamp_last_contact.hour == 10
+    assert page.next_starting_after == "second"
+
+def test_validate_json_supports_plain_types(api_lead_data):
+    """Test that non-model types are validated through a TypeAdapter."""
+    leads = validate_json(List[Lead], json.dumps([api_lead_data]).encode())
+
+    assert [lead.email for lead in leads] == [api_lead_data["email"]]
+
+def test_type_adapter_is_cached():
+    """Test that a type's validator is only built once."""
+    assert type_adapter(List[Lead]) is type_adapter(List[Lead])
+
+def test_get_model_validates_response_body(transport_client, api_lead_data):
+    """Test that the client validates the response body into the requested model."""
+    client = transport_client(lambda request: httpx.Response(200, json={"items": [api_lead_data]}))
+
+    page = client.get_model("/leads", CursorPage[Lead])
+
+    assert isinstance(page.items[0], Lead)
+    assert page.next_starting_after is None
+
+def page_body(api_lead_data, count):
+    """Encode a leads page with the given number of items."""
+    items = [dict(api_lead_data, id=f"lead-{i}") for i in range(count)]
+    return json.dumps({"items": items, "next_starting_after": "lead-last"}).encode()
+
+def test_none_mode_constructs_without_validation(api_lead_data):
+    """Test that the none mode keeps the attribute API but skips validation."""
+    data = dict(api_lead_data, status_summary={"from": "campaign", "step_id": "s1"})
+    body = json.dumps({"items": [data]}).encode()
+
+    page = validate_json(CursorPage[Lead], body, mode="none")
+
+    lead = page.items[0]
+    assert isinstance(lead, ModelView)
+    assert lead.email == api_lead_data["email"]
+    assert lead.timestamp_created == api_lead_data["timestamp_created"]
+    assert lead.status_summary.from_ == "campaign"
+    assert lead.personalization is None
+    assert lead.email_open_count == api_lead_data["email_open_count"]
+    assert isinstance(lead.to_model(), Lead)
+
+def test_none_mode_views_are_read_only(api_lead_data):
+    """Test that views reject writes and unknown attributes."""
+    page = validate_json(CursorPage[Lead], page_body(api_lead_data, 1), mode="none")
+
+    with pytest.raises(AttributeError):
+        page.items[0].email = "other@example.com"
+    with pytest.raises(AttributeError):
+        page.items[0].not_a_field
+
+def test_none_mode_keeps_extra_fields_when_allowed(custom_tag_data):
+    """Test that models accepting extra fields keep them when constructed."""
+    body = json.dumps({"items": [dict(custom_tag_data, brand_new_field=1)]}).encode()
+
+    page = validate_json(CursorPage[CustomTag], body, mode="none")
+
+    assert page.items[0].brand_new_field == 1
+
+def test_sample_mode_validates_one_item_in_n(api_lead_data):
+    """Test that the sample mode fully validates only every n-th item."""
+    items = [dict(api_lead_data, id=f"lead-{i}") for i in range(4)]
+    items[1]["organization"] = items[2]["organization"] = "not-a-uuid"
+    skipped = json.dumps({"items": items[:3]}).encode()
+    sampled = json.dumps({"items": items[:2] + items[1:3]}).encode()
+
+    page = validate_json(CursorPage[Lead], skipped, mode="sample", sample_every=3)
+    assert [lead.id for lead in page.items] == ["lead-0", "lead-1", "lead-2"]
+    with pytest.raises(ValidationError):
+        validate_json(CursorPage[Lead], sampled, mode="sample", sample_every=3)
+
+def test_sample_mode_catches_schema_drift(api_lead_data):
+    """Test that a sampled item that does not match the model raises."""
+    body = json.dumps({"items": [dict(api_lead_data, organization="not-a-uuid")]}).encode()
+
+    with pytest.raises(ValidationError):
+        validate_json(CursorPage[Lead], body, mode="sample")
+
+def test_validation_mode_from_config_and_per_call(config, api_lead_data):
+    """Test that the client config sets the mode and calls can override it."""
+    config.validation = "none"
+    client = InstantlyClient(config)
+    client._client = httpx.Client(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=page_body(api_lead_data, 1))),
+    )
+
+    constructed = client.leads.list_leads()
+    validated = client.leads.list_leads(validate="full")
+
+    assert isinstance(constructed[0].timestamp_updated, str)
+    assert isinstance(validated[0].timestamp_updated, datetime)
@@ -0,0 +1,101 @@
+"""
+Tests for client-side rate limiting
+"""
+
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from instantly import InstantlyClient, InstantlyConfig
+from instantly.endpoints import endpoint_group, endpoint_path
+from instantly.rate_limit import RateLimit, RateLimiter, TokenBucket
+
+@pytest.mark.parametrize("endpoint, group", [
+    ("/leads/list", "leads"),
+    ("/api/v2/leads/lead_123", "leads"),
+    ("/emails", "emails"),
+    ("/campaigns/camp_123/analytics/daily", "analytics"),
+    ("/campaigns/analytics/overview", "analytics"),
+    ("/campaigns/camp_123", "campaigns"),
+])
+def test_endpoint_group(endpoint, group):
+    """Test classification of endpoints into groups."""
+    assert endpoint_group(endpoint) == group
+
+def test_endpoint_path_strips_api_prefix():
+    """Test that the API prefix is removed from endpoints."""
+    assert endpoint_path("/api/v2/leads/") == "/leads"
+    assert endpoint_path("leads") == "/leads"
+
+def test_bucket_allows_burst_then_paces():
+    """Test that a full bucket serves its burst before asking callers to wait."""
+    with patch("instantly.rate_limit.time.monotonic", return_value=100.0):
+        bucket = TokenBucket(RateLimit(requests_per_second=10, burst=3))
+        delays = [bucket.reserve() for _ in range(5)]
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1)
+    assert delays[4] == pytest.approx(0.2)
+
+def test_bucket_refills_over_time():
+    """Test that tokens are replenished at the configured rate."""
+    clock = [100.0]
+    with patch("instantly.rate_limit.time.monotonic", side_effect=lambda: clock[0]):
+        bucket = TokenBucket(RateLimit(requests_per_second=2, burst=1))
+        assert bucket.reserve() == 0.0
+        clock[0] += 0.5
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+
+def test_bucket_is_thread_safe():
+    """Test that concurrent reservations never hand out the same slot twice."""
+    bucket = TokenBucket(RateLimit(requests_per_second=1000, burst=1))
+    delays = []
+
+    def reserve_many():
+        for _ in range(200):
+            delays.append(bucket.reserve())
+
+    threads = [threading.Thread(target=reserve_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(delays) == 1600
+    assert max(delays) > 1.0
+
+def test_limiter_uses_group_buckets():
+    """Test that grouped endpoints draw from their own bucket."""
+    limiter = RateLimiter(
+        default=RateLimit(requests_per_second=1, burst=1),
+        groups={"leads": RateLimit(requests_per_second=1, burst=2)},
+    )
+
+    assert limiter.reserve("/leads/list") == 0.0
+    assert limiter.reserve("/leads/list") == 0.0
+    assert limiter.reserve("/campaigns") == 0.0
+    assert limiter.reserve("/campaigns") > 0
+    assert limiter.reserve("/leads/list") > 0
+
+def test_limiter_without_limits_never_waits():
+    """Test that an unconfigured limiter leaves requests unpaced."""
+    limiter = RateLimiter()
+    assert all(limiter.reserve("/leads/list") == 0.0 for _ in range(100))
+
+def test_client_paces_requests():
+    """Test that the client sleeps when the bucket is empty."""
+    config = InstantlyConfig(api_key="test-api-key", rate_limit=RateLimit(requests_per_second=5, burst=1))
+    client = InstantlyClient(config)
+    client._client = httpx.Client(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+    )
+
+    with patch("instantly.client.time.sleep") as mock_sleep:
+        for _ in range(3):
+            client.get("/campaigns")
+
+    assert mock_sleep.call_count == 2
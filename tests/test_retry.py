@@ -0,0 +1,138 @@
+"""
+Tests for the retry policy
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from instantly import AsyncInstantlyClient, InstantlyClient, InstantlyConfig
+from instantly.retry import RetryPolicy, parse_retry_after
+
+def make_client(handler, **policy):
+    """Create a client whose requests are answered by the handler."""
+    config = InstantlyConfig(api_key="test-api-key", retry=RetryPolicy(**policy))
+    client = InstantlyClient(config)
+    client._client = httpx.Client(base_url=config.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+def responses(*statuses, headers=None):
+    """Build a handler answering with the given statuses in order."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        return httpx.Response(status, json={"ok": status == 200}, headers=headers)
+
+    return handler, calls
+
+def test_retries_transient_statuses_until_success():
+    """Test that 503s are retried until the request succeeds."""
+    handler, calls = responses(503, 503, 200)
+    client = make_client(handler, backoff_base=0)
+
+    with patch("instantly.client.time.sleep") as mock_sleep:
+        assert client.get("/campaigns") == {"ok": True}
+
+    assert len(calls) == 3
+    assert mock_sleep.call_count == 2
+
+def test_gives_up_after_max_attempts():
+    """Test that the last error is raised once attempts run out."""
+    handler, calls = responses(502)
+    client = make_client(handler, max_attempts=4, backoff_base=0)
+
+    with patch("instantly.client.time.sleep"), pytest.raises(httpx.HTTPStatusError):
+        client.get("/campaigns")
+
+    assert len(calls) == 4
+
+def test_does_not_retry_client_errors():
+    """Test that non-retryable statuses fail immediately."""
+    handler, calls = responses(404)
+    client = make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get("/campaigns/missing")
+
+    assert len(calls) == 1
+
+def test_honors_retry_after_header():
+    """Test that Retry-After overrides the computed backoff."""
+    handler, calls = responses(429, 200, headers={"Retry-After": "7"})
+    client = make_client(handler)
+
+    with patch("instantly.client.time.sleep") as mock_sleep:
+        client.get("/campaigns")
+
+    mock_sleep.assert_called_once_with(7.0)
+
+def test_post_is_retried_only_when_marked_safe():
+    """Test that POSTs are not repeated unless marked retry_safe."""
+    handler, calls = responses(503, 503, 200)
+    client = make_client(handler, backoff_base=0)
+
+    with patch("instantly.client.time.sleep"):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.post("/leads", json={})
+        assert len(calls) == 1
+
+        assert client.post("/leads/list", json={}, retry_safe=True) == {"ok": True}
+    assert len(calls) == 3
+
+def test_connect_errors_are_retried_for_any_method():
+    """Test that requests which never reached the server are retried."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler, backoff_base=0)
+
+    with patch("instantly.client.time.sleep"):
+        client.post("/leads", json={})
+
+    assert len(calls) == 2
+
+def test_total_timeout_stops_retries():
+    """Test that no retry is scheduled past the time budget."""
+    handler, calls = responses(429, 200, headers={"Retry-After": "60"})
+    client = make_client(handler, total_timeout=5)
+
+    with patch("instantly.client.time.sleep") as mock_sleep, pytest.raises(httpx.HTTPStatusError):
+        client.get("/campaigns")
+
+    mock_sleep.assert_not_called()
+
+def test_backoff_uses_full_jitter_with_cap():
+    """Test that backoff stays within the exponential ceiling."""
+    policy = RetryPolicy(backoff_base=1, backoff_max=4)
+    for attempt, ceiling in ((1, 1), (2, 2), (3, 4), (10, 4)):
+        assert all(0 <= policy.backoff(attempt) <= ceiling for _ in range(100))
+
+def test_parse_retry_after():
+    """Test parsing of both Retry-After formats."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+def test_async_client_retries():
+    """Test that the asynchronous client applies the same policy."""
+    handler, calls = responses(504, 200)
+    config = InstantlyConfig(api_key="test-api-key", retry=RetryPolicy(backoff_base=0))
+    client = AsyncInstantlyClient(config)
+    client._client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+
+    async def run():
+        async with client:
+            return await client.get("/campaigns")
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert len(calls) == 2
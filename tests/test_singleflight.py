@@ -0,0 +1,155 @@
+"""
+Tests for coalescing identical concurrent requests
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from instantly import AsyncInstantlyClient
+from instantly.models.campaign import Campaign
+from instantly.singleflight import AsyncSingleFlight, SingleFlight
+
+def test_concurrent_calls_share_one_result():
+    """Test that callers arriving while a call is in flight get its result."""
+    flights = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(10)
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return object()
+
+    def call():
+        barrier.wait()
+        return flights.do("key", fetch)
+
+    with ThreadPoolExecutor(10) as pool:
+        results = list(pool.map(lambda _: call(), range(10)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flights.do("key", object) is not results[0]
+
+def test_concurrent_calls_share_one_error():
+    """Test that an error raised by the shared call reaches every caller."""
+    flights = SingleFlight()
+    barrier = threading.Barrier(5)
+
+    def fetch():
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    def call():
+        barrier.wait()
+        with pytest.raises(ValueError):
+            flights.do("key", fetch)
+
+    with ThreadPoolExecutor(5) as pool:
+        list(pool.map(lambda _: call(), range(5)))
+
+def test_joined_calls_get_their_own_copies():
+    """Test that every caller of a joined call gets a copy, and a lone caller the result itself."""
+    flights = SingleFlight()
+    barrier = threading.Barrier(5)
+    shared = []
+
+    def fetch():
+        time.sleep(0.1)
+        shared.append(["result"])
+        return shared[-1]
+
+    def call():
+        barrier.wait()
+        return flights.do("key", fetch, share=list)
+
+    with ThreadPoolExecutor(5) as pool:
+        results = list(pool.map(lambda _: call(), range(5)))
+
+    assert len(shared) == 1
+    assert all(result == ["result"] and result is not shared[0] for result in results)
+    assert len({id(result) for result in results}) == 5
+    assert flights.do("key", fetch, share=list) is shared[-1]
+
+@pytest.fixture
+def slow_client(transport_client, campaign_data):
+    """Create a client whose server answers after a short delay."""
+    requests = []
+
+    def handler(request):
+        requests.append(str(request.url))
+        time.sleep(0.1)
+        return httpx.Response(200, json=campaign_data)
+
+    client = transport_client(handler)
+    client.requests = requests
+    return client
+
+def test_identical_gets_are_coalesced(slow_client):
+    """Test that threads requesting the same campaign at once send a single request."""
+    barrier = threading.Barrier(20)
+
+    def get():
+        barrier.wait()
+        return slow_client.campaigns.get_campaign("camp_123")
+
+    with ThreadPoolExecutor(20) as pool:
+        campaigns = list(pool.map(lambda _: get(), range(20)))
+
+    assert len(slow_client.requests) == 1
+    assert isinstance(campaigns[0], Campaign)
+    assert len({id(campaign) for campaign in campaigns}) == 20
+    campaigns[0].name = "Renamed"
+    assert all(campaign == campaigns[1] for campaign in campaigns[1:])
+    assert campaigns[1].name != "Renamed"
+
+def test_different_params_are_not_coalesced(slow_client):
+    """Test that GETs with different query parameters are sent separately."""
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(lambda skip: slow_client.get("/leads", {"skip": skip}), range(2)))
+
+    assert len(slow_client.requests) == 2
+
+def test_async_identical_gets_are_coalesced(config, campaign_data):
+    """Test that tasks requesting the same campaign at once send a single request."""
+    client = AsyncInstantlyClient(config)
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=campaign_data)
+
+    client._client = httpx.AsyncClient(base_url=config.base_url, transport=httpx.MockTransport(handler))
+
+    async def run():
+        return await asyncio.gather(*(client.campaigns.get_campaign("camp_123") for _ in range(20)))
+
+    campaigns = asyncio.run(run())
+
+    assert len(requests) == 1
+    assert len({id(campaign) for campaign in campaigns}) == 20
+    campaigns[0].name = "Renamed"
+    assert campaigns[1].name != "Renamed"
+
+def test_async_cancelled_caller_does_not_cancel_the_call():
+    """Test that cancelling one caller leaves the shared call running for the others."""
+    flights = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        first = asyncio.ensure_future(flights.do("key", fetch))
+        second = asyncio.ensure_future(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "done"